@@ -0,0 +1,157 @@
+"""Micro-benchmarks of subliminal internals.
+
+Run with ``python scripts/benchmark.py <benchmark>``, see ``--help`` for the list of benchmarks.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import os
+import struct
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from babelfish import Language  # type: ignore[import-untyped]
+
+from subliminal.core import AsyncProviderPool, scan_paths
+from subliminal.extensions import provider_manager
+from subliminal.hashing import WITH_NUMPY, hash_opensubtitles, sum_uint64_python
+from subliminal.providers.mock import mock_subtitle_provider
+from subliminal.video import Episode
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def timeit(func: Callable[[], object], *, number: int, repeat: int = 5) -> float:
+    """Return the best time per call of `func`, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - start) / number)
+    return min(timings)
+
+
+def report(name: str, seconds: float, reference: float | None = None) -> None:
+    """Print a benchmark result."""
+    speedup = f' (x{reference / seconds:.1f})' if reference is not None and seconds > 0 else ''
+    print(f'{name:<40} {seconds * 1e6:12.1f} us/call{speedup}')
+
+
+def benchmark_pool(args: argparse.Namespace) -> None:
+    """Per-call overhead of :meth:`AsyncProviderPool.list_subtitles`, with mocked providers."""
+    providers = []
+    for i in range(args.providers):
+        entry_point = mock_subtitle_provider(f'Bench{i}', [])
+        if entry_point.split(' = ')[0] not in provider_manager.names():
+            provider_manager.register(entry_point)
+        providers.append(entry_point.split(' = ')[0])
+
+    video = Episode('Show.S01E01.mkv', 'Show', 1, 1)
+    languages = {Language('eng')}
+
+    # a new executor for each call, as before the executor was owned by the pool
+    def list_with_new_executor(pool: AsyncProviderPool) -> None:
+        with ThreadPoolExecutor(pool.max_workers) as executor:
+            list(executor.map(lambda name: pool.list_subtitles_provider(name, video, languages), pool.providers))
+
+    with AsyncProviderPool(providers=providers) as pool:
+        reference = timeit(lambda: list_with_new_executor(pool), number=args.number)
+        report('new executor per call', reference)
+        reused = timeit(lambda: pool.list_subtitles(video, languages), number=args.number)
+        report('persistent executor', reused, reference)
+
+
+def synthetic_filenames(count: int) -> list[str]:
+    """Distinct episode and movie file names, as found in a video library."""
+    series = [
+        'The Big Bang Theory',
+        'Game of Thrones',
+        'Marvels Agents of S.H.I.E.L.D',
+        'Dallas',
+        'Fear the Walking Dead',
+    ]
+    groups = ['LOL', 'KILLERS', 'DIMENSION', 'FLEET', 'AVS']
+    formats = ['720p.HDTV.x264', '1080p.WEB-DL.DD5.1.H.264', 'HDTV.XviD', '2160p.BluRay.x265']
+    combinations = itertools.product(range(1, 100), range(1, 30), series, formats, groups)
+    filenames = []
+    for (season, episode, title, fmt, group), i in zip(combinations, range(count)):
+        if i % 5 == 0:
+            filenames.append(f'{title.replace(" ", ".")}.{1950 + i % 70}.{fmt}-{group}.mkv')
+        else:
+            filenames.append(f'{title.replace(" ", ".")}.S{season:02d}E{episode:02d}.{fmt}-{group}.mkv')
+    return filenames
+
+
+def benchmark_scan(args: argparse.Namespace) -> None:
+    """Throughput of :func:`scan_paths` on a synthetic corpus of file names, with more and more processes."""
+    filenames = synthetic_filenames(args.files)
+    reference = None
+    workers = 1
+    while workers <= args.workers:
+        start = time.perf_counter()
+        videos = [v for _, v in scan_paths(filenames, workers=workers) if v is not None]
+        seconds = time.perf_counter() - start
+        print(f'{workers:3d} workers: {len(videos) / seconds:10.0f} files/s ({seconds:.1f}s)', end='')
+        print(f' x{reference / seconds:.1f}' if reference is not None else '')
+        reference = reference or seconds
+        workers *= 2
+
+
+def hash_opensubtitles_unpack(video_path: str) -> str:
+    """The OpenSubtitles hash, reading and unpacking 8 bytes at a time."""
+    filesize = os.path.getsize(video_path)
+    filehash = filesize
+    with open(video_path, 'rb') as f:
+        for offset in (0, filesize - 65536):
+            f.seek(offset)
+            for _ in range(65536 // 8):
+                (value,) = struct.unpack('<q', f.read(8))
+                filehash = (filehash + value) & 0xFFFFFFFFFFFFFFFF
+    return f'{filehash:016x}'
+
+
+def benchmark_hash(args: argparse.Namespace) -> None:
+    """OpenSubtitles hash of a video, with one read per block and a bulk sum, against 8-byte reads."""
+    with tempfile.NamedTemporaryFile(suffix='.mkv') as f:
+        f.write(os.urandom(args.size))
+        f.flush()
+
+        reference = timeit(lambda: hash_opensubtitles_unpack(f.name), number=args.number // 10 or 1)
+        report('8-byte reads and struct.unpack', reference)
+        data = os.urandom(65536)
+        report('bulk sum of a block (memoryview)', timeit(lambda: sum_uint64_python(data), number=args.number))
+        name = 'numpy' if WITH_NUMPY else 'memoryview'
+        seconds = timeit(lambda: hash_opensubtitles(f.name), number=args.number)
+        report(f'hash_opensubtitles ({name})', seconds, reference)
+
+
+BENCHMARKS: dict[str, Callable[[argparse.Namespace], None]] = {
+    'hash': benchmark_hash,
+    'pool': benchmark_pool,
+    'scan': benchmark_scan,
+}
+
+
+def main() -> None:
+    """Main script."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('benchmark', choices=sorted(BENCHMARKS))
+    parser.add_argument('--number', type=int, default=1000, help='number of calls per timing')
+    parser.add_argument('--providers', type=int, default=8, help='number of mocked providers')
+    parser.add_argument('--files', type=int, default=50_000, help='number of synthetic file names to scan')
+    parser.add_argument('--size', type=int, default=1024 * 1024, help='size of the hashed file, in bytes')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='maximum number of processes')
+
+    args = parser.parse_args()
+
+    BENCHMARKS[args.benchmark](args)
+
+
+if __name__ == '__main__':
+    main()
@@ -19,20 +19,23 @@ __copyright__: str = 'Copyright 2016, Antoine Bertin'
 
 from .cache import region
 from .core import (
+    AsyncioProviderPool,
     AsyncProviderPool,
     ProviderPool,
     check_video,
     download_best_subtitles,
     download_subtitles,
+    iter_subtitles,
     list_subtitles,
     refine,
+    refine_many,
     save_subtitles,
     scan_video,
     scan_videos,
 )
 from .exceptions import Error, ProviderError
 from .extensions import provider_manager, refiner_manager
-from .providers import Provider
+from .providers import AsyncProvider, Provider
 from .score import compute_score, get_scores
 from .subtitle import SUBTITLE_EXTENSIONS, Subtitle
 from .video import VIDEO_EXTENSIONS, Episode, Movie, Video
@@ -43,7 +46,9 @@ logging.getLogger(__name__).addHandler(logging.NullHandler())
 __all__ = [
     'SUBTITLE_EXTENSIONS',
     'VIDEO_EXTENSIONS',
+    'AsyncProvider',
     'AsyncProviderPool',
+    'AsyncioProviderPool',
     'Episode',
     'Error',
     'Movie',
@@ -57,9 +62,11 @@ __all__ = [
     'download_best_subtitles',
     'download_subtitles',
     'get_scores',
+    'iter_subtitles',
     'list_subtitles',
     'provider_manager',
     'refine',
+    'refine_many',
     'refiner_manager',
     'region',
     'save_subtitles',
@@ -9,9 +9,8 @@ import warnings
 from pathlib import Path
 from zipfile import BadZipfile
 
-from guessit import guessit  # type: ignore[import-untyped]
-
 from .exceptions import ArchiveError
+from .guess import guessit
 from .video import VIDEO_EXTENSIONS, Video
 
 logger = logging.getLogger(__name__)
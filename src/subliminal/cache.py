@@ -16,6 +16,15 @@ EPISODE_EXPIRATION_TIME = datetime.timedelta(days=3).total_seconds()
 #: Expiration time for scraper searches
 REFINER_EXPIRATION_TIME = datetime.timedelta(weeks=1).total_seconds()
 
+#: Expiration time for guessit results
+GUESS_EXPIRATION_TIME = datetime.timedelta(weeks=4).total_seconds()
+
+#: Expiration time for video hashes
+HASH_EXPIRATION_TIME = datetime.timedelta(weeks=4).total_seconds()
+
+#: Expiration time for video metadata
+METADATA_EXPIRATION_TIME = datetime.timedelta(weeks=4).total_seconds()
+
 
 def _to_native_str(value: str | bytes) -> str:
     """Convert bytes to str."""
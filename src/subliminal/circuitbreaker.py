@@ -0,0 +1,243 @@
+"""Circuit breaker to stop querying failing providers, and query them again after some time."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+
+#: Circuit breaker states
+class CircuitState(Enum):
+    """Circuit breaker states."""
+
+    #: Requests are allowed, the outcome of the requests is monitored
+    CLOSED = 'closed'
+    #: Requests are rejected, until the recovery timeout is elapsed
+    OPEN = 'open'
+    #: A single trial request is allowed, to decide on closing or opening the circuit again
+    HALF_OPEN = 'half-open'
+
+
+class CircuitBreaker:
+    """Monitor the requests to a service and reject them while the service is failing.
+
+    The circuit starts closed. The outcome of the last `window` requests is recorded, a request fails if it
+    raised an error or if it took more than `latency_threshold` seconds. When the rate of failed requests
+    reaches `error_rate_threshold`, with at least `min_requests` recorded requests, the circuit opens:
+    the requests are rejected for `recovery_timeout` seconds. Then the circuit is half-open: a single trial
+    request is allowed, closing the circuit on success and opening it again on failure.
+
+    The circuit can also be opened directly with :meth:`trip`, for errors that are known to be persistent.
+
+    :param int window: number of the last requests used to compute the error rate.
+    :param int min_requests: minimum number of recorded requests to open the circuit on the error rate.
+    :param float error_rate_threshold: rate of failed requests opening the circuit, between 0 and 1.
+    :param (float | None) latency_threshold: duration in seconds above which a request is failed,
+        the latency is not monitored if None.
+    :param (float | None) recovery_timeout: duration in seconds before a trial request is allowed
+        on an open circuit, the circuit is never closed again if None.
+    :param str name: name of the monitored service, for logging.
+    :param clock: function returning the current time in seconds.
+
+    """
+
+    #: Name of the monitored service
+    name: str
+
+    #: Number of the last requests used to compute the error rate
+    window: int
+
+    #: Minimum number of recorded requests to open the circuit on the error rate
+    min_requests: int
+
+    #: Rate of failed requests opening the circuit
+    error_rate_threshold: float
+
+    #: Duration in seconds above which a request is failed
+    latency_threshold: float | None
+
+    #: Duration in seconds before a trial request is allowed on an open circuit
+    recovery_timeout: float | None
+
+    #: Number of successful requests
+    successes: int
+
+    #: Number of failed requests, including slow requests
+    failures: int
+
+    #: Number of slow requests
+    slow_requests: int
+
+    #: Number of rejected requests
+    rejected: int
+
+    #: Number of times the circuit was opened
+    times_opened: int
+
+    def __init__(
+        self,
+        window: int = 20,
+        min_requests: int = 5,
+        error_rate_threshold: float = 0.5,
+        latency_threshold: float | None = None,
+        recovery_timeout: float | None = 300,
+        *,
+        name: str = '',
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0 < error_rate_threshold <= 1:
+            msg = f'error_rate_threshold must be between 0 and 1, got {error_rate_threshold!r}'
+            raise ValueError(msg)
+
+        self.name = name
+        self.window = max(window, 1)
+        self.min_requests = min(max(min_requests, 1), self.window)
+        self.error_rate_threshold = error_rate_threshold
+        self.latency_threshold = latency_threshold
+        self.recovery_timeout = recovery_timeout
+        self.successes = 0
+        self.failures = 0
+        self.slow_requests = 0
+        self.rejected = 0
+        self.times_opened = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._outcomes: deque[bool] = deque(maxlen=self.window)
+        self._opened_at = 0.0
+        self._trial_in_progress = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state of the circuit, an open circuit becomes half-open after the recovery timeout."""
+        with self._lock:
+            self._update_state()
+            return self._state
+
+    @property
+    def error_rate(self) -> float:
+        """Rate of failed requests among the last recorded requests."""
+        with self._lock:
+            if not self._outcomes:
+                return 0.0
+            return self._outcomes.count(False) / len(self._outcomes)
+
+    def _update_state(self) -> None:
+        """Switch an open circuit to half-open after the recovery timeout, with the lock held."""
+        if (
+            self._state is CircuitState.OPEN
+            and self.recovery_timeout is not None
+            and self._clock() - self._opened_at >= self.recovery_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._trial_in_progress = False
+            logger.debug('Circuit of %s is half-open', self.name)
+
+    def _open(self) -> None:
+        """Open the circuit, with the lock held."""
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._trial_in_progress = False
+        self._outcomes.clear()
+        self.times_opened += 1
+        logger.info('Circuit of %s is open, for %s seconds', self.name, self.recovery_timeout)
+
+    def allow_request(self) -> bool:
+        """Check if a request can be sent, it must then be recorded with :meth:`record`.
+
+        :return: `True` if the request can be sent, `False` if it is rejected.
+        :rtype: bool
+
+        """
+        with self._lock:
+            self._update_state()
+            if self._state is CircuitState.CLOSED:
+                return True
+            if self._state is CircuitState.HALF_OPEN and not self._trial_in_progress:
+                self._trial_in_progress = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record(self, *, success: bool, latency: float | None = None) -> None:
+        """Record the outcome of a request.
+
+        :param bool success: whether the request succeeded.
+        :param (float | None) latency: duration of the request in seconds, if known.
+
+        """
+        with self._lock:
+            slow = latency is not None and self.latency_threshold is not None and latency > self.latency_threshold
+            if slow:
+                self.slow_requests += 1
+            success = success and not slow
+            if success:
+                self.successes += 1
+            else:
+                self.failures += 1
+
+            if self._state is CircuitState.HALF_OPEN:
+                if success:
+                    self._state = CircuitState.CLOSED
+                    self._trial_in_progress = False
+                    self._outcomes.clear()
+                    logger.info('Circuit of %s is closed', self.name)
+                else:
+                    self._open()
+                return
+
+            self._outcomes.append(success)
+            if (
+                self._state is CircuitState.CLOSED
+                and len(self._outcomes) >= self.min_requests
+                and self._outcomes.count(False) / len(self._outcomes) >= self.error_rate_threshold
+            ):
+                self._open()
+
+    def cancel_request(self) -> None:
+        """Forget a request allowed by :meth:`allow_request` that was cancelled before completion."""
+        with self._lock:
+            self._trial_in_progress = False
+
+    def trip(self) -> None:
+        """Open the circuit, rejecting the requests until the recovery timeout."""
+        with self._lock:
+            self.failures += 1
+            self._open()
+
+    def reset(self) -> None:
+        """Close the circuit and forget the recorded requests."""
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._trial_in_progress = False
+            self._outcomes.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Statistics of the circuit breaker, for reporting."""
+        return {
+            'state': self.state.value,
+            'successes': self.successes,
+            'failures': self.failures,
+            'slow_requests': self.slow_requests,
+            'rejected': self.rejected,
+            'times_opened': self.times_opened,
+        }
+
+    def summary(self) -> str:
+        """Short description of the state and statistics, for reporting."""
+        return (
+            f'circuit {self.state.value}, {self.successes} successful, {self.failures} failed '
+            f'({self.slow_requests} slow) and {self.rejected} rejected requests, opened {self.times_opened} times'
+        )
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} {self.name!r} [{self.state.value}]>'
@@ -34,24 +34,34 @@ from subliminal import (
     compute_score,
     get_scores,
     provider_manager,
-    refine,
+    refine_many,
     refiner_manager,
     region,
     save_subtitles,
 )
 from subliminal.core import (
     ARCHIVE_EXTENSIONS,
+    SubtitleListing,
     collect_video_filepaths,
     scan_path,
+    scan_paths,
     search_external_subtitles,
 )
 from subliminal.exceptions import GuessingError
 from subliminal.extensions import get_default_providers, get_default_refiners
+from subliminal.guess import guess_cache
+from subliminal.index import LibraryIndex
+from subliminal.ratelimit import RATE_LIMIT_OPTIONS, RATE_LIMIT_OPTIONS_DOC
+from subliminal.refiners.hash import hash_videos
 from subliminal.utils import get_parameters_from_signature, merge_extend_and_ignore_unions
+from subliminal.watch import VideoWatcher
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Iterable, Iterator, Sequence, Set
 
+    from subliminal.core import ProviderPool
+    from subliminal.index import IndexEntry
+    from subliminal.subtitle import Subtitle
     from subliminal.utils import Parameter
 
 
@@ -156,11 +166,14 @@ def read_configuration(filename: str | os.PathLike) -> dict[str, dict[str, Any]]
 
     # make download options
     download_dict = toml_dict.setdefault('download', {})
+    # make watch options, the download options are shared
+    watch_dict = {**download_dict, **toml_dict.setdefault('watch', {})}
     # handle language types
-    for lt in ('hearing_impaired', 'foreign_only'):
-        # if an option was defined in the config file, make it a tuple, the expected type
-        if lt in download_dict and (isinstance(download_dict[lt], bool) or download_dict[lt] is None):
-            download_dict[lt] = (download_dict[lt],)
+    for command_dict in (download_dict, watch_dict):
+        for lt in ('hearing_impaired', 'foreign_only'):
+            # if an option was defined in the config file, make it a tuple, the expected type
+            if lt in command_dict and (isinstance(command_dict[lt], bool) or command_dict[lt] is None):
+                command_dict[lt] = (command_dict[lt],)
 
     # remove the provider and refiner lists to select, extend and ignore
     provider_lists = {
@@ -174,6 +187,9 @@ def read_configuration(filename: str | os.PathLike) -> dict[str, dict[str, Any]]
         'ignore': download_dict.pop('ignore_refiner', []),
     }
     options['download'] = download_dict
+    for key in ('provider', 'extend_provider', 'ignore_provider', 'refiner', 'extend_refiner', 'ignore_refiner'):
+        watch_dict.pop(key, None)
+    options['watch'] = watch_dict
 
     # make provider and refiner options
     for ext in ('provider', 'refiner'):
@@ -255,6 +271,176 @@ def scan_video_path(
     return video
 
 
+def select_extensions(
+    obj: dict[str, Any],
+    provider: Sequence[str],
+    extend_provider: Sequence[str],
+    ignore_provider: Sequence[str],
+    refiner: Sequence[str],
+    extend_refiner: Sequence[str],
+    ignore_refiner: Sequence[str],
+) -> tuple[list[str], list[str]]:
+    """Select the providers and the refiners to use, from the command line options and the configuration."""
+    use_providers = merge_extend_and_ignore_unions(
+        {
+            'select': provider,
+            'extend': extend_provider,
+            'ignore': ignore_provider,
+        },
+        obj['provider_lists'],
+        get_default_providers(),
+    )
+    logger.info('Use providers: %s', use_providers)
+    use_refiners = merge_extend_and_ignore_unions(
+        {
+            'select': refiner,
+            'extend': extend_refiner,
+            'ignore': ignore_refiner,
+        },
+        obj['refiner_lists'],
+        get_default_refiners(),
+    )
+    logger.info('Use refiners: %s', use_refiners)
+    return use_providers, use_refiners
+
+
+def check_videos(
+    videos: Iterable[Video],
+    *,
+    languages: Set[Language],
+    age: timedelta | None = None,
+    single: bool = False,
+    directory: str | None = None,
+    external_subtitles: bool = True,
+    subtitle_listing: SubtitleListing | None = None,
+) -> tuple[list[Video], list[Video]]:
+    """Search the external subtitles of the videos and check which videos need subtitles.
+
+    :return: the checked videos and the ignored videos.
+    """
+    checked_videos: list[Video] = []
+    ignored_videos: list[Video] = []
+    for video in videos:
+        if external_subtitles:
+            found = search_external_subtitles(video.name, directory=directory, subtitle_listing=subtitle_listing)
+            video.subtitles.extend(found.values())
+        if check_video(video, languages=languages, age=age, undefined=single):
+            checked_videos.append(video)
+        else:
+            ignored_videos.append(video)
+    return checked_videos, ignored_videos
+
+
+def refine_collected_videos(
+    videos: Sequence[Video],
+    *,
+    obj: dict[str, Any],
+    refiners: Sequence[str],
+    providers: Sequence[str],
+    languages: Set[Language],
+    hash_cache: bool,
+    hash_jobs: int,
+    refine_jobs: int,
+    refine_videos: int,
+    embedded_subtitles: bool = True,
+) -> None:
+    """Refine the videos, hashing them together before the other refiners and looking up each series once."""
+    video_refiners = refiners
+    # hash the videos together, reading the files concurrently, before the other refiners
+    if 'hash' in refiners and videos:
+        hash_videos(
+            videos,
+            workers=hash_jobs,
+            **dict(
+                obj['refiner_configs'].get('hash', {}),
+                providers=providers,
+                languages=languages,
+                hash_cache=hash_cache,
+            ),
+        )
+        video_refiners = [r for r in refiners if r != 'hash']
+
+    # refine videos, looking up each series once
+    refine_many(
+        videos,
+        max_videos=refine_videos,
+        refiners=video_refiners,
+        refiner_configs=obj['refiner_configs'],
+        max_workers=refine_jobs,
+        embedded_subtitles=embedded_subtitles,
+        providers=providers,
+        languages=languages,
+        hash_cache=hash_cache,
+    )
+
+
+def iter_download_videos(
+    pp: ProviderPool,
+    videos: Iterable[Video],
+    languages: Set[Language],
+    *,
+    min_score: int,
+    **kwargs: Any,
+) -> Iterator[tuple[Video, list[Subtitle]]]:
+    """Download the best subtitles of the videos, with a `min_score` in percent of the score of a hash match.
+
+    The minimum score depends on the video type, so the videos are downloaded by type.
+    """
+    videos_by_type: dict[type[Video], list[Video]] = defaultdict(list)
+    for v in videos:
+        videos_by_type[type(v)].append(v)
+    for typed_videos in videos_by_type.values():
+        yield from pp.iter_download_best_subtitles(
+            typed_videos,
+            languages,
+            min_score=get_scores(typed_videos[0])['hash'] * min_score // 100,
+            **kwargs,
+        )
+
+
+def download_parameters(
+    *,
+    single: bool,
+    directory: str | None,
+    encoding: str | None,
+    subtitle_format: str | None,
+    language_type_suffix: bool,
+    language_format: str,
+    hearing_impaired: tuple[bool | None, ...],
+    foreign_only: tuple[bool | None, ...],
+    skip_wrong_fps: bool,
+    stop_on_hash_match: bool,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Keyword arguments of :func:`iter_download_videos` and :func:`~subliminal.core.save_subtitles`.
+
+    They are taken from the options shared by the commands downloading subtitles.
+    """
+    # no encoding specified, default to None. Also convert to None --encoding=''
+    if not encoding or encoding in ['""', "''"]:
+        encoding = None
+    # no subtitle_format specified, default to None Also convert to None --subtitle_format=''
+    if not subtitle_format or subtitle_format in ['""', "''"]:
+        subtitle_format = None
+
+    # language_type, the last flag wins
+    download_kwargs = {
+        'hearing_impaired': hearing_impaired[-1] if hearing_impaired else None,
+        'foreign_only': foreign_only[-1] if foreign_only else None,
+        'skip_wrong_fps': skip_wrong_fps,
+        'only_one': single,
+        'stop_on_hash_match': stop_on_hash_match,
+    }
+    save_kwargs = {
+        'single': single,
+        'directory': directory,
+        'encoding': encoding,
+        'subtitle_format': subtitle_format,
+        'language_type_suffix': language_type_suffix,
+        'language_format': language_format,
+    }
+    return download_kwargs, save_kwargs
+
+
 AGE = AgeParamType()
 
 PROVIDER = click.Choice(['ALL', *sorted(provider_manager.names())])
@@ -263,6 +449,7 @@ REFINER = click.Choice(['ALL', *sorted(refiner_manager.names())])
 
 dirs = PlatformDirs('subliminal')
 cache_file = 'subliminal.dbm'
+index_file = 'subliminal-index.db'
 default_config_path = dirs.user_config_path / 'subliminal.toml'
 
 providers_config = OptionGroup('Providers configuration')
@@ -305,16 +492,32 @@ def options_from_managers(
     return decorator
 
 
+def get_rate_limit_parameters(name: str) -> list[Parameter]:
+    """Get the rate limit options of a provider, with the defaults of the provider class."""
+    plugin = provider_manager[name].plugin
+    defaults = {
+        # a float default, so click accepts decimal rates
+        'rate_limit': float(plugin.rate_limit) if plugin.rate_limit is not None else None,
+        'rate_burst': None,
+        'max_concurrency': plugin.max_concurrency,
+    }
+    return [
+        {'name': key, 'default': defaults[key], 'annotation': None, 'desc': RATE_LIMIT_OPTIONS_DOC[key]}
+        for key in RATE_LIMIT_OPTIONS
+    ]
+
+
 # Options from providers
 provider_options = {
-    name: get_parameters_from_signature(provider_manager[name].plugin) for name in provider_manager.names()
+    name: [*get_parameters_from_signature(provider_manager[name].plugin), *get_rate_limit_parameters(name)]
+    for name in provider_manager.names()
 }
 
 refiner_options = {
     name: [
         opt
         for opt in get_parameters_from_signature(refiner_manager[name].plugin)
-        if opt['name'] not in ('video', 'kwargs', 'embedded_subtitles', 'providers', 'languages')
+        if opt['name'] not in ('video', 'kwargs', 'embedded_subtitles', 'providers', 'languages', 'hash_cache')
     ]
     for name in refiner_manager.names()
 }
@@ -389,6 +592,12 @@ options_from_refiners = options_from_managers('refiner', refiner_options, group=
     default='DEBUG',
     help='The logging level used for the log file.',
 )
+@click.option(
+    '--persistent-guess-cache/--no-persistent-guess-cache',
+    default=False,
+    show_default=True,
+    help='Also store the guessit results in the cache directory, to reuse them in the next runs.',
+)
 @click.version_option(__version__)
 @click.pass_context
 def subliminal(
@@ -398,6 +607,7 @@ def subliminal(
     debug: bool,
     logfile: os.PathLike[str] | None,
     logfile_level: str,
+    persistent_guess_cache: bool,
     addic7ed: tuple[str, str],
     opensubtitles: tuple[str, str],
     opensubtitlescom: tuple[str, str],
@@ -419,6 +629,7 @@ def subliminal(
         expiration_time=timedelta(days=30),
         arguments={'filename': os.fspath(cache_dir_path / cache_file), 'lock_factory': MutexLock},
     )
+    guess_cache.persistent = persistent_guess_cache
 
     # Set the logger level to DEBUG in case debug or logfile is defined
     subliminal_logger = logging.getLogger('subliminal')
@@ -456,6 +667,7 @@ def subliminal(
         logger.info(msg)
 
     ctx.obj['debug'] = debug
+    ctx.obj['cache_dir'] = cache_dir_path
 
     # create provider and refiner configs
     provider_configs: dict[str, dict[str, Any]] = {}
@@ -518,64 +730,309 @@ def cache(ctx: click.Context, clear_subliminal: bool) -> None:
     '-l',
     '--language',
     type=LANGUAGE,
-    required=True,
     multiple=True,
-    help='Language as IETF code, e.g. en, pt-BR (can be used multiple times).',
+    help=(
+        'List the indexed videos lacking subtitles in this language, as IETF code, e.g. en, pt-BR '
+        '(can be used multiple times).'
+    ),
 )
-@click.option(
-    '-p',
-    '--provider',
-    type=PROVIDER,
-    multiple=True,
-    help='Provider to use (can be used multiple times).',
+@click.option('--prune', is_flag=True, help='Remove the videos that do not exist anymore from the index.')
+@click.option('--clear', is_flag=True, help='Remove all the videos from the index.')
+@click.argument('directory', type=click.Path(file_okay=False), required=False)
+@click.pass_obj
+def index(
+    obj: dict[str, Any],
+    language: Sequence[Language],
+    prune: bool,
+    clear: bool,
+    directory: str | None,
+) -> None:
+    """Library index management, without accessing the videos.
+
+    The index is filled by the download command with the `--index` option. If DIRECTORY is given, only the videos in
+    this directory are listed.
+
+    """
+    with LibraryIndex(obj['cache_dir'] / index_file) as library_index:
+        if clear:
+            library_index.clear()
+            click.echo('Library index cleared.')
+            return
+        if prune:
+            removed = library_index.prune()
+            click.echo(f'{plural(removed, "video")} removed from the library index.')
+        if language:
+            missing = library_index.missing_languages(language, prefix=directory)
+            for video_path, missing_languages in sorted(missing.items()):
+                click.echo(f'{video_path}: {", ".join(sorted(str(lang) for lang in missing_languages))}')
+        elif not prune:
+            click.echo(f'{plural(len(library_index), "video")} in the library index.')
+
+
+def apply_options(*options: Callable[[Callable], Callable]) -> Callable[[Callable], Callable]:
+    """Group click options in a single decorator, to share them between commands."""
+
+    def decorator(f: Callable) -> Callable:
+        for option in reversed(options):
+            f = option(f)
+        return f
+
+    return decorator
+
+
+#: Options selecting the languages, the providers and the refiners
+selection_options = apply_options(
+    click.option(
+        '-l',
+        '--language',
+        type=LANGUAGE,
+        required=True,
+        multiple=True,
+        help='Language as IETF code, e.g. en, pt-BR (can be used multiple times).',
+    ),
+    click.option(
+        '-p',
+        '--provider',
+        type=PROVIDER,
+        multiple=True,
+        help='Provider to use (can be used multiple times).',
+    ),
+    click.option(
+        '-pp',
+        '--extend-provider',
+        type=PROVIDER,
+        multiple=True,
+        help=(
+            'Provider to use, on top of the default list (can be used multiple times). '
+            'Supersedes the providers used or ignored in the configuration file.'
+        ),
+    ),
+    click.option(
+        '-P',
+        '--ignore-provider',
+        type=PROVIDER,
+        multiple=True,
+        help=(
+            'Provider to ignore (can be used multiple times). '
+            'Supersedes the providers used or ignored in the configuration file.'
+        ),
+    ),
+    click.option(
+        '-r',
+        '--refiner',
+        type=REFINER,
+        multiple=True,
+        help='Refiner to use (can be used multiple times).',
+    ),
+    click.option(
+        '-rr',
+        '--extend-refiner',
+        type=REFINER,
+        multiple=True,
+        help=(
+            'Refiner to use, on top of the default list (can be used multiple times). '
+            'Supersedes the refiners used or ignored in the configuration file.'
+        ),
+    ),
+    click.option(
+        '-R',
+        '--ignore-refiner',
+        type=REFINER,
+        multiple=True,
+        help=(
+            'Refiner to ignore (can be used multiple times). '
+            'Supersedes the refiners used or ignored in the configuration file.'
+        ),
+    ),
 )
-@click.option(
-    '-pp',
-    '--extend-provider',
-    type=PROVIDER,
-    multiple=True,
-    help=(
-        'Provider to use, on top of the default list (can be used multiple times). '
-        'Supersedes the providers used or ignored in the configuration file.'
+
+
+#: Options of the saved subtitle files
+output_options = apply_options(
+    click.option(
+        '-d',
+        '--directory',
+        type=click.STRING,
+        metavar='DIR',
+        help='Directory where to save subtitles, default is next to the video file.',
+    ),
+    click.option(
+        '-e',
+        '--encoding',
+        type=click.STRING,
+        metavar='ENC',
+        default='utf-8',
+        help=(
+            'Force subtitle file encoding, set to an empty string to preserve the original encoding. Default is utf-8.'
+        ),
+    ),
+    click.option(
+        '-F',
+        '--subtitle-format',
+        type=click.STRING,
+        metavar='FORMAT',
+        default='',
+        help="Force subtitle format, set to an empty string to preserve the original format. Default is ''.",
     ),
 )
-@click.option(
-    '-P',
-    '--ignore-provider',
-    type=PROVIDER,
-    multiple=True,
-    help=(
-        'Provider to ignore (can be used multiple times). '
-        'Supersedes the providers used or ignored in the configuration file.'
+
+
+#: Options choosing the best subtitles
+best_subtitle_options = apply_options(
+    click.option(
+        '-W',
+        '--skip-wrong-fps',
+        is_flag=True,
+        default=False,
+        help='Skip subtitles with an FPS that do not match the video (if it can be detected).',
+    ),
+    click.option(
+        '--stop-on-hash-match',
+        is_flag=True,
+        default=False,
+        help=(
+            'Stop querying the providers for a video once a subtitle matching the video hash is found '
+            'for every language. Faster, but a subtitle of another provider could have been selected '
+            'if the hash-matched subtitle fails.'
+        ),
+    ),
+    click.option(
+        '-fo',
+        '--foreign-only',
+        'foreign_only',
+        is_flag=True,
+        flag_value=True,
+        multiple=True,
+        help='Prefer foreign-only subtitles.',
+    ),
+    click.option(
+        '-FO',
+        '--no-foreign-only',
+        'foreign_only',
+        is_flag=True,
+        flag_value=False,
+        multiple=True,
+        help='Disfavor foreign-only subtitles.',
+    ),
+    click.option(
+        '-hi',
+        '--hearing-impaired',
+        'hearing_impaired',
+        is_flag=True,
+        flag_value=True,
+        multiple=True,
+        help='Prefer hearing-impaired subtitles.',
+    ),
+    click.option(
+        '-HI',
+        '--no-hearing-impaired',
+        'hearing_impaired',
+        is_flag=True,
+        flag_value=False,
+        multiple=True,
+        help='Disfavor hearing-impaired subtitles.',
+    ),
+    click.option(
+        '-m',
+        '--min-score',
+        type=click.IntRange(0, 100),
+        default=0,
+        help='Minimum score for a subtitle to be downloaded (0 to 100).',
     ),
 )
-@click.option(
-    '-r',
-    '--refiner',
-    type=REFINER,
-    multiple=True,
-    help='Refiner to use (can be used multiple times).',
+
+
+#: Options of the names of the saved subtitle files
+naming_options = apply_options(
+    click.option(
+        '--language-type-suffix/--no-language-type-suffix',
+        is_flag=True,
+        default=False,
+        help='Add a suffix to the saved subtitle name to indicate a hearing impaired or foreign only subtitle.',
+    ),
+    click.option(
+        '--language-format',
+        default='alpha2',
+        help='Format of the language code in the saved subtitle name. Default is a 2-letter language code.',
+    ),
 )
-@click.option(
-    '-rr',
-    '--extend-refiner',
-    type=REFINER,
-    multiple=True,
-    help=(
-        'Refiner to use, on top of the default list (can be used multiple times). '
-        'Supersedes the refiners used or ignored in the configuration file.'
+
+
+#: Options of the provider pool
+pool_options = apply_options(
+    click.option(
+        '-w',
+        '--max-workers',
+        type=click.IntRange(1, 50),
+        default=None,
+        help='Maximum number of threads to use.',
+    ),
+    click.option(
+        '--deadline',
+        type=click.FloatRange(min=0, min_open=True),
+        default=None,
+        help=(
+            'Maximum duration in seconds to list the subtitles of a video. '
+            'The providers that did not answer in time are ignored.'
+        ),
+    ),
+    click.option(
+        '--max-videos',
+        type=click.IntRange(1, 50),
+        default=1,
+        show_default=True,
+        help='Maximum number of videos processed at the same time when downloading subtitles.',
     ),
 )
-@click.option(
-    '-R',
-    '--ignore-refiner',
-    type=REFINER,
-    multiple=True,
+
+
+#: Options of the hashing and the refining of the videos
+refine_options = apply_options(
+    click.option(
+        '--hash-cache/--no-hash-cache',
+        default=True,
+        show_default=True,
+        help='Use the video hashes stored in the cache, they are computed again when the video file changes.',
+    ),
+    click.option(
+        '--hash-jobs',
+        type=click.IntRange(1, 64),
+        default=4,
+        show_default=True,
+        help='Number of video files read at the same time to compute the hashes, use more for remote files.',
+    ),
+    click.option(
+        '--refine-jobs',
+        type=click.IntRange(1, 16),
+        default=4,
+        show_default=True,
+        help='Number of independent refiners running at the same time for a video.',
+    ),
+    click.option(
+        '--refine-videos',
+        type=click.IntRange(1, 32),
+        default=4,
+        show_default=True,
+        help='Number of videos refined at the same time, the series are looked up once for all their episodes.',
+    ),
+)
+
+
+#: Option saving the subtitles without language code
+single_option = click.option(
+    '-s',
+    '--single',
+    is_flag=True,
+    default=False,
     help=(
-        'Refiner to ignore (can be used multiple times). '
-        'Supersedes the refiners used or ignored in the configuration file.'
+        'Save subtitle without language code in the file name, i.e. use .srt extension. '
+        'Do not use this unless your media player requires it.'
     ),
 )
+
+
+@subliminal.command()
+@selection_options
 @click.option(
     '-I',
     '--ignore-subtitles',
@@ -598,39 +1055,8 @@ def cache(ctx: click.Context, clear_subliminal: bool) -> None:
         'Otherwise, just use the modification date.'
     ),
 )
-@click.option(
-    '-d',
-    '--directory',
-    type=click.STRING,
-    metavar='DIR',
-    help='Directory where to save subtitles, default is next to the video file.',
-)
-@click.option(
-    '-e',
-    '--encoding',
-    type=click.STRING,
-    metavar='ENC',
-    default='utf-8',
-    help='Force subtitle file encoding, set to an empty string to preserve the original encoding. Default is utf-8.',
-)
-@click.option(
-    '-F',
-    '--subtitle-format',
-    type=click.STRING,
-    metavar='FORMAT',
-    default='',
-    help="Force subtitle format, set to an empty string to preserve the original format. Default is ''.",
-)
-@click.option(
-    '-s',
-    '--single',
-    is_flag=True,
-    default=False,
-    help=(
-        'Save subtitle without language code in the file name, i.e. use .srt extension. '
-        'Do not use this unless your media player requires it.'
-    ),
-)
+@output_options
+@single_option
 @click.option(
     '--force-external-subtitles',
     is_flag=True,
@@ -653,74 +1079,9 @@ def cache(ctx: click.Context, clear_subliminal: bool) -> None:
         'Supersedes `--force-external-subtitles` and `--force-embedded-subtitles`.'
     ),
 )
-@click.option(
-    '-W',
-    '--skip-wrong-fps',
-    is_flag=True,
-    default=False,
-    help='Skip subtitles with an FPS that do not match the video (if it can be detected).',
-)
-@click.option(
-    '-fo',
-    '--foreign-only',
-    'foreign_only',
-    is_flag=True,
-    flag_value=True,
-    multiple=True,
-    help='Prefer foreign-only subtitles.',
-)
-@click.option(
-    '-FO',
-    '--no-foreign-only',
-    'foreign_only',
-    is_flag=True,
-    flag_value=False,
-    multiple=True,
-    help='Disfavor foreign-only subtitles.',
-)
-@click.option(
-    '-hi',
-    '--hearing-impaired',
-    'hearing_impaired',
-    is_flag=True,
-    flag_value=True,
-    multiple=True,
-    help='Prefer hearing-impaired subtitles.',
-)
-@click.option(
-    '-HI',
-    '--no-hearing-impaired',
-    'hearing_impaired',
-    is_flag=True,
-    flag_value=False,
-    multiple=True,
-    help='Disfavor hearing-impaired subtitles.',
-)
-@click.option(
-    '-m',
-    '--min-score',
-    type=click.IntRange(0, 100),
-    default=0,
-    help='Minimum score for a subtitle to be downloaded (0 to 100).',
-)
-@click.option(
-    '--language-type-suffix/--no-language-type-suffix',
-    is_flag=True,
-    default=False,
-    help='Add a suffix to the saved subtitle name to indicate a hearing impaired or foreign only subtitle.',
-)
-@click.option(
-    '--language-format',
-    default='alpha2',
-    help='Format of the language code in the saved subtitle name. Default is a 2-letter language code.',
-)
-@click.option(
-    '-w',
-    '--max-workers',
-    type=click.IntRange(1, 50),
-    default=None,
-    help='Maximum number of threads to use.',
-)
+@best_subtitle_options
+@naming_options
+@pool_options
 @click.option(
     '-z/-Z',
     '--archives/--no-archives',
@@ -750,6 +1111,24 @@ def cache(ctx: click.Context, clear_subliminal: bool) -> None:
         'If used with multiple paths or a directory, `name` is passed to ALL the files.'
     ),
 )
+@click.option(
+    '-j',
+    '--scan-jobs',
+    type=click.IntRange(1, 64),
+    default=1,
+    show_default=True,
+    help='Number of processes guessing the video names, use more to scan large libraries faster.',
+)
+@click.option(
+    '--index/--no-index',
+    default=False,
+    show_default=True,
+    help=(
+        'Use the library index in the cache directory, to skip scanning and refining the videos '
+        'that did not change since the previous run.'
+    ),
+)
+@refine_options
 @click.option('-v', '--verbose', count=True, help='Increase verbosity.')
 @click.argument('path', type=click.Path(), required=True, nargs=-1)
 @click.pass_obj
@@ -773,15 +1152,24 @@ def download(
     force_embedded_subtitles: bool,
     force: bool,
     skip_wrong_fps: bool,
+    stop_on_hash_match: bool,
     hearing_impaired: tuple[bool | None, ...],
     foreign_only: tuple[bool | None, ...],
     min_score: int,
     language_type_suffix: bool,
     language_format: str,
     max_workers: int,
+    deadline: float | None,
+    max_videos: int,
     archives: bool,
     use_absolute_path: str,
     name: str | None,
+    scan_jobs: int,
+    index: bool,
+    hash_cache: bool,
+    hash_jobs: int,
+    refine_jobs: int,
+    refine_videos: int,
     verbose: int,
     path: list[str],
 ) -> None:
@@ -795,21 +1183,18 @@ def download(
     """
     # process parameters
     language_set = set(language)
-
-    # no encoding specified, default to None. Also convert to None --encoding=''
-    if not encoding or encoding in ['""', "''"]:
-        encoding = None
-    # no subtitle_format specified, default to None Also convert to None --subtitle_format=''
-    if not subtitle_format or subtitle_format in ['""', "''"]:
-        subtitle_format = None
-
-    # language_type
-    hearing_impaired_flag: bool | None = None
-    if len(hearing_impaired) > 0:
-        hearing_impaired_flag = hearing_impaired[-1]
-    foreign_only_flag: bool | None = None
-    if len(foreign_only) > 0:
-        foreign_only_flag = foreign_only[-1]
+    download_kwargs, save_kwargs = download_parameters(
+        single=single,
+        directory=directory,
+        encoding=encoding,
+        subtitle_format=subtitle_format,
+        language_type_suffix=language_type_suffix,
+        language_format=language_format,
+        hearing_impaired=hearing_impaired,
+        foreign_only=foreign_only,
+        skip_wrong_fps=skip_wrong_fps,
+        stop_on_hash_match=stop_on_hash_match,
+    )
 
     logger.info('Download with subliminal version %s', __version__)
     # Make sure verbose is maximal if debug is specified to show ALL the messages
@@ -817,31 +1202,31 @@ def download(
     if debug:
         verbose = 3
 
-    # parse list of refiners
-    use_providers = merge_extend_and_ignore_unions(
-        {
-            'select': provider,
-            'extend': extend_provider,
-            'ignore': ignore_provider,
-        },
-        obj['provider_lists'],
-        get_default_providers(),
+    # parse list of providers and refiners
+    use_providers, use_refiners = select_extensions(
+        obj,
+        provider,
+        extend_provider,
+        ignore_provider,
+        refiner,
+        extend_refiner,
+        ignore_refiner,
     )
-    logger.info('Use providers: %s', use_providers)
-    use_refiners = merge_extend_and_ignore_unions(
-        {
-            'select': refiner,
-            'extend': extend_refiner,
-            'ignore': ignore_refiner,
-        },
-        obj['refiner_lists'],
-        get_default_refiners(),
-    )
-    logger.info('Use refiners: %s', use_refiners)
 
     # Convert to absolute path only with 'always'
     absolute_path = use_absolute_path == 'always'
 
+    # open the library index, the name replaces the path for guessing so it cannot be used
+    library_index = None
+    if index and name is None:
+        library_index = LibraryIndex(obj['cache_dir'] / index_file)
+        click.get_current_context().call_on_close(library_index.close)
+    # the embedded subtitles are searched when refining
+    embedded_subtitles = not force and not force_embedded_subtitles
+
+    # list each directory once to search the external subtitles
+    subtitle_listing = SubtitleListing()
+
     # scan videos
     videos = []
     ignored_videos = []
@@ -856,11 +1241,17 @@ def download(
             logger.debug('Collecting path %s', p)
 
             # collect files from directory
-            collected_filepaths = [p]
+            collected_filepaths: Iterable[str] = [p]
             if os.path.isdir(p):
                 # collect video files
                 try:
-                    collected_filepaths = collect_video_filepaths(p, age=age, archives=archives, use_ctime=use_ctime)
+                    collected_filepaths = collect_video_filepaths(
+                        p,
+                        age=age,
+                        archives=archives,
+                        use_ctime=use_ctime,
+                        subtitle_listing=subtitle_listing,
+                    )
                 except ValueError:  # pragma: no cover
                     logger.exception('Unexpected error while collecting directory path %s', p)
                     errored_paths.append(p)
@@ -868,9 +1259,48 @@ def download(
 
             # scan videos
             video_candidates: list[Video] = []
+            refined_videos: set[Video] = set()
+            indexed_videos: set[Video] = set()
+            entries: dict[str, IndexEntry | None] = {}
             for filepath in collected_filepaths:
-                # Try scanning the video at path
-                video = scan_video_path(filepath, absolute_path=absolute_path, name=name, verbose=verbose, debug=debug)
+                # Take the video from the index if it did not change
+                entry = None
+                if library_index is not None:
+                    index_path = os.path.abspath(filepath) if absolute_path and os.path.exists(filepath) else filepath
+                    entry = library_index.get(index_path)
+                entries[filepath] = entry
+
+            # guess the videos in worker processes, the errors are reported when scanning again below
+            scanned_videos: dict[str, Video] = {}
+            if scan_jobs > 1:
+                scan_filepaths = {
+                    os.path.abspath(p) if absolute_path and os.path.exists(p) else p: p
+                    for p, entry in entries.items()
+                    if entry is None
+                }
+                for scan_filepath, scanned_video in scan_paths(scan_filepaths, name=name, workers=scan_jobs):
+                    if scanned_video is not None:
+                        scanned_videos[scan_filepaths[scan_filepath]] = scanned_video
+
+            for filepath, entry in entries.items():
+                video: Video | None
+                if entry is not None:
+                    video = entry.video
+                    indexed_videos.add(video)
+                    if not embedded_subtitles:
+                        video.subtitles = []
+                    # refine again if the refiners or the providers changed since the previous run
+                    if embedded_subtitles and entry.is_refined(use_refiners, use_providers):
+                        refined_videos.add(video)
+                elif (video := scanned_videos.get(filepath)) is None:
+                    # Try scanning the video at path
+                    video = scan_video_path(
+                        filepath,
+                        absolute_path=absolute_path,
+                        name=name,
+                        verbose=verbose,
+                        debug=debug,
+                    )
                 if video is None:
                     # Fallback to scanning with absolute path
                     if use_absolute_path == 'fallback':
@@ -890,22 +1320,50 @@ def download(
                 video.use_ctime = use_ctime
                 video_candidates.append(video)
 
-            # check and refine videos
+            # check videos
+            checked_videos, path_ignored_videos = check_videos(
+                video_candidates,
+                languages=language_set,
+                age=age,
+                single=single,
+                directory=directory,
+                external_subtitles=not force and not force_external_subtitles,
+                subtitle_listing=subtitle_listing,
+            )
+            ignored_videos.extend(path_ignored_videos)
+
+            # refine the videos that were not refined in a previous run
+            unrefined_videos = [v for v in checked_videos if v not in refined_videos]
+            refine_collected_videos(
+                unrefined_videos,
+                obj=obj,
+                refiners=use_refiners,
+                providers=use_providers,
+                languages=language_set,
+                hash_cache=hash_cache,
+                hash_jobs=hash_jobs,
+                refine_jobs=refine_jobs,
+                refine_videos=refine_videos,
+                embedded_subtitles=embedded_subtitles,
+            )
+            # only reuse the refined videos with all their embedded subtitles
+            if embedded_subtitles:
+                refined_videos.update(unrefined_videos)
+            videos.extend(checked_videos)
+
             for video in video_candidates:
-                if not force and not force_external_subtitles:
-                    video.subtitles.extend(search_external_subtitles(video.name, directory=directory).values())
-                if check_video(video, languages=language_set, age=age, undefined=single):
-                    refine(
+                # update the index, also with the subtitles found since the previous run,
+                # but keep the indexed videos with their embedded subtitles
+                if library_index is not None and (embedded_subtitles or video not in indexed_videos):
+                    library_index.add(
                         video,
+                        refined=video in refined_videos,
                         refiners=use_refiners,
-                        refiner_configs=obj['refiner_configs'],
-                        embedded_subtitles=not force and not force_embedded_subtitles,
                         providers=use_providers,
-                        languages=language_set,
                     )
-                    videos.append(video)
-                else:
-                    ignored_videos.append(video)
+
+    if library_index is not None:
+        library_index.commit()
 
     # output errored paths
     if verbose > 0:
@@ -949,56 +1407,59 @@ def download(
                 click.echo(f'All ignored from configuration: `ignore_provider={config_ignore}`')
         return
 
+    def video_filename(v: Video | None) -> str:
+        return os.path.split(v.name)[1] if v is not None else ''
+
     # download best subtitles
     downloaded_subtitles = defaultdict(list)
     with AsyncProviderPool(
         max_workers=max_workers,
+        max_videos=max_videos,
         providers=use_providers,
         provider_configs=obj['provider_configs'],
+        deadline=deadline,
     ) as pp:
         with click.progressbar(
             videos,
             label='Downloading subtitles',
-            item_show_func=lambda v: os.path.split(v.name)[1] if v is not None else '',
-        ) as bar:
-            for v in bar:
+            item_show_func=video_filename,
+        ) as download_bar:
+            results = iter_download_videos(
+                pp,
+                videos,
+                language_set,
+                min_score=min_score,
+                ignore_subtitles=ignore_subtitles,
+                **download_kwargs,
+            )
+            for v, subtitles in results:
                 if debug:
                     # print a new line, so the logs appear below the progressbar
                     click.echo()
-                scores = get_scores(v)
-                subtitles = pp.download_best_subtitles(
-                    pp.list_subtitles(v, language_set - v.subtitle_languages),
-                    v,
-                    language_set,
-                    min_score=scores['hash'] * min_score // 100,
-                    hearing_impaired=hearing_impaired_flag,
-                    foreign_only=foreign_only_flag,
-                    skip_wrong_fps=skip_wrong_fps,
-                    only_one=single,
-                    ignore_subtitles=ignore_subtitles,
-                )
                 downloaded_subtitles[v] = subtitles
+                download_bar.update(1, v)
 
         if pp.discarded_providers:  # pragma: no cover
             click.secho(
                 f'Some providers have been discarded due to unexpected errors: {", ".join(pp.discarded_providers)}',
                 fg='yellow',
             )
+        if verbose > 0:
+            for name, breaker in pp.circuit_breakers.items():
+                if breaker.failures or breaker.rejected:
+                    click.secho(f'Provider {name}: {breaker.summary()}', fg='yellow')
+        if verbose > 1:
+            for name, histogram in pp.latency_histograms.items():
+                click.echo(f'Provider {name} latency: {histogram.summary()}')
+            click.echo(f'Guess cache: {guess_cache.summary()}')
 
     # save subtitles
     total_subtitles = 0
     for v, subtitles in downloaded_subtitles.items():
-        saved_subtitles = save_subtitles(
-            v,
-            subtitles,
-            single=single,
-            directory=directory,
-            encoding=encoding,
-            subtitle_format=subtitle_format,
-            language_type_suffix=language_type_suffix,
-            language_format=language_format,
-        )
+        saved_subtitles = save_subtitles(v, subtitles, **save_kwargs)
         total_subtitles += len(saved_subtitles)
+        if library_index is not None:
+            library_index.add_subtitle_languages(v.name, (s.language for s in saved_subtitles))
 
         if verbose > 0:
             click.echo(f'{plural(len(saved_subtitles), "subtitle")} downloaded for {os.path.split(v.name)[1]}')
@@ -1046,6 +1507,174 @@ def download(
         click.echo(f'Downloaded {plural(total_subtitles, "subtitle")}')
 
 
+@subliminal.command()
+@selection_options
+@output_options
+@single_option
+@best_subtitle_options
+@naming_options
+@pool_options
+@click.option(
+    '-z/-Z',
+    '--archives/--no-archives',
+    default=True,
+    show_default=True,
+    help=f'Watch archives for videos (supported extensions: {", ".join(ARCHIVE_EXTENSIONS)}).',
+)
+@click.option(
+    '--settle',
+    type=click.FloatRange(min=0),
+    default=5.0,
+    show_default=True,
+    help='Time in seconds without changes before a new file is considered complete.',
+)
+@click.option(
+    '--polling',
+    is_flag=True,
+    default=False,
+    help='Walk the directories periodically instead of using inotify, e.g. for network filesystems.',
+)
+@click.option(
+    '--interval',
+    type=click.FloatRange(min=0, min_open=True),
+    default=30.0,
+    show_default=True,
+    help='Time in seconds between two walks of the directories when polling.',
+)
+@refine_options
+@click.option('-v', '--verbose', count=True, help='Increase verbosity.')
+@click.argument('path', type=click.Path(exists=True, file_okay=False), required=True, nargs=-1)
+@click.pass_obj
+def watch(
+    obj: dict[str, Any],
+    provider: Sequence[str],
+    extend_provider: Sequence[str],
+    ignore_provider: Sequence[str],
+    refiner: Sequence[str],
+    extend_refiner: Sequence[str],
+    ignore_refiner: Sequence[str],
+    language: Sequence[Language],
+    directory: str | None,
+    encoding: str | None,
+    subtitle_format: str | None,
+    single: bool,
+    skip_wrong_fps: bool,
+    stop_on_hash_match: bool,
+    foreign_only: tuple[bool | None, ...],
+    hearing_impaired: tuple[bool | None, ...],
+    min_score: int,
+    language_type_suffix: bool,
+    language_format: str,
+    max_workers: int,
+    deadline: float | None,
+    max_videos: int,
+    archives: bool,
+    settle: float,
+    polling: bool,
+    interval: float,
+    hash_cache: bool,
+    hash_jobs: int,
+    refine_jobs: int,
+    refine_videos: int,
+    verbose: int,
+    path: list[str],
+) -> None:
+    """Watch directories and download the best subtitles of the new videos.
+
+    PATH is a directory to watch, it can be used multiple times. The videos and archives are processed as soon as
+    they are completely written, the videos already in the directories are ignored.
+
+    The providers and refiners are kept between the new videos, stop watching with Ctrl+C. The errors
+    are logged and the watching goes on with the next videos.
+
+    """
+    language_set = set(language)
+    download_kwargs, save_kwargs = download_parameters(
+        single=single,
+        directory=directory,
+        encoding=encoding,
+        subtitle_format=subtitle_format,
+        language_type_suffix=language_type_suffix,
+        language_format=language_format,
+        hearing_impaired=hearing_impaired,
+        foreign_only=foreign_only,
+        skip_wrong_fps=skip_wrong_fps,
+        stop_on_hash_match=stop_on_hash_match,
+    )
+    debug = obj.get('debug', False)
+    if debug:
+        verbose = 3
+
+    use_providers, use_refiners = select_extensions(
+        obj,
+        provider,
+        extend_provider,
+        ignore_provider,
+        refiner,
+        extend_refiner,
+        ignore_refiner,
+    )
+    if len(use_providers) == 0:
+        click.echo('No provider was selected to download subtitles.')
+        return
+
+    def download_new_videos(pp: ProviderPool, filepaths: Sequence[str]) -> None:
+        # scan, check and refine the new videos
+        video_candidates: list[Video] = []
+        for filepath in filepaths:
+            video = scan_video_path(filepath, verbose=verbose, debug=debug)
+            if video is None:
+                click.secho(f'{filepath} errored', fg='red')
+                continue
+            video_candidates.append(video)
+        videos, ignored_videos = check_videos(
+            video_candidates,
+            languages=language_set,
+            single=single,
+            directory=directory,
+        )
+        if verbose > 1:
+            for video in ignored_videos:
+                click.secho(f'{os.path.split(video.name)[1]!r} ignored', fg='yellow')
+        refine_collected_videos(
+            videos,
+            obj=obj,
+            refiners=use_refiners,
+            providers=use_providers,
+            languages=language_set,
+            hash_cache=hash_cache,
+            hash_jobs=hash_jobs,
+            refine_jobs=refine_jobs,
+            refine_videos=refine_videos,
+        )
+
+        # download and save the best subtitles
+        for v, subtitles in iter_download_videos(pp, videos, language_set, min_score=min_score, **download_kwargs):
+            saved_subtitles = save_subtitles(v, subtitles, **save_kwargs)
+            click.echo(f'{plural(len(saved_subtitles), "subtitle")} downloaded for {os.path.split(v.name)[1]}')
+
+    with AsyncProviderPool(
+        max_workers=max_workers,
+        max_videos=max_videos,
+        providers=use_providers,
+        provider_configs=obj['provider_configs'],
+        deadline=deadline,
+    ) as pp:
+        watcher = VideoWatcher(path, archives=archives, settle=settle, interval=interval, polling=polling)
+        with watcher:
+            click.echo(f'Watching {", ".join(path)}')
+            try:
+                for filepaths in watcher.watch():
+                    try:
+                        download_new_videos(pp, filepaths)
+                    except Exception:
+                        # keep watching, e.g. after a permission error saving a subtitle
+                        logger.exception('Unexpected error while processing the new videos %s', ', '.join(filepaths))
+                        click.secho(f'{", ".join(filepaths)} errored', fg='red')
+            except KeyboardInterrupt:  # pragma: no cover
+                click.echo('Stopped watching.')
+
+
 def cli() -> None:  # pragma: no cover
     """CLI that recognizes environment variables."""
     subliminal(auto_envvar_prefix='SUBLIMINAL')
@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+import bisect
+import functools
 import itertools
 import logging
 import operator
 import os
+import threading
+import time
 from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
 from babelfish import Language  # type: ignore[import-untyped]
-from guessit import guessit  # type: ignore[import-untyped]
 
 from .archives import ARCHIVE_ERRORS, ARCHIVE_EXTENSIONS, is_supported_archive, scan_archive
+from .circuitbreaker import CircuitBreaker, CircuitState
 from .exceptions import ArchiveError, DiscardingError
 from .extensions import (
     discarded_episode_refiners,
@@ -22,18 +29,25 @@ from .extensions import (
     get_default_refiners,
     provider_manager,
     refiner_manager,
+    refiners_conflict,
 )
+from .guess import guessit
 from .matches import fps_matches
+from .metrics import LatencyHistogram
+from .providers import AsyncProvider, SyncProviderAdapter
+from .ratelimit import RATE_LIMIT_OPTIONS, RateLimiter, RateLimitOptions
 from .score import compute_score as default_compute_score
 from .subtitle import SUBTITLE_EXTENSIONS, ExternalSubtitle, LanguageType
-from .utils import get_age, handle_exception
+from .utils import get_stat_age, handle_exception, sanitize
 from .video import VIDEO_EXTENSIONS, Episode, Movie, Video
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Mapping, Sequence, Set
+    from collections.abc import AsyncIterator, Callable, Generator, Iterable, Iterator, Mapping, Sequence, Set
+    from concurrent.futures import Executor, Future
     from datetime import timedelta
     from types import TracebackType
 
+    from subliminal.index import LibraryIndex
     from subliminal.providers import Provider
     from subliminal.score import ComputeScore
     from subliminal.subtitle import Subtitle
@@ -41,6 +55,23 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def get_rate_limit_options(name: str, config: Mapping[str, Any]) -> RateLimitOptions:
+    """Options of the :class:`~subliminal.ratelimit.RateLimiter` of a provider.
+
+    The defaults of the provider class are overridden by the provider configuration.
+
+    :param str name: name of the provider.
+    :param dict config: configuration of the provider.
+    :return: the rate limiter options.
+    :rtype: dict
+
+    """
+    plugin = provider_manager[name].plugin
+    options = RateLimitOptions(rate_limit=plugin.rate_limit, max_concurrency=plugin.max_concurrency)
+    options.update({k: config[k] for k in RATE_LIMIT_OPTIONS if k in config})  # type: ignore[typeddict-item]
+    return options
+
+
 class ProviderPool:
     """A pool of providers with the same API as a single :class:`~subliminal.providers.Provider`.
 
@@ -48,11 +79,21 @@ class ProviderPool:
 
         * Lazy loads providers when needed and supports the `with` statement to :meth:`terminate`
           the providers on exit.
-        * Automatically discard providers on failure.
+        * Automatically discard providers on failure, with a :class:`~subliminal.circuitbreaker.CircuitBreaker`
+          per provider: the providers are discarded on errors or slow requests, and queried again after some time.
+        * Throttle the calls to each provider with a :class:`~subliminal.ratelimit.RateLimiter`.
+
+    The `rate_limit`, `rate_burst` and `max_concurrency` keys of a provider configuration are not passed
+    to the :class:`~subliminal.providers.Provider` but configure its :class:`~subliminal.ratelimit.RateLimiter`,
+    overriding the defaults set on the provider class.
 
     :param list providers: name of providers to use, if not all.
     :param dict provider_configs: provider configuration as keyword arguments per provider name to pass when
         instantiating the :class:`~subliminal.providers.Provider`.
+    :param dict circuit_breaker_options: keyword arguments to pass when instantiating
+        the :class:`~subliminal.circuitbreaker.CircuitBreaker` of each provider.
+    :param (float | None) deadline: maximum duration in seconds to list the subtitles of a video,
+        the providers that did not answer in time are ignored. Not limited if None.
 
     """
 
@@ -62,21 +103,42 @@ class ProviderPool:
     #: Provider configuration
     provider_configs: Mapping[str, Any]
 
+    #: Maximum duration in seconds to list the subtitles of a video
+    deadline: float | None
+
     #: Initialized providers
     initialized_providers: dict[str, Provider]
 
-    #: Discarded providers
-    discarded_providers: set[str]
+    #: Rate limiters per provider name
+    rate_limiters: dict[str, RateLimiter]
+
+    #: Options of the circuit breakers
+    circuit_breaker_options: Mapping[str, Any]
+
+    #: Circuit breakers per provider name
+    circuit_breakers: dict[str, CircuitBreaker]
+
+    #: Histograms of the duration of the subtitles listing per provider name
+    latency_histograms: dict[str, LatencyHistogram]
 
     def __init__(
         self,
         providers: Sequence[str] | None = None,
         provider_configs: Mapping[str, Any] | None = None,
+        *,
+        circuit_breaker_options: Mapping[str, Any] | None = None,
+        deadline: float | None = None,
     ) -> None:
         self.providers = providers if providers is not None else get_default_providers()
         self.provider_configs = provider_configs or {}
+        self.deadline = deadline
         self.initialized_providers = {}
-        self.discarded_providers = set()
+        self.rate_limiters = {}
+        self.circuit_breaker_options = circuit_breaker_options or {}
+        self.circuit_breakers = {}
+        self.latency_histograms = {}
+        self._initialization_locks: dict[str, threading.Lock] = {}
+        self._limiters_lock = threading.Lock()
 
     def __enter__(self) -> ProviderPool:
         return self
@@ -94,10 +156,16 @@ class ProviderPool:
             raise KeyError
 
         if name not in self.initialized_providers:
-            logger.info('Initializing provider %s', name)
-            provider = provider_manager[name].plugin(**self.provider_configs.get(name, {}))
-            provider.initialize()
-            self.initialized_providers[name] = provider
+            # the same provider can be requested by several threads at once
+            with self._initialization_locks.setdefault(name, threading.Lock()):
+                if name not in self.initialized_providers:
+                    logger.info('Initializing provider %s', name)
+                    config = {
+                        k: v for k, v in self.provider_configs.get(name, {}).items() if k not in RATE_LIMIT_OPTIONS
+                    }
+                    provider = provider_manager[name].plugin(**config)
+                    provider.initialize()
+                    self.initialized_providers[name] = provider
 
         return self.initialized_providers[name]
 
@@ -116,6 +184,81 @@ class ProviderPool:
     def __iter__(self) -> Iterator[str]:
         return iter(self.initialized_providers)
 
+    def rate_limit_options(self, name: str) -> RateLimitOptions:
+        """Options of the :class:`~subliminal.ratelimit.RateLimiter` of a provider.
+
+        The defaults of the provider class are overridden by the provider configuration.
+
+        :param str name: name of the provider.
+        :return: the rate limiter options.
+        :rtype: dict
+
+        """
+        return get_rate_limit_options(name, self.provider_configs.get(name, {}))
+
+    def get_rate_limiter(self, name: str) -> RateLimiter:
+        """Get the :class:`~subliminal.ratelimit.RateLimiter` of a provider, created on first use.
+
+        :param str name: name of the provider.
+        :return: the rate limiter of the provider.
+        :rtype: :class:`~subliminal.ratelimit.RateLimiter`
+
+        """
+        if name not in self.rate_limiters:
+            with self._limiters_lock:
+                if name not in self.rate_limiters:
+                    self.rate_limiters[name] = RateLimiter.from_options(self.rate_limit_options(name))
+        return self.rate_limiters[name]
+
+    def get_circuit_breaker(self, name: str) -> CircuitBreaker:
+        """Get the :class:`~subliminal.circuitbreaker.CircuitBreaker` of a provider, created on first use.
+
+        :param str name: name of the provider.
+        :return: the circuit breaker of the provider.
+        :rtype: :class:`~subliminal.circuitbreaker.CircuitBreaker`
+
+        """
+        if name not in self.circuit_breakers:
+            with self._limiters_lock:
+                if name not in self.circuit_breakers:
+                    self.circuit_breakers[name] = CircuitBreaker(name=name, **self.circuit_breaker_options)
+        return self.circuit_breakers[name]
+
+    @property
+    def discarded_providers(self) -> set[str]:
+        """Discarded providers, with an open circuit breaker.
+
+        Setting it trips the circuit breakers of the given providers and resets the others.
+        The returned set is a copy: modifying it in place does not discard the providers.
+
+        """
+        return {name for name, breaker in self.circuit_breakers.items() if breaker.state is CircuitState.OPEN}
+
+    @discarded_providers.setter
+    def discarded_providers(self, names: Set[str]) -> None:
+        for name in set(self.circuit_breakers) | set(names):
+            breaker = self.get_circuit_breaker(name)
+            if name in names:
+                breaker.trip()
+            else:
+                breaker.reset()
+
+    def record_latency(self, name: str, start: float) -> float:
+        """Record the duration of a subtitles listing in the :attr:`latency_histograms`.
+
+        :param str name: name of the provider.
+        :param float start: start of the listing, from :func:`time.perf_counter`.
+        :return: the duration of the listing in seconds.
+        :rtype: float
+
+        """
+        latency = time.perf_counter() - start
+        if name not in self.latency_histograms:
+            with self._limiters_lock:
+                self.latency_histograms.setdefault(name, LatencyHistogram())
+        self.latency_histograms[name].record(latency)
+        return latency
+
     def list_subtitles_provider(self, provider: str, video: Video, languages: Set[Language]) -> list[Subtitle] | None:
         """List subtitles with a single provider.
 
@@ -141,24 +284,41 @@ class ProviderPool:
             logger.info('Skipping provider %r: no language to search for', provider)
             return []
 
+        # check discarded providers
+        breaker = self.get_circuit_breaker(provider)
+        if not breaker.allow_request():
+            logger.debug('Skipping discarded provider %r', provider)
+            return []
+
         # list subtitles
         logger.info('Listing subtitles with provider %r and languages %r', provider, provider_languages)
+        start = time.perf_counter()
         try:
-            subtitles = self[provider].list_subtitles(video, provider_languages)
+            instance = self[provider]
+            with self.get_rate_limiter(provider):
+                # do not count the time initializing the provider or waiting for the rate limiter
+                start = time.perf_counter()
+                subtitles = instance.list_subtitles(video, provider_languages)
         except DiscardingError as e:
             handle_exception(e, f'Provider {provider}')
+            self.record_latency(provider, start)
+            breaker.trip()
             # return None to discard this provider with a known error
             return None
         except Exception as e:  # noqa: BLE001  # pragma: no cover
             handle_exception(e, f'Provider {provider}')
-            # return [] so the provider is not discarded with unknown error
+            # return [] so the provider is only discarded if the errors repeat
+            breaker.record(success=False, latency=self.record_latency(provider, start))
             return []
 
+        breaker.record(success=True, latency=self.record_latency(provider, start))
         return subtitles
 
     def list_subtitles(self, video: Video, languages: Set[Language]) -> list[Subtitle]:
         """List subtitles.
 
+        The providers are not queried after the :attr:`deadline`.
+
         :param video: video to list subtitles for.
         :type video: :class:`~subliminal.video.Video`
         :param languages: languages to search for.
@@ -169,46 +329,889 @@ class ProviderPool:
         """
         subtitles = []
 
+        start = time.monotonic()
         for name in self.providers:
-            # check discarded providers
-            if name in self.discarded_providers:
-                logger.debug('Skipping discarded provider %r', name)
+            # check the deadline
+            if self.deadline is not None and time.monotonic() - start > self.deadline:
+                logger.warning('Deadline of %ss exceeded, skipping provider %r', self.deadline, name)
                 continue
 
             # list subtitles
             provider_subtitles = self.list_subtitles_provider(name, video, languages)
             if provider_subtitles is None:
                 logger.info('Discarding provider %s', name)
-                self.discarded_providers.add(name)
                 continue
 
             # add the subtitles
             subtitles.extend(provider_subtitles)
 
-        return subtitles
+        return subtitles
+
+    def iter_subtitles_providers(
+        self,
+        video: Video,
+        languages: Set[Language],
+    ) -> Generator[tuple[str, list[Subtitle] | None], None, None]:
+        """List subtitles with each provider, yielding the result of each provider when it is available.
+
+        See :meth:`list_subtitles_provider` for the result of a provider. The providers are not queried
+        after the :attr:`deadline`.
+
+        :param video: video to list subtitles for.
+        :type video: :class:`~subliminal.video.Video`
+        :param languages: languages to search for.
+        :type languages: set of :class:`~babelfish.language.Language`
+        :return: the name of the provider and the found subtitles, or None if the provider was discarded.
+        :rtype: generator of tuple of str and list of :class:`~subliminal.subtitle.Subtitle` or None
+
+        """
+        start = time.monotonic()
+        for name in self.providers:
+            # check the deadline
+            if self.deadline is not None and time.monotonic() - start > self.deadline:
+                logger.warning('Deadline of %ss exceeded, skipping provider %r', self.deadline, name)
+                continue
+
+            yield name, self.list_subtitles_provider(name, video, languages)
+
+    def iter_subtitles(
+        self,
+        video: Video,
+        languages: Set[Language],
+        *,
+        until: Callable[[Sequence[Subtitle]], bool] | None = None,
+    ) -> Iterator[Subtitle]:
+        """List subtitles, yielding the subtitles of each provider as soon as it answers.
+
+        Stopping the iteration early does not wait for the remaining providers, if the pool queries
+        them concurrently.
+
+        :param video: video to list subtitles for.
+        :type video: :class:`~subliminal.video.Video`
+        :param languages: languages to search for.
+        :type languages: set of :class:`~babelfish.language.Language`
+        :param until: predicate called with all the subtitles found so far, after each provider answers.
+            The iteration stops when it returns `True`, without querying the remaining providers.
+        :return: found subtitles.
+        :rtype: iterator of :class:`~subliminal.subtitle.Subtitle`
+
+        """
+        subtitles: list[Subtitle] = []
+
+        results = self.iter_subtitles_providers(video, languages)
+        try:
+            for name, provider_subtitles in results:
+                if provider_subtitles is None:
+                    logger.info('Discarding provider %s', name)
+                    continue
+
+                subtitles.extend(provider_subtitles)
+                yield from provider_subtitles
+
+                if until is not None and until(subtitles):
+                    logger.info('Stop listing subtitles after provider %s', name)
+                    return
+        finally:
+            results.close()
+
+    def download_subtitle(self, subtitle: Subtitle) -> bool:
+        """Download `subtitle`'s :attr:`~subliminal.subtitle.Subtitle.content`.
+
+        :param subtitle: subtitle to download.
+        :type subtitle: :class:`~subliminal.subtitle.Subtitle`
+        :return: `True` if the subtitle has been successfully downloaded, `False` otherwise.
+        :rtype: bool
+
+        """
+        # check discarded providers
+        breaker = self.get_circuit_breaker(subtitle.provider_name)
+        if not breaker.allow_request():
+            logger.warning('Provider %r is discarded', subtitle.provider_name)
+            return False
+
+        logger.info('Downloading subtitle %r', subtitle)
+        try:
+            with self.get_rate_limiter(subtitle.provider_name):
+                instance = self[subtitle.provider_name]
+                start = time.perf_counter()
+                instance.download_subtitle(subtitle)
+        except ARCHIVE_ERRORS:  # type: ignore[misc]  # pragma: no cover
+            logger.exception('Bad archive for subtitle %r', subtitle)
+            # the provider did answer
+            breaker.record(success=True)
+        except DiscardingError as e:
+            handle_exception(e, f'Discarding provider {subtitle.provider_name}')
+            breaker.trip()
+        except Exception as e:  # noqa: BLE001
+            handle_exception(e, f'Provider {subtitle.provider_name}')
+            breaker.record(success=False)
+        else:
+            breaker.record(success=True, latency=time.perf_counter() - start)
+
+        # check subtitle validity
+        if not subtitle.is_valid():
+            logger.error('Invalid subtitle')
+            return False
+
+        return True
+
+    def download_best_subtitles(
+        self,
+        subtitles: Sequence[Subtitle],
+        video: Video,
+        languages: Set[Language],
+        *,
+        min_score: int = 0,
+        hearing_impaired: bool | None = None,
+        foreign_only: bool | None = None,
+        skip_wrong_fps: bool = False,
+        only_one: bool = False,
+        compute_score: ComputeScore | None = None,
+        ignore_subtitles: Sequence[str] | None = None,
+        concurrent_downloads: bool = False,
+        speculative: bool = False,
+    ) -> list[Subtitle]:
+        """Download the best matching subtitles.
+
+        With `concurrent_downloads`, the best subtitle of each language is downloaded concurrently, falling back on
+        the next best subtitle of the same language on error. With `speculative`, the next best subtitle of each
+        language is also downloaded in advance, to save time when the best subtitle is invalid,
+        at the expense of more downloads from the providers.
+        The selected subtitles are the same as with the sequential download.
+
+        :param subtitles: the subtitles to use.
+        :type subtitles: list of :class:`~subliminal.subtitle.Subtitle`
+        :param video: video to download subtitles for.
+        :type video: :class:`~subliminal.video.Video`
+        :param languages: languages to download.
+        :type languages: set of :class:`~babelfish.language.Language`
+        :param int min_score: minimum score for a subtitle to be downloaded.
+        :param (bool | None) hearing_impaired: hearing impaired preference (yes/no/indifferent).
+        :param (bool | None) foreign_only: foreign only preference (yes/no/indifferent).
+        :param bool skip_wrong_fps: skip subtitles with an FPS that do not match the video (False).
+        :param bool only_one: download only one subtitle, not one per language.
+        :param compute_score: function that takes `subtitle` and `video` as positional arguments,
+            and returns the score.
+        :param ignore_subtitles: list of subtitle ids to ignore (None defaults to an empty list).
+        :param bool concurrent_downloads: download the subtitles of different languages concurrently.
+        :param bool speculative: with `concurrent_downloads`, also download the next best subtitle in advance.
+        :return: downloaded subtitles.
+        :rtype: list of :class:`~subliminal.subtitle.Subtitle`
+
+        """
+        scored_subtitles = rank_subtitles(
+            subtitles,
+            video,
+            hearing_impaired=hearing_impaired,
+            foreign_only=foreign_only,
+            skip_wrong_fps=skip_wrong_fps,
+            compute_score=compute_score,
+            ignore_subtitles=ignore_subtitles,
+        )
+
+        if concurrent_downloads:
+            return self.download_best_subtitles_concurrently(
+                [(s, score) for s, score in scored_subtitles if score >= min_score],
+                only_one=only_one,
+                speculative=speculative,
+            )
+
+        # download best subtitles, falling back on the next on error
+        downloaded_subtitles: list[Subtitle] = []
+        for subtitle, score in scored_subtitles:
+            # check score
+            if score < min_score:
+                logger.info('Score %d is below min_score (%d)', score, min_score)
+                break
+
+            # check downloaded languages
+            if subtitle.language in {s.language for s in downloaded_subtitles}:  # pragma: no cover
+                logger.debug('Skipping subtitle: %r already downloaded', subtitle.language)
+                continue
+
+            # download
+            if self.download_subtitle(subtitle):  # pragma: no branch
+                downloaded_subtitles.append(subtitle)
+
+            # stop when all languages are downloaded
+            if {s.language for s in downloaded_subtitles} == languages:
+                logger.debug('All languages downloaded')
+                break
+
+            # stop if only one subtitle is requested
+            if only_one and len(downloaded_subtitles) > 0:
+                logger.debug('Only one subtitle downloaded')
+                break
+
+        return downloaded_subtitles
+
+    @contextmanager
+    def download_executor(self) -> Iterator[Executor]:
+        """Executor used to download subtitles concurrently.
+
+        A new thread pool is created for each call, subclasses can provide a shared executor.
+        """
+        with ThreadPoolExecutor(max(len(self.providers), 1), thread_name_prefix='subliminal-download') as executor:
+            yield executor
+
+    def download_best_subtitles_concurrently(
+        self,
+        scored_subtitles: Sequence[tuple[Subtitle, int]],
+        *,
+        only_one: bool = False,
+        speculative: bool = False,
+    ) -> list[Subtitle]:
+        """Download the best subtitle of each language concurrently.
+
+        The candidates of each language are tried in order, falling back on the next one on error.
+        A candidate is only selected if all the better candidates of the same language failed,
+        so the result is the same as downloading sequentially.
+
+        :param scored_subtitles: the subtitles with their score, best first.
+        :type scored_subtitles: list of tuple of :class:`~subliminal.subtitle.Subtitle` and int
+        :param bool only_one: download only one subtitle, not one per language.
+        :param bool speculative: also download the next candidate of each language in advance.
+        :return: downloaded subtitles, best first.
+        :rtype: list of :class:`~subliminal.subtitle.Subtitle`
+
+        """
+        # candidates grouped by language, keeping the ranking; a single group with only_one
+        candidates: dict[Language | None, list[tuple[int, Subtitle]]] = defaultdict(list)
+        for rank, (subtitle, _) in enumerate(scored_subtitles):
+            candidates[None if only_one else subtitle.language].append((rank, subtitle))
+        if not candidates:
+            return []
+
+        depth = 2 if speculative else 1
+        selected: list[tuple[int, Subtitle]] = []
+        with self.download_executor() as executor:
+            # downloads in flight per language, best first
+            in_flight: dict[Language | None, list[tuple[int, Subtitle, Future[bool]]]] = {}
+            for key, queue in candidates.items():
+                in_flight[key] = [
+                    (rank, subtitle, executor.submit(self.download_subtitle, subtitle))
+                    for rank, subtitle in queue[:depth]
+                ]
+                del queue[:depth]
+
+            while in_flight:
+                wait([f for lane in in_flight.values() for _, _, f in lane], return_when=FIRST_COMPLETED)
+                for key in list(in_flight):
+                    lane = in_flight[key]
+                    # resolve the language in order of ranking
+                    while lane and lane[0][2].done():
+                        rank, subtitle, future = lane.pop(0)
+                        if future.result():
+                            selected.append((rank, subtitle))
+                            lane.clear()
+                            candidates[key].clear()
+                            break
+                        # fall back on the next candidate
+                        queue = candidates[key]
+                        if queue:
+                            next_rank, next_subtitle = queue.pop(0)
+                            lane.append(
+                                (next_rank, next_subtitle, executor.submit(self.download_subtitle, next_subtitle))
+                            )
+                    if not lane:
+                        del in_flight[key]
+
+        return [subtitle for _, subtitle in sorted(selected, key=operator.itemgetter(0))]
+
+    def list_and_download_best_subtitles(
+        self,
+        video: Video,
+        languages: Set[Language],
+        *,
+        stop_on_hash_match: bool = False,
+        **kwargs: Any,
+    ) -> list[Subtitle]:
+        """List subtitles for a single video and download the best matching ones.
+
+        With `stop_on_hash_match`, the listing stops as soon as a subtitle matching the video hash is found
+        for every language (or for any language with `only_one`), as nothing can have a better score.
+        The remaining providers are not queried, or ignored if they are queried concurrently.
+
+        :param video: video to download subtitles for.
+        :type video: :class:`~subliminal.video.Video`
+        :param languages: languages to download.
+        :type languages: set of :class:`~babelfish.language.Language`
+        :param bool stop_on_hash_match: stop listing subtitles when a hash match is found for every language.
+        :param kwargs: additional parameters for :meth:`download_best_subtitles`.
+        :return: downloaded subtitles.
+        :rtype: list of :class:`~subliminal.subtitle.Subtitle`
+
+        """
+        logger.info('Downloading best subtitles for %r', video)
+        missing_languages = languages - video.subtitle_languages
+        if stop_on_hash_match:
+            until = hash_match_predicate(
+                video,
+                missing_languages,
+                only_one=kwargs.get('only_one', False),
+                hearing_impaired=kwargs.get('hearing_impaired'),
+                foreign_only=kwargs.get('foreign_only'),
+                skip_wrong_fps=kwargs.get('skip_wrong_fps', False),
+                ignore_subtitles=kwargs.get('ignore_subtitles'),
+            )
+            listed_subtitles = list(self.iter_subtitles(video, missing_languages, until=until))
+        else:
+            listed_subtitles = self.list_subtitles(video, missing_languages)
+
+        subtitles = self.download_best_subtitles(listed_subtitles, video, languages, **kwargs)
+        logger.info('Downloaded %d subtitle(s)', len(subtitles))
+        return subtitles
+
+    def iter_download_best_subtitles(
+        self,
+        videos: Iterable[Video],
+        languages: Set[Language],
+        **kwargs: Any,
+    ) -> Iterator[tuple[Video, list[Subtitle]]]:
+        """List and download the best matching subtitles for each video, one video at a time.
+
+        :param videos: videos to download subtitles for.
+        :type videos: iterable of :class:`~subliminal.video.Video`
+        :param languages: languages to download.
+        :type languages: set of :class:`~babelfish.language.Language`
+        :param kwargs: additional parameters for :meth:`download_best_subtitles`.
+        :return: the video and its downloaded subtitles, as soon as they are available.
+        :rtype: iterator of tuple of :class:`~subliminal.video.Video` and
+            list of :class:`~subliminal.subtitle.Subtitle`
+
+        """
+        for video in videos:
+            yield video, self.list_and_download_best_subtitles(video, languages, **kwargs)
+
+    def terminate(self) -> None:
+        """Terminate all the :attr:`initialized_providers` and report the failing providers and the latencies."""
+        logger.debug('Terminating initialized providers')
+        for name in list(self.initialized_providers):
+            del self[name]
+
+        for name, breaker in self.circuit_breakers.items():
+            if breaker.failures or breaker.rejected:
+                logger.info('Provider %s: %s', name, breaker.summary())
+
+        for name, histogram in self.latency_histograms.items():
+            logger.info('Provider %s latency: %s', name, histogram.summary())
+
+
+class AsyncProviderPool(ProviderPool):
+    """Subclass of :class:`ProviderPool` with asynchronous support for :meth:`~ProviderPool.list_subtitles`.
+
+    Subtitles for several videos can also be processed concurrently with :meth:`iter_download_best_subtitles`,
+    overlapping the listing of a video with the download of another one.
+
+    The thread pools are created on first use and reused until :meth:`terminate` is called.
+
+    :param int max_workers: maximum number of threads to use. If `None`, :attr:`max_workers` will be set
+        to the number of :attr:`~ProviderPool.providers`.
+    :param int max_videos: maximum number of videos processed at the same time
+        by :meth:`iter_download_best_subtitles`.
+    :param dict provider_max_workers: maximum number of concurrent requests per provider name,
+        overriding the `max_concurrency` of the provider configuration.
+
+    """
+
+    #: Maximum number of threads to use.
+    max_workers: int
+
+    #: Maximum number of videos processed at the same time.
+    max_videos: int
+
+    #: Maximum number of concurrent requests per provider name.
+    provider_max_workers: Mapping[str, int]
+
+    #: Providers still running past the deadline, skipped until they return
+    stragglers: set[str]
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        *args: Any,
+        max_videos: int | None = None,
+        provider_max_workers: Mapping[str, int] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+
+        #: Maximum number of threads to use
+        self.max_workers = max_workers or len(self.providers)
+        self.max_videos = max_videos or 1
+        self.provider_max_workers = provider_max_workers or {}
+        self.stragglers = set()
+        self._executor: ThreadPoolExecutor | None = None
+        self._video_executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Thread pool of :attr:`max_workers` threads querying the providers, created on first use."""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix='subliminal-provider')
+        return self._executor
+
+    @property
+    def video_executor(self) -> ThreadPoolExecutor:
+        """Thread pool of :attr:`max_videos` threads processing the videos, created on first use."""
+        if self._video_executor is None:
+            with self._executor_lock:
+                if self._video_executor is None:
+                    self._video_executor = ThreadPoolExecutor(self.max_videos, thread_name_prefix='subliminal-video')
+        return self._video_executor
+
+    def rate_limit_options(self, name: str) -> RateLimitOptions:
+        """Options of the rate limiter of a provider, with the :attr:`provider_max_workers` override."""
+        options = super().rate_limit_options(name)
+        if name in self.provider_max_workers:
+            options['max_concurrency'] = self.provider_max_workers[name]
+        return options
+
+    @contextmanager
+    def download_executor(self) -> Iterator[Executor]:
+        """Executor used to download subtitles concurrently, the shared :attr:`executor`."""
+        yield self.executor
+
+    def iter_download_best_subtitles(
+        self,
+        videos: Iterable[Video],
+        languages: Set[Language],
+        **kwargs: Any,
+    ) -> Iterator[tuple[Video, list[Subtitle]]]:
+        """List and download the best matching subtitles for many videos, multi-threaded.
+
+        Up to :attr:`max_videos` videos are processed at the same time, the results are yielded
+        in the order of completion.
+
+        See :meth:`ProviderPool.iter_download_best_subtitles`.
+
+        """
+        if self.max_videos <= 1:
+            yield from super().iter_download_best_subtitles(videos, languages, **kwargs)
+            return
+
+        executor = self.video_executor
+        videos_iter = iter(videos)
+        pending: dict[Future[list[Subtitle]], Video] = {}
+        for video in itertools.islice(videos_iter, self.max_videos):
+            pending[executor.submit(self.list_and_download_best_subtitles, video, languages, **kwargs)] = video
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                video = pending.pop(future)
+                # keep the number of videos in flight constant
+                for next_video in itertools.islice(videos_iter, 1):
+                    next_future = executor.submit(
+                        self.list_and_download_best_subtitles,
+                        next_video,
+                        languages,
+                        **kwargs,
+                    )
+                    pending[next_future] = next_video
+                yield video, future.result()
+
+    def list_subtitles_provider_tuple(
+        self,
+        provider: str,
+        video: Video,
+        languages: Set[Language],
+    ) -> tuple[str, list[Subtitle] | None]:
+        """List subtitles with a single provider, multi-threaded."""
+        return provider, self.list_subtitles_provider(provider, video, languages)
+
+    def list_subtitles(self, video: Video, languages: Set[Language]) -> list[Subtitle]:
+        """List subtitles, multi-threaded, ignoring the providers that did not answer before the deadline."""
+        results = dict(self.iter_subtitles_providers(video, languages))
+
+        subtitles: list[Subtitle] = []
+        for provider in self.providers:
+            if provider not in results:
+                continue
+
+            # discard provider that failed
+            provider_subtitles = results[provider]
+            if provider_subtitles is None:
+                logger.info('Discarding provider %s', provider)
+                continue
+
+            # add subtitles
+            subtitles.extend(provider_subtitles)
+
+        return subtitles
+
+    def iter_subtitles_providers(
+        self,
+        video: Video,
+        languages: Set[Language],
+    ) -> Generator[tuple[str, list[Subtitle] | None], None, None]:
+        """List subtitles with all the providers concurrently, yielding the results in the order of completion.
+
+        The :attr:`~ProviderPool.deadline` starts when the listing of the video starts. At the deadline,
+        the providers still queued are cancelled and the providers still running are abandoned and skipped
+        for the next videos until they return, so that the stragglers do not fill the thread pool.
+        The providers that were not queried yet are also cancelled when the iteration stops early.
+
+        See :meth:`ProviderPool.iter_subtitles_providers`.
+
+        """
+        # Avoid raising a ValueError with `ThreadPoolExecutor(self.max_workers)`
+        if self.max_workers == 0:  # pragma: no cover
+            return
+
+        start = time.monotonic()
+        futures: dict[Future[list[Subtitle] | None], str] = {}
+        for name in self.providers:
+            if name in self.stragglers:
+                logger.warning('Skipping provider %r, still running past the deadline of a previous listing', name)
+                continue
+            futures[self.executor.submit(self.list_subtitles_provider, name, video, languages)] = name
+
+        pending = set(futures)
+        try:
+            while pending:
+                timeout = None if self.deadline is None else max(start + self.deadline - time.monotonic(), 0)
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield futures[future], future.result()
+
+                # cancel the queued providers and abandon the running ones
+                if pending and self.deadline is not None and time.monotonic() - start >= self.deadline:
+                    cancelled = {f for f in pending if f.cancel()}
+                    if cancelled:
+                        logger.warning(
+                            'Deadline of %ss exceeded, skipping providers %s',
+                            self.deadline,
+                            ', '.join(futures[f] for f in cancelled),
+                        )
+                    if pending - cancelled:
+                        self._abandon({futures[f]: f for f in pending - cancelled})
+                    pending = set()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _abandon(self, futures: Mapping[str, Future[list[Subtitle] | None]]) -> None:
+        """Abandon the listings of the providers running past the deadline, until they return."""
+        logger.warning('Deadline of %ss exceeded, abandoning providers %s', self.deadline, ', '.join(futures))
+        with self._executor_lock:
+            self.stragglers.update(futures)
+        for name, future in futures.items():
+            future.add_done_callback(functools.partial(self._straggler_done, name))
+
+    def _straggler_done(self, name: str, future: Future[list[Subtitle] | None]) -> None:
+        """Query the provider again, its abandoned listing returned."""
+        with self._executor_lock:
+            self.stragglers.discard(name)
+
+    def terminate(self) -> None:
+        """Terminate all the :attr:`~ProviderPool.initialized_providers` and shut down the thread pools."""
+        with self._executor_lock:
+            executors = [e for e in (self._video_executor, self._executor) if e is not None]
+            self._executor = self._video_executor = None
+        for executor in executors:
+            executor.shutdown(wait=True)
+        super().terminate()
+
+
+class AsyncioProviderPool:
+    """A pool of providers with an :mod:`asyncio` API.
+
+    Providers implementing :class:`~subliminal.providers.AsyncProvider` are awaited natively,
+    the other providers are wrapped in a :class:`~subliminal.providers.SyncProviderAdapter`
+    and their blocking calls run in a shared thread pool of at most `max_workers` threads.
+    The pool is used with the `async with` statement to :meth:`terminate` the providers on exit.
+    The calls to each provider are throttled with a :class:`~subliminal.ratelimit.RateLimiter`,
+    configured as in :class:`ProviderPool`.
+
+    :param list providers: name of providers to use, if not all.
+    :param dict provider_configs: provider configuration as keyword arguments per provider name to pass when
+        instantiating the :class:`~subliminal.providers.Provider`.
+    :param int max_workers: maximum number of threads used by the synchronous providers. If `None`,
+        :attr:`max_workers` will be set to the number of :attr:`providers`.
+    :param dict circuit_breaker_options: keyword arguments to pass when instantiating
+        the :class:`~subliminal.circuitbreaker.CircuitBreaker` of each provider.
+
+    """
+
+    #: Name of providers to use
+    providers: Sequence[str]
+
+    #: Provider configuration
+    provider_configs: Mapping[str, Any]
+
+    #: Maximum number of threads used by the synchronous providers
+    max_workers: int
+
+    #: Initialized providers
+    initialized_providers: dict[str, AsyncProvider]
+
+    #: Options of the circuit breakers
+    circuit_breaker_options: Mapping[str, Any]
+
+    #: Circuit breakers per provider name
+    circuit_breakers: dict[str, CircuitBreaker]
+
+    #: Rate limiters per provider name
+    rate_limiters: dict[str, RateLimiter]
+
+    def __init__(
+        self,
+        providers: Sequence[str] | None = None,
+        provider_configs: Mapping[str, Any] | None = None,
+        max_workers: int | None = None,
+        *,
+        circuit_breaker_options: Mapping[str, Any] | None = None,
+    ) -> None:
+        self.providers = providers if providers is not None else get_default_providers()
+        self.provider_configs = provider_configs or {}
+        self.max_workers = max_workers or max(len(self.providers), 1)
+        self.initialized_providers = {}
+        self.circuit_breaker_options = circuit_breaker_options or {}
+        self.circuit_breakers = {}
+        self.rate_limiters = {}
+        self._initialization_locks: dict[str, asyncio.Lock] = {}
+        self._executor: ThreadPoolExecutor | None = None
+
+    async def __aenter__(self) -> AsyncioProviderPool:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException],
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.terminate()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Thread pool running the blocking calls of the synchronous providers, created on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.max_workers)
+        return self._executor
+
+    async def get_provider(self, name: str) -> AsyncProvider:
+        """Get an initialized provider.
+
+        :param str name: name of the provider.
+        :return: the initialized provider, with an asynchronous interface.
+        :rtype: :class:`~subliminal.providers.AsyncProvider`
+        :raises: :class:`KeyError` if the provider is not in :attr:`providers`.
+
+        """
+        if name not in self.providers:
+            raise KeyError(name)
+
+        if name not in self.initialized_providers:
+            async with self._initialization_locks.setdefault(name, asyncio.Lock()):
+                if name not in self.initialized_providers:
+                    logger.info('Initializing provider %s', name)
+                    config = {
+                        k: v for k, v in self.provider_configs.get(name, {}).items() if k not in RATE_LIMIT_OPTIONS
+                    }
+                    provider = provider_manager[name].plugin(**config)
+                    if not isinstance(provider, AsyncProvider):
+                        provider = SyncProviderAdapter(provider, self.executor)
+                    await provider.async_initialize()
+                    self.initialized_providers[name] = provider
+
+        return self.initialized_providers[name]
+
+    def get_circuit_breaker(self, name: str) -> CircuitBreaker:
+        """Get the :class:`~subliminal.circuitbreaker.CircuitBreaker` of a provider, created on first use.
+
+        See :meth:`ProviderPool.get_circuit_breaker`.
+
+        """
+        if name not in self.circuit_breakers:
+            self.circuit_breakers[name] = CircuitBreaker(name=name, **self.circuit_breaker_options)
+        return self.circuit_breakers[name]
+
+    def rate_limit_options(self, name: str) -> RateLimitOptions:
+        """Options of the :class:`~subliminal.ratelimit.RateLimiter` of a provider.
+
+        See :meth:`ProviderPool.rate_limit_options`.
+
+        """
+        return get_rate_limit_options(name, self.provider_configs.get(name, {}))
+
+    def get_rate_limiter(self, name: str) -> RateLimiter:
+        """Get the :class:`~subliminal.ratelimit.RateLimiter` of a provider, created on first use.
+
+        See :meth:`ProviderPool.get_rate_limiter`.
+
+        """
+        if name not in self.rate_limiters:
+            self.rate_limiters[name] = RateLimiter.from_options(self.rate_limit_options(name))
+        return self.rate_limiters[name]
+
+    @property
+    def discarded_providers(self) -> set[str]:
+        """Discarded providers, with an open circuit breaker, settable.
+
+        See :attr:`ProviderPool.discarded_providers`.
+
+        """
+        return {name for name, breaker in self.circuit_breakers.items() if breaker.state is CircuitState.OPEN}
+
+    @discarded_providers.setter
+    def discarded_providers(self, names: Set[str]) -> None:
+        for name in set(self.circuit_breakers) | set(names):
+            breaker = self.get_circuit_breaker(name)
+            if name in names:
+                breaker.trip()
+            else:
+                breaker.reset()
+
+    async def list_subtitles_provider(
+        self,
+        provider: str,
+        video: Video,
+        languages: Set[Language],
+    ) -> list[Subtitle] | None:
+        """List subtitles with a single provider.
+
+        See :meth:`ProviderPool.list_subtitles_provider`.
+
+        """
+        # check video validity
+        if not provider_manager[provider].plugin.check(video):
+            logger.info('Skipping provider %r: not a valid video', provider)
+            return []
+
+        # check supported languages
+        provider_languages = provider_manager[provider].plugin.check_languages(languages)
+        if not provider_languages:
+            logger.info('Skipping provider %r: no language to search for', provider)
+            return []
+
+        # check discarded providers
+        breaker = self.get_circuit_breaker(provider)
+        if not breaker.allow_request():
+            logger.debug('Skipping discarded provider %r', provider)
+            return []
+
+        # list subtitles
+        logger.info('Listing subtitles with provider %r and languages %r', provider, provider_languages)
+        try:
+            instance = await self.get_provider(provider)
+            async with self.get_rate_limiter(provider):
+                # do not count the time waiting for the rate limiter
+                start = time.perf_counter()
+                subtitles = await instance.async_list_subtitles(video, provider_languages)
+        except asyncio.CancelledError:
+            breaker.cancel_request()
+            raise
+        except DiscardingError as e:
+            handle_exception(e, f'Provider {provider}')
+            breaker.trip()
+            # return None to discard this provider with a known error
+            return None
+        except Exception as e:  # noqa: BLE001  # pragma: no cover
+            handle_exception(e, f'Provider {provider}')
+            # return [] so the provider is only discarded if the errors repeat
+            breaker.record(success=False)
+            return []
+
+        breaker.record(success=True, latency=time.perf_counter() - start)
+        return subtitles
+
+    async def list_subtitles(self, video: Video, languages: Set[Language]) -> list[Subtitle]:
+        """List subtitles, querying all the providers concurrently.
+
+        See :meth:`ProviderPool.list_subtitles`.
+
+        """
+        names = list(self.providers)
+        results = await asyncio.gather(*(self.list_subtitles_provider(name, video, languages) for name in names))
+
+        subtitles: list[Subtitle] = []
+        for name, provider_subtitles in zip(names, results):
+            # discard provider that failed
+            if provider_subtitles is None:
+                logger.info('Discarding provider %s', name)
+                continue
+
+            # add subtitles
+            subtitles.extend(provider_subtitles)
+
+        return subtitles
+
+    async def iter_subtitles(
+        self,
+        video: Video,
+        languages: Set[Language],
+        *,
+        until: Callable[[Sequence[Subtitle]], bool] | None = None,
+    ) -> AsyncIterator[Subtitle]:
+        """List subtitles, querying all the providers concurrently and yielding the subtitles as they arrive.
+
+        The pending queries are cancelled when the iteration stops early.
+
+        See :meth:`ProviderPool.iter_subtitles`.
 
-    def download_subtitle(self, subtitle: Subtitle) -> bool:
+        """
+        subtitles: list[Subtitle] = []
+
+        tasks = {
+            asyncio.ensure_future(self.list_subtitles_provider(name, video, languages)): name for name in self.providers
+        }
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = tasks[task]
+                    provider_subtitles = task.result()
+                    if provider_subtitles is None:
+                        logger.info('Discarding provider %s', name)
+                        continue
+
+                    subtitles.extend(provider_subtitles)
+                    for subtitle in provider_subtitles:
+                        yield subtitle
+
+                    if until is not None and until(subtitles):
+                        logger.info('Stop listing subtitles after provider %s', name)
+                        return
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def download_subtitle(self, subtitle: Subtitle) -> bool:
         """Download `subtitle`'s :attr:`~subliminal.subtitle.Subtitle.content`.
 
-        :param subtitle: subtitle to download.
-        :type subtitle: :class:`~subliminal.subtitle.Subtitle`
-        :return: `True` if the subtitle has been successfully downloaded, `False` otherwise.
-        :rtype: bool
+        See :meth:`ProviderPool.download_subtitle`.
 
         """
         # check discarded providers
-        if subtitle.provider_name in self.discarded_providers:
+        breaker = self.get_circuit_breaker(subtitle.provider_name)
+        if not breaker.allow_request():
             logger.warning('Provider %r is discarded', subtitle.provider_name)
             return False
 
         logger.info('Downloading subtitle %r', subtitle)
         try:
-            self[subtitle.provider_name].download_subtitle(subtitle)
+            instance = await self.get_provider(subtitle.provider_name)
+            async with self.get_rate_limiter(subtitle.provider_name):
+                start = time.perf_counter()
+                await instance.async_download_subtitle(subtitle)
         except ARCHIVE_ERRORS:  # type: ignore[misc]  # pragma: no cover
             logger.exception('Bad archive for subtitle %r', subtitle)
-        except Exception as e:  # noqa: BLE001
+            # the provider did answer
+            breaker.record(success=True)
+        except DiscardingError as e:
             handle_exception(e, f'Discarding provider {subtitle.provider_name}')
-            self.discarded_providers.add(subtitle.provider_name)
+            breaker.trip()
+        except Exception as e:  # noqa: BLE001
+            handle_exception(e, f'Provider {subtitle.provider_name}')
+            breaker.record(success=False)
+        else:
+            breaker.record(success=True, latency=time.perf_counter() - start)
 
         # check subtitle validity
         if not subtitle.is_valid():
@@ -217,66 +1220,22 @@ class ProviderPool:
 
         return True
 
-    def download_best_subtitles(
+    async def download_best_subtitles(
         self,
         subtitles: Sequence[Subtitle],
         video: Video,
         languages: Set[Language],
         *,
         min_score: int = 0,
-        hearing_impaired: bool | None = None,
-        foreign_only: bool | None = None,
-        skip_wrong_fps: bool = False,
         only_one: bool = False,
-        compute_score: ComputeScore | None = None,
-        ignore_subtitles: Sequence[str] | None = None,
+        **kwargs: Any,
     ) -> list[Subtitle]:
         """Download the best matching subtitles.
 
-        :param subtitles: the subtitles to use.
-        :type subtitles: list of :class:`~subliminal.subtitle.Subtitle`
-        :param video: video to download subtitles for.
-        :type video: :class:`~subliminal.video.Video`
-        :param languages: languages to download.
-        :type languages: set of :class:`~babelfish.language.Language`
-        :param int min_score: minimum score for a subtitle to be downloaded.
-        :param (bool | None) hearing_impaired: hearing impaired preference (yes/no/indifferent).
-        :param (bool | None) foreign_only: foreign only preference (yes/no/indifferent).
-        :param bool skip_wrong_fps: skip subtitles with an FPS that do not match the video (False).
-        :param bool only_one: download only one subtitle, not one per language.
-        :param compute_score: function that takes `subtitle` and `video` as positional arguments,
-            and returns the score.
-        :param ignore_subtitles: list of subtitle ids to ignore (None defaults to an empty list).
-        :return: downloaded subtitles.
-        :rtype: list of :class:`~subliminal.subtitle.Subtitle`
+        See :meth:`ProviderPool.download_best_subtitles`.
 
         """
-        compute_score = compute_score or default_compute_score
-        ignore_subtitles = ignore_subtitles or []
-
-        # ignore subtitles
-        subtitles = [s for s in subtitles if s.id not in ignore_subtitles]
-
-        # skip subtitles that do not match the FPS of the video (if defined)
-        if skip_wrong_fps and video.frame_rate is not None and video.frame_rate > 0:
-            subtitles = [s for s in subtitles if fps_matches(video, fps=s.fps, strict=False)]
-
-        # sort by hearing impaired and foreign only
-        language_type = LanguageType.from_flags(hearing_impaired=hearing_impaired, foreign_only=foreign_only)
-        if language_type != LanguageType.UNKNOWN:
-            logger.info('Sort subtitles by %s types first', language_type.value)
-            subtitles = sorted(
-                subtitles,
-                key=lambda s: s.language_type == language_type,
-                reverse=True,
-            )
-
-        # sort subtitles by score
-        scored_subtitles = sorted(
-            [(s, compute_score(s, video)) for s in subtitles],
-            key=operator.itemgetter(1),
-            reverse=True,
-        )
+        scored_subtitles = rank_subtitles(subtitles, video, **kwargs)
 
         # download best subtitles, falling back on the next on error
         downloaded_subtitles: list[Subtitle] = []
@@ -292,7 +1251,7 @@ class ProviderPool:
                 continue
 
             # download
-            if self.download_subtitle(subtitle):  # pragma: no branch
+            if await self.download_subtitle(subtitle):  # pragma: no branch
                 downloaded_subtitles.append(subtitle)
 
             # stop when all languages are downloaded
@@ -307,65 +1266,141 @@ class ProviderPool:
 
         return downloaded_subtitles
 
-    def terminate(self) -> None:
-        """Terminate all the :attr:`initialized_providers`."""
+    async def terminate(self) -> None:
+        """Terminate all the :attr:`initialized_providers`, shut down the thread pool and report failing providers."""
         logger.debug('Terminating initialized providers')
         for name in list(self.initialized_providers):
-            del self[name]
+            provider = self.initialized_providers.pop(name)
+            try:
+                logger.info('Terminating provider %s', name)
+                await provider.async_terminate()
+            except Exception as e:  # noqa: BLE001  # pragma: no cover
+                handle_exception(e, f'Provider {name} improperly terminated')
 
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
-class AsyncProviderPool(ProviderPool):
-    """Subclass of :class:`ProviderPool` with asynchronous support for :meth:`~ProviderPool.list_subtitles`.
+        for name, breaker in self.circuit_breakers.items():
+            if breaker.failures or breaker.rejected:
+                logger.info('Provider %s: %s', name, breaker.summary())
 
-    :param int max_workers: maximum number of threads to use. If `None`, :attr:`max_workers` will be set
-        to the number of :attr:`~ProviderPool.providers`.
+
+def rank_subtitles(
+    subtitles: Sequence[Subtitle],
+    video: Video,
+    *,
+    hearing_impaired: bool | None = None,
+    foreign_only: bool | None = None,
+    skip_wrong_fps: bool = False,
+    compute_score: ComputeScore | None = None,
+    ignore_subtitles: Sequence[str] | None = None,
+) -> list[tuple[Subtitle, int]]:
+    """Filter the subtitles and sort them by decreasing score.
+
+    :param subtitles: the subtitles to rank.
+    :type subtitles: list of :class:`~subliminal.subtitle.Subtitle`
+    :param video: video to compute the score against.
+    :type video: :class:`~subliminal.video.Video`
+    :param (bool | None) hearing_impaired: hearing impaired preference (yes/no/indifferent).
+    :param (bool | None) foreign_only: foreign only preference (yes/no/indifferent).
+    :param bool skip_wrong_fps: skip subtitles with an FPS that do not match the video (False).
+    :param compute_score: function that takes `subtitle` and `video` as positional arguments,
+        and returns the score.
+    :param ignore_subtitles: list of subtitle ids to ignore (None defaults to an empty list).
+    :return: the subtitles with their score, best first.
+    :rtype: list of tuple of :class:`~subliminal.subtitle.Subtitle` and int
 
     """
+    compute_score = compute_score or default_compute_score
+    ignore_subtitles = ignore_subtitles or []
+
+    # ignore subtitles
+    subtitles = [s for s in subtitles if s.id not in ignore_subtitles]
+
+    # skip subtitles that do not match the FPS of the video (if defined)
+    if skip_wrong_fps and video.frame_rate is not None and video.frame_rate > 0:
+        subtitles = [s for s in subtitles if fps_matches(video, fps=s.fps, strict=False)]
+
+    # sort by hearing impaired and foreign only
+    language_type = LanguageType.from_flags(hearing_impaired=hearing_impaired, foreign_only=foreign_only)
+    if language_type != LanguageType.UNKNOWN:
+        logger.info('Sort subtitles by %s types first', language_type.value)
+        subtitles = sorted(
+            subtitles,
+            key=lambda s: s.language_type == language_type,
+            reverse=True,
+        )
 
-    #: Maximum number of threads to use.
-    max_workers: int
+    # sort subtitles by score
+    return sorted(
+        [(s, compute_score(s, video)) for s in subtitles],
+        key=operator.itemgetter(1),
+        reverse=True,
+    )
 
-    def __init__(self, max_workers: int | None = None, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
 
-        #: Maximum number of threads to use
-        self.max_workers = max_workers or len(self.providers)
+def hash_match_predicate(
+    video: Video,
+    languages: Set[Language],
+    *,
+    only_one: bool = False,
+    hearing_impaired: bool | None = None,
+    foreign_only: bool | None = None,
+    skip_wrong_fps: bool = False,
+    ignore_subtitles: Sequence[str] | None = None,
+) -> Callable[[Sequence[Subtitle]], bool]:
+    """Make a predicate checking if a subtitle matching the hash of the video was found for every language.
 
-    def list_subtitles_provider_tuple(
-        self,
-        provider: str,
-        video: Video,
-        languages: Set[Language],
-    ) -> tuple[str, list[Subtitle] | None]:
-        """List subtitles with a single provider, multi-threaded."""
-        return provider, super().list_subtitles_provider(provider, video, languages)
+    A hash match has the best possible score, so there is no need to look for other subtitles.
+    The subtitles that would be filtered out or sorted last by :func:`rank_subtitles` are not considered.
+    Use it as the `until` predicate of :meth:`ProviderPool.iter_subtitles`.
 
-    def list_subtitles(self, video: Video, languages: Set[Language]) -> list[Subtitle]:
-        """List subtitles, multi-threaded."""
-        subtitles: list[Subtitle] = []
+    :param video: video to match the subtitles against.
+    :type video: :class:`~subliminal.video.Video`
+    :param languages: languages to find a hash match for.
+    :type languages: set of :class:`~babelfish.language.Language`
+    :param bool only_one: a hash match for any of the languages is enough.
+    :param (bool | None) hearing_impaired: hearing impaired preference (yes/no/indifferent).
+    :param (bool | None) foreign_only: foreign only preference (yes/no/indifferent).
+    :param bool skip_wrong_fps: skip subtitles with an FPS that do not match the video (False).
+    :param ignore_subtitles: list of subtitle ids to ignore (None defaults to an empty list).
+    :return: a predicate taking the subtitles found so far.
 
-        # Avoid raising a ValueError with `ThreadPoolExecutor(self.max_workers)`
-        if self.max_workers == 0:  # pragma: no cover
-            return subtitles
-
-        with ThreadPoolExecutor(self.max_workers) as executor:
-            executor_map = executor.map(
-                self.list_subtitles_provider_tuple,
-                self.providers,
-                itertools.repeat(video, len(self.providers)),
-                itertools.repeat(languages, len(self.providers)),
-            )
-            for provider, provider_subtitles in executor_map:
-                # discard provider that failed
-                if provider_subtitles is None:
-                    logger.info('Discarding provider %s', provider)
-                    self.discarded_providers.add(provider)
-                    continue
+    """
+    ignore_subtitles = ignore_subtitles or []
+    language_type = LanguageType.from_flags(hearing_impaired=hearing_impaired, foreign_only=foreign_only)
+    matched_languages: set[Language] = set()
+    checked = 0
+
+    def predicate(subtitles: Sequence[Subtitle]) -> bool:
+        nonlocal checked
+        # only check the new subtitles, the subtitles found so far are passed on each call
+        for subtitle in subtitles[checked:]:
+            if (
+                subtitle.language not in languages
+                or subtitle.language in matched_languages
+                or subtitle.id in ignore_subtitles
+                or (language_type != LanguageType.UNKNOWN and subtitle.language_type != language_type)
+            ):
+                continue
+            if (
+                skip_wrong_fps
+                and video.frame_rate is not None
+                and video.frame_rate > 0
+                and not fps_matches(video, fps=subtitle.fps, strict=False)
+            ):
+                continue
+            if 'hash' in subtitle.get_matches(video):
+                logger.debug('Found hash match %r', subtitle)
+                matched_languages.add(subtitle.language)
+        checked = len(subtitles)
 
-                # add subtitles
-                subtitles.extend(provider_subtitles)
+        if only_one:
+            return bool(matched_languages)
+        return bool(languages) and matched_languages >= languages
 
-        return subtitles
+    return predicate
 
 
 def check_video(
@@ -433,10 +1468,91 @@ def parse_language_code(subtitle_filename: str, video_filename: str) -> str | No
     return language_code.replace(fileext, '').replace('_', '-')[1:]
 
 
+class SubtitleListing:
+    """Cache of the subtitle file names in directories, to search the external subtitles of many videos.
+
+    Each directory is listed once, and its subtitle file names are sorted so the subtitles of a video are found
+    with a binary search on the video name. The directories walked by :func:`collect_video_filepaths` are recorded
+    without being listed again.
+
+    The listing is not updated when subtitles are saved, use :meth:`invalidate` or a new listing.
+
+    """
+
+    def __init__(self) -> None:
+        self._listings: dict[str, list[str]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(dirpath: str | os.PathLike) -> str:
+        return os.path.abspath(dirpath)
+
+    def add(self, dirpath: str | os.PathLike, filenames: Iterable[str]) -> None:
+        """Record the file names of a directory, only the subtitles are kept.
+
+        :param str dirpath: path of the directory.
+        :param filenames: names of the files in the directory.
+
+        """
+        listing = sorted(f for f in filenames if f.lower().endswith(SUBTITLE_EXTENSIONS))
+        with self._lock:
+            self._listings[self._key(dirpath)] = listing
+
+    def get(self, dirpath: str | os.PathLike) -> list[str]:
+        """Sorted subtitle file names in a directory, listed only the first time.
+
+        :param str dirpath: path of the directory.
+        :return: the sorted subtitle file names.
+        :rtype: list of str
+
+        """
+        key = self._key(dirpath)
+        with self._lock:
+            listing = self._listings.get(key)
+        if listing is None:
+            self.add(dirpath, os.listdir(dirpath))
+            with self._lock:
+                listing = self._listings[key]
+        return listing
+
+    def search(self, dirpath: str | os.PathLike, video_filename: str) -> list[str]:
+        """Subtitle file names in a directory starting with the video name without extension.
+
+        :param str dirpath: path of the directory.
+        :param str video_filename: name of the video file.
+        :return: the subtitle file names that can belong to the video.
+        :rtype: list of str
+
+        """
+        fileroot = os.path.splitext(video_filename)[0]
+        listing = self.get(dirpath)
+        start = bisect.bisect_left(listing, fileroot)
+        return list(itertools.takewhile(lambda f: f.startswith(fileroot), itertools.islice(listing, start, None)))
+
+    def invalidate(self, dirpath: str | os.PathLike | None = None) -> None:
+        """Forget the listing of a directory, or of all the directories.
+
+        :param str dirpath: path of the directory, None for all the directories.
+
+        """
+        with self._lock:
+            if dirpath is None:
+                self._listings.clear()
+            else:
+                self._listings.pop(self._key(dirpath), None)
+
+    def __len__(self) -> int:
+        return len(self._listings)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} [{len(self)} directories]>'
+
+
 def search_external_subtitles(
     path: str | os.PathLike,
     *,
     directory: str | os.PathLike | None = None,
+    subtitle_listing: SubtitleListing | None = None,
 ) -> dict[str, ExternalSubtitle]:
     """Search for external subtitles from a video `path` and their associated language.
 
@@ -444,6 +1560,8 @@ def search_external_subtitles(
 
     :param str path: path to the video.
     :param str directory: directory to search for subtitles.
+    :param subtitle_listing: cache of the directory listings, to search the subtitles of many videos.
+    :type subtitle_listing: :class:`SubtitleListing`
     :return: found subtitles with their languages.
     :rtype: dict
 
@@ -453,8 +1571,13 @@ def search_external_subtitles(
     dirpath = dirpath or '.'
 
     # search for subtitles
+    filenames = (
+        os.listdir(directory or dirpath)
+        if subtitle_listing is None
+        else subtitle_listing.search(directory or dirpath, filename)
+    )
     subtitles = {}
-    for p in os.listdir(directory or dirpath):
+    for p in filenames:
         language_code = parse_language_code(p, filename)
         if language_code is None:
             continue
@@ -564,6 +1687,94 @@ def scan_path(filepath: str | os.PathLike[str], *, name: str | None = None) -> V
     return scan_video_or_archive(filepath, name=name)
 
 
+def _scan_video_directory(
+    dirpath: str,
+    *,
+    age: timedelta | None,
+    use_ctime: bool,
+    archives: bool,
+    reference_date: datetime,
+    subtitle_listing: SubtitleListing | None = None,
+) -> tuple[list[str], list[str]]:
+    """Scan a single directory for video files, with :func:`os.scandir`.
+
+    The file names are recorded in `subtitle_listing`, to search the external subtitles without listing
+    the directory again.
+
+    :return: the sorted video file paths and the subdirectories to walk.
+    :rtype: tuple of (list of str, list of str)
+    """
+    logger.debug('Walking directory %r', dirpath)
+    try:
+        with os.scandir(dirpath) as it:
+            entries = list(it)
+    except OSError:
+        logger.warning('Could not list directory %r', dirpath)
+        return [], []
+
+    if subtitle_listing is not None:
+        subtitle_listing.add(dirpath, (entry.name for entry in entries))
+
+    video_filepaths = []
+    subdirpaths = []
+    for entry in sorted(entries, key=operator.attrgetter('name')):
+        filename = entry.name
+        try:
+            is_dir = entry.is_dir()
+        except OSError:  # pragma: no cover
+            is_dir = False
+
+        if is_dir:
+            # do not follow links to directories, like os.walk
+            if entry.is_symlink():
+                continue
+            # skip hidden dirnames
+            if filename.startswith('.'):
+                logger.debug('Skipping hidden dirname %r in %r', filename, dirpath)
+                continue
+            # Skip Sample folder
+            if filename.lower() == 'sample':
+                logger.debug('Skipping sample dirname %r in %r', filename, dirpath)
+                continue
+            subdirpaths.append(entry.path)
+            continue
+
+        # filter on videos and archives
+        if not filename.lower().endswith(VIDEO_EXTENSIONS) and not (
+            archives and filename.lower().endswith(ARCHIVE_EXTENSIONS)
+        ):
+            continue
+
+        # skip hidden files
+        if filename.startswith('.'):
+            logger.debug('Skipping hidden filename %r in %r', filename, dirpath)
+            continue
+        # skip 'sample' media files
+        if os.path.splitext(filename)[0].lower() == 'sample':
+            logger.debug('Skipping sample filename %r in %r', filename, dirpath)
+            continue
+
+        # skip links
+        if entry.is_symlink():
+            logger.debug('Skipping link %r in %r', filename, dirpath)
+            continue
+
+        # skip old files, reusing the stat result of the directory entry
+        if age:
+            try:
+                file_age = get_stat_age(entry.stat(), reference_date=reference_date, use_ctime=use_ctime)
+            except OSError:  # pragma: no cover
+                logger.warning('Could not get age of file %r in %r', filename, dirpath)
+                continue
+            if file_age > age:
+                logger.debug('Skipping old file %r in %r', filename, dirpath)
+                continue
+
+        video_filepaths.append(entry.path)
+
+    return video_filepaths, subdirpaths
+
+
 def collect_video_filepaths(
     path: str | os.PathLike,
     *,
@@ -571,16 +1782,27 @@ def collect_video_filepaths(
     use_ctime: bool = True,
     archives: bool = True,
     name: str | None = None,
-) -> list[str]:
+    max_workers: int | None = None,
+    subtitle_listing: SubtitleListing | None = None,
+) -> Generator[str, None, None]:
     """Collect video file paths in directory `path`.
 
+    The directory tree is walked with :func:`os.scandir`, the subdirectories are scanned concurrently
+    with a thread pool and the file paths are yielded as soon as their directory is scanned. The file paths
+    of a directory are sorted, but the directories are not yielded in a specific order.
+
     :param str path: existing directory path to scan.
     :param datetime.timedelta age: maximum age of the video or archive.
     :param bool use_ctime: use the latest of creation time and modification time to compute the age of the video,
         instead of just modification time.
     :param bool archives: scan videos in archives.
-    :return: the collected video file names.
-    :rtype: list of str
+    :param (int | None) max_workers: maximum number of directories scanned concurrently,
+        None uses the default of :class:`~concurrent.futures.ThreadPoolExecutor` and 1 walks the tree serially.
+    :param subtitle_listing: record the subtitle file names of the walked directories, for
+        :func:`search_external_subtitles`.
+    :type subtitle_listing: :class:`SubtitleListing`
+    :return: the collected video file names, yielded while walking the tree (this was a sorted list before).
+    :rtype: Generator of str
     :raises: :class:`ValueError`: video path is not well defined.
     """
     path = os.fspath(path)
@@ -594,60 +1816,96 @@ def collect_video_filepaths(
         msg = 'Path is not a directory'
         raise ValueError(msg)
 
-    # walk the path
-    video_filepaths = []
-    for dirpath, dirnames, filenames in os.walk(path):
-        logger.debug('Walking directory %r', dirpath)
-
-        # remove badly encoded and hidden dirnames
-        for dirname in list(dirnames):
-            if dirname.startswith('.'):
-                logger.debug('Skipping hidden dirname %r in %r', dirname, dirpath)
-                dirnames.remove(dirname)
-            # Skip Sample folder
-            if dirname.lower() == 'sample':
-                logger.debug('Skipping sample dirname %r in %r', dirname, dirpath)
-                dirnames.remove(dirname)
-
-        # scan for videos
-        for filename in sorted(filenames):
-            # filter on videos and archives
-            if not filename.lower().endswith(VIDEO_EXTENSIONS) and not (
-                archives and filename.lower().endswith(ARCHIVE_EXTENSIONS)
-            ):
-                continue
-
-            # skip hidden files
-            if filename.startswith('.'):
-                logger.debug('Skipping hidden filename %r in %r', filename, dirpath)
-                continue
-            # skip 'sample' media files
-            if os.path.splitext(filename)[0].lower() == 'sample':
-                logger.debug('Skipping sample filename %r in %r', filename, dirpath)
-                continue
+    scan = functools.partial(
+        _scan_video_directory,
+        age=age,
+        use_ctime=use_ctime,
+        archives=archives,
+        reference_date=datetime.now(timezone.utc),
+        subtitle_listing=subtitle_listing,
+    )
+    return _walk_video_filepaths(path, scan, max_workers=max_workers)
 
-            # reconstruct the file path
-            filepath = os.path.join(dirpath, filename)
 
-            # skip links
-            if os.path.islink(filepath):
-                logger.debug('Skipping link %r in %r', filename, dirpath)
-                continue
+def _walk_video_filepaths(
+    path: str,
+    scan: Callable[[str], tuple[list[str], list[str]]],
+    *,
+    max_workers: int | None,
+) -> Generator[str, None, None]:
+    """Walk the directory tree from `path`, yielding the video file paths found by `scan` in each directory."""
+    # walk serially, depth-first
+    if max_workers == 1:
+        dirpaths = [path]
+        while dirpaths:
+            video_filepaths, subdirpaths = scan(dirpaths.pop())
+            yield from video_filepaths
+            dirpaths.extend(reversed(subdirpaths))
+        return
+
+    # walk the subdirectories concurrently
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='subliminal-walk')
+    try:
+        pending = {executor.submit(scan, path)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                video_filepaths, subdirpaths = future.result()
+                pending.update(executor.submit(scan, subdirpath) for subdirpath in subdirpaths)
+                yield from video_filepaths
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _scan_path_or_error(filepath: str, name: str | None) -> Video | ValueError:
+    """Scan a path in a worker process, returning the error instead of raising it."""
+    try:
+        return scan_path(filepath, name=name)
+    except ValueError as e:
+        return e
+
+
+def scan_paths(
+    filepaths: Iterable[str | os.PathLike],
+    *,
+    name: str | None = None,
+    workers: int | None = None,
+    chunksize: int | None = None,
+) -> Iterator[tuple[str, Video | None]]:
+    """Scan videos or archives from `filepaths`, maybe non-existing, with :func:`scan_path`.
+
+    Guessing the video properties from the names is CPU-bound, so with several `workers` the paths are scanned
+    in a pool of processes. The scanning errors are logged and the path is returned with None.
+
+    :param filepaths: paths to the videos or archives.
+    :param str name: if defined, name to use with guessit instead of the paths.
+    :param (int | None) workers: number of processes, None or 1 scans the paths in the current process.
+    :param (int | None) chunksize: number of paths sent at once to a process, None to split the paths evenly.
+    :return: the paths and their scanned video, in the same order as `filepaths`.
+    :rtype: Iterator of tuple of (str, :class:`~subliminal.video.Video` or None)
+    """
+    paths = [os.fspath(p) for p in filepaths]
 
-            # skip old files
-            try:
-                file_age = get_age(filepath, use_ctime=use_ctime)
-            except ValueError:  # pragma: no cover
-                logger.warning('Could not get age of file %r in %r', filename, dirpath)
-                continue
+    results: Iterable[Video | ValueError]
+    if workers is None or workers <= 1 or len(paths) <= 1:
+        results = (_scan_path_or_error(p, name) for p in paths)
+        executor = None
+    else:
+        if chunksize is None:
+            chunksize = max(1, min(256, len(paths) // (workers * 4)))
+        executor = ProcessPoolExecutor(max_workers=workers)
+        results = executor.map(_scan_path_or_error, paths, itertools.repeat(name), chunksize=chunksize)
+
+    try:
+        for path, result in zip(paths, results):
+            if isinstance(result, ValueError):
+                logger.error('Error scanning video %r: %s', path, result)
+                yield path, None
             else:
-                if age and file_age > age:
-                    logger.debug('Skipping old file %r in %r', filename, dirpath)
-                    continue
-
-            video_filepaths.append(filepath)
-
-    return video_filepaths
+                yield path, result
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
 
 
 def scan_videos(
@@ -657,33 +1915,79 @@ def scan_videos(
     use_ctime: bool = False,
     archives: bool = True,
     name: str | None = None,
+    index: LibraryIndex | None = None,
+    workers: int | None = None,
 ) -> list[Video]:
     """Scan `path` for videos and their subtitles.
 
     See :func:`refine` to find additional information for the video.
 
+    With an `index`, the videos that did not change since they were indexed are taken from the index
+    instead of being scanned again, and the other videos are added to the index.
+
     :param str path: existing directory path to scan.
     :param datetime.timedelta age: maximum age of the video or archive.
     :param bool use_ctime: use the latest of creation time and modification time to compute the age of the video,
         instead of just modification time.
     :param bool archives: scan videos in archives.
     :param str name: name to use with guessit instead of the path.
+    :param index: index of the already scanned videos.
+    :type index: :class:`~subliminal.index.LibraryIndex`
+    :param (int | None) workers: number of processes scanning the videos, see :func:`scan_paths`.
     :return: the scanned videos.
     :rtype: list of :class:`~subliminal.video.Video`
     :raises: :class:`ValueError`: video path is not well defined.
     """
     filepaths = collect_video_filepaths(path, age=age, use_ctime=use_ctime, archives=archives)
 
-    videos = []
+    # the name is used instead of the path by guessit, do not use the index
+    use_index = index is not None and name is None
+
+    videos_by_path: dict[str, Video | None] = {}
     for filepath in filepaths:
-        try:
-            video = scan_video_or_archive(filepath, name=name)
-        except ValueError:
-            logger.exception('Error scanning video')
+        entry = index.get(filepath) if index is not None and use_index else None
+        videos_by_path[filepath] = entry.video if entry is not None else None
+
+    unindexed_filepaths = [p for p, video in videos_by_path.items() if video is None]
+    for filepath, scanned_video in scan_paths(unindexed_filepaths, name=name, workers=workers):
+        if scanned_video is None:
             continue
-        videos.append(video)
+        if index is not None and use_index:
+            index.add(scanned_video)
+        videos_by_path[filepath] = scanned_video
 
-    return videos
+    if index is not None:
+        index.commit()
+
+    return [video for video in videos_by_path.values() if video is not None]
+
+
+def refiner_graph(refiners: Sequence[str]) -> dict[str, set[str]]:
+    """Find the refiners that must run before each refiner, from the attributes they read and write.
+
+    A refiner runs after the previous refiners of the list that read or write the same attributes of the video,
+    as described by :data:`~subliminal.extensions.refiner_fields`, so running the independent refiners at the
+    same time gives the same result as running all the refiners in order.
+
+    :param refiners: the names of the refiners, in order, the duplicates are ignored.
+    :return: the names of the refiners to run before, by refiner name.
+    :rtype: dict[str, set[str]]
+
+    """
+    refiners = list(dict.fromkeys(refiners))
+    return {
+        refiner: {previous for previous in refiners[:i] if refiners_conflict(previous, refiner)}
+        for i, refiner in enumerate(refiners)
+    }
+
+
+def _refine_with(video: Video, refiner: str, refiner_configs: Mapping[str, Any] | None, **kwargs: Any) -> None:
+    """Refine a video with a refiner, logging the errors."""
+    logger.info('Refining video with %s', refiner)
+    try:
+        refiner_manager[refiner].plugin(video, **dict((refiner_configs or {}).get(refiner, {}), **kwargs))
+    except Exception as e:  # noqa: BLE001
+        handle_exception(e, f'Failed to refine video {video.name!r}')
 
 
 def refine(
@@ -691,10 +1995,17 @@ def refine(
     *,
     refiners: Sequence[str] | None = None,
     refiner_configs: Mapping[str, Any] | None = None,
+    max_workers: int = 1,
+    executor: Executor | None = None,
     **kwargs: Any,
 ) -> Video:
     """Refine a video using :ref:`refiners`.
 
+    With `max_workers` greater than 1, the independent refiners, found with :func:`refiner_graph`, run at the
+    same time in worker threads, e.g. the local metadata refiner runs while the online refiners wait for
+    the network. The threads are taken from `executor` if given, shared with the refining of other videos,
+    instead of a thread pool created for this video.
+
     .. note::
 
         Exceptions raised in refiners are silently passed and logged.
@@ -704,6 +2015,9 @@ def refine(
     :param Sequence refiners: refiners to select. None defaults to all refiners.
     :param dict refiner_configs: refiner configuration as keyword arguments per refiner name to pass when
         calling the refine method
+    :param int max_workers: maximum number of refiners running at the same time.
+    :param executor: thread pool running the refiners, used instead of `max_workers`.
+    :type executor: :class:`~concurrent.futures.Executor`
     :param kwargs: additional parameters for the :func:`~subliminal.refiners.refine` functions.
 
     """
@@ -713,13 +2027,131 @@ def refine(
     if isinstance(video, Episode):
         refiners = [r for r in refiners if r not in discarded_episode_refiners]
 
-    for refiner in refiners:
-        logger.info('Refining video with %s', refiner)
+    if len(refiners) <= 1 or (executor is None and max_workers <= 1):
+        for refiner in refiners:
+            _refine_with(video, refiner, refiner_configs, **kwargs)
+        return video
+
+    if executor is None:
+        with ThreadPoolExecutor(max_workers, thread_name_prefix='subliminal-refiner') as own_executor:
+            return refine(video, refiners=refiners, refiner_configs=refiner_configs, executor=own_executor, **kwargs)
+
+    pending = refiner_graph(refiners)
+    done: set[str] = set()
+    running: dict[Future, str] = {}
+    while pending or running:
+        # start the refiners that do not wait for other refiners anymore, in order
+        for refiner in [r for r, before in pending.items() if before <= done]:
+            del pending[refiner]
+            running[executor.submit(_refine_with, video, refiner, refiner_configs, **kwargs)] = refiner
+        finished, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in finished:
+            done.add(running.pop(future))
+    return video
+
+
+def series_key(video: Episode) -> tuple[str, int | None]:
+    """Key of the series of an episode, the episodes with the same key are refined with the same series lookups.
+
+    :param video: the episode.
+    :type video: :class:`~subliminal.video.Episode`
+    :return: the sanitized name of the series and its year.
+    :rtype: tuple of (str, int or None)
+
+    """
+    return sanitize(video.series), video.year
+
+
+#: Ids of the series found by the refiners, the refiners do not search the series of an episode with these ids
+series_id_attributes = ('series_tvdb_id', 'series_imdb_id', 'series_tmdb_id')
+
+
+def share_series(leader: Episode, episode: Episode) -> None:
+    """Set the series found by the refiners for the `leader` episode on another `episode` of the same series.
+
+    Nothing is set if no id of the series, see :data:`series_id_attributes`, was found for the `leader`.
+    The ids already set on `episode` are kept.
+
+    :param leader: the refined episode.
+    :type leader: :class:`~subliminal.video.Episode`
+    :param episode: the episode to refine.
+    :type episode: :class:`~subliminal.video.Episode`
+
+    """
+    if not any(getattr(leader, attribute) for attribute in series_id_attributes):
+        return
+
+    episode.series = leader.series
+    episode.original_series = leader.original_series
+    episode.alternative_series = list(leader.alternative_series)
+    episode.country = leader.country
+    episode.year = leader.year
+    for attribute in series_id_attributes:
+        if getattr(episode, attribute) is None:
+            setattr(episode, attribute, getattr(leader, attribute))
+
+
+def refine_many(
+    videos: Iterable[Video],
+    *,
+    max_videos: int = 4,
+    max_workers: int = 1,
+    **kwargs: Any,
+) -> list[Video]:
+    """Refine several videos with :func:`refine`, looking up each series once.
+
+    The episodes are grouped by :func:`series_key`. The first episode of each group is refined first, the other
+    episodes of the group start once it is done, with the series found for the first episode, see
+    :func:`share_series`: the online refiners do not search the series again for each episode.
+
+    With `max_workers` greater than 1, the refiners of all the videos share a single thread pool of
+    `max_workers` threads.
+
+    :param videos: the videos to refine.
+    :param int max_videos: maximum number of videos refined at the same time.
+    :param int max_workers: maximum number of refiners running at the same time, for all the videos.
+    :param kwargs: additional parameters for :func:`refine`.
+    :return: the refined videos, in the same order.
+    :rtype: list of :class:`~subliminal.video.Video`
+
+    """
+    videos = list(videos)
+    groups: dict[tuple[str, int | None], list[Episode]] = defaultdict(list)
+    others: list[Video] = []
+    for video in videos:
+        if isinstance(video, Episode) and video.series:
+            groups[series_key(video)].append(video)
+        else:
+            others.append(video)
+    logger.info('Refining %d videos with %d series', len(videos), len(groups))
+
+    def check_result(future: Future, video: Video) -> None:
         try:
-            refiner_manager[refiner].plugin(video, **dict((refiner_configs or {}).get(refiner, {}), **kwargs))
+            future.result()
         except Exception as e:  # noqa: BLE001
             handle_exception(e, f'Failed to refine video {video.name!r}')
-    return video
+
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers, thread_name_prefix='subliminal-refiner') as refiner_executor:
+            return refine_many(videos, max_videos=max_videos, executor=refiner_executor, **kwargs)
+
+    with ThreadPoolExecutor(max_videos, thread_name_prefix='subliminal-refine') as executor:
+        # the first episode of each series, then the other videos
+        leaders = {executor.submit(refine, group[0], **kwargs): group for group in groups.values()}
+        followers = {executor.submit(refine, video, **kwargs): video for video in others}
+
+        # the other episodes of a series, once the series was looked up
+        for future in as_completed(leaders):
+            group = leaders[future]
+            check_result(future, group[0])
+            for video in group[1:]:
+                share_series(group[0], video)
+            followers.update({executor.submit(refine, video, **kwargs): video for video in group[1:]})
+
+        for future in as_completed(followers):
+            check_result(future, followers[future])
+
+    return videos
 
 
 def list_subtitles(
@@ -769,6 +2201,43 @@ def list_subtitles(
     return listed_subtitles
 
 
+def iter_subtitles(
+    videos: Iterable[Video],
+    languages: Set[Language],
+    *,
+    pool_class: type[ProviderPool] = ProviderPool,
+    until: Callable[[Video, Sequence[Subtitle]], bool] | None = None,
+    **kwargs: Any,
+) -> Iterator[tuple[Video, Subtitle]]:
+    """List subtitles, yielding the subtitles as soon as a provider answers.
+
+    The `videos` must pass the `languages` check of :func:`check_video`.
+
+    :param videos: videos to list subtitles for.
+    :type videos: iterable of :class:`~subliminal.video.Video`
+    :param languages: languages to search for.
+    :type languages: set of :class:`~babelfish.language.Language`
+    :param pool_class: class to use as provider pool.
+    :type pool_class: :class:`ProviderPool`, :class:`AsyncProviderPool` or similar
+    :param until: predicate called with a video and all the subtitles found so far for this video,
+        after each provider answers. The listing stops for this video when it returns `True`.
+    :param kwargs: additional parameters for the provided `pool_class` constructor.
+    :return: the videos and the found subtitles.
+    :rtype: iterator of tuple of :class:`~subliminal.video.Video` and :class:`~subliminal.subtitle.Subtitle`
+
+    """
+    with pool_class(**kwargs) as pool:
+        for video in videos:
+            if not check_video(video, languages=languages):
+                logger.info('Skipping video %r', video)
+                continue
+
+            logger.info('Listing subtitles for %r', video)
+            video_until = functools.partial(until, video) if until is not None else None
+            for subtitle in pool.iter_subtitles(video, languages - video.subtitle_languages, until=video_until):
+                yield video, subtitle
+
+
 def download_subtitles(
     subtitles: Sequence[Subtitle],
     *,
@@ -800,6 +2269,9 @@ def download_best_subtitles(
     skip_wrong_fps: bool = False,
     only_one: bool = False,
     compute_score: ComputeScore | None = None,
+    concurrent_downloads: bool = False,
+    speculative: bool = False,
+    stop_on_hash_match: bool = False,
     pool_class: type[ProviderPool] = ProviderPool,
     **kwargs: Any,
 ) -> dict[Video, list[Subtitle]]:
@@ -818,6 +2290,10 @@ def download_best_subtitles(
     :param bool only_one: download only one subtitle, not one per language.
     :param compute_score: function that takes `subtitle` and `video` as positional arguments,
         `hearing_impaired` as keyword argument and returns the score.
+    :param bool concurrent_downloads: download the subtitles of different languages concurrently.
+    :param bool speculative: with `concurrent_downloads`, also download the next best subtitle in advance.
+    :param bool stop_on_hash_match: stop querying the providers for a video once a subtitle matching the video hash
+        is found for every language.
     :param pool_class: class to use as provider pool.
     :type pool_class: :class:`ProviderPool`, :class:`AsyncProviderPool` or similar
     :param kwargs: additional parameters for the provided `pool_class` constructor.
@@ -841,20 +2317,19 @@ def download_best_subtitles(
 
     # download best subtitles
     with pool_class(**kwargs) as pool:
-        for video in checked_videos:
-            logger.info('Downloading best subtitles for %r', video)
-            subtitles = pool.download_best_subtitles(
-                pool.list_subtitles(video, languages - video.subtitle_languages),
-                video,
-                languages,
-                min_score=min_score,
-                hearing_impaired=hearing_impaired,
-                foreign_only=foreign_only,
-                skip_wrong_fps=skip_wrong_fps,
-                only_one=only_one,
-                compute_score=compute_score,
-            )
-            logger.info('Downloaded %d subtitle(s)', len(subtitles))
+        for video, subtitles in pool.iter_download_best_subtitles(
+            checked_videos,
+            languages,
+            min_score=min_score,
+            hearing_impaired=hearing_impaired,
+            foreign_only=foreign_only,
+            skip_wrong_fps=skip_wrong_fps,
+            only_one=only_one,
+            compute_score=compute_score,
+            concurrent_downloads=concurrent_downloads,
+            speculative=speculative,
+            stop_on_hash_match=stop_on_hash_match,
+        ):
             downloaded_subtitles[video].extend(subtitles)
 
     return downloaded_subtitles
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import re
 from importlib.metadata import EntryPoint
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from stevedore import ExtensionManager  # type: ignore[import-untyped]
 
@@ -173,3 +173,120 @@ discarded_movie_refiners: list[str] = ['tvdb']
 
 #: Discarded Episode refiners
 discarded_episode_refiners: list[str] = []
+
+
+class RefinerFields(NamedTuple):
+    """Attributes of the :class:`~subliminal.video.Video` read and written by a refiner.
+
+    The refiners that do not read or write the attributes written by each other are independent,
+    they can run at the same time.
+    """
+
+    #: Attributes of the video read by the refiner
+    inputs: frozenset[str]
+
+    #: Attributes of the video written by the refiner
+    outputs: frozenset[str]
+
+
+#: Attributes read and written by each refiner, the refiners not in this dict are never run with other refiners
+refiner_fields: dict[str, RefinerFields] = {
+    'hash': RefinerFields(
+        inputs=frozenset({'name', 'size'}),
+        outputs=frozenset({'hashes'}),
+    ),
+    'metadata': RefinerFields(
+        inputs=frozenset({'name'}),
+        outputs=frozenset({'duration', 'resolution', 'frame_rate', 'video_codec', 'audio_codec', 'subtitles'}),
+    ),
+    'omdb': RefinerFields(
+        inputs=frozenset({'series', 'original_series', 'title', 'year', 'series_imdb_id', 'imdb_id'}),
+        outputs=frozenset({'series', 'title', 'year', 'series_imdb_id', 'imdb_id'}),
+    ),
+    'tvdb': RefinerFields(
+        inputs=frozenset(
+            {
+                'series',
+                'alternative_series',
+                'original_series',
+                'country',
+                'year',
+                'season',
+                'episode',
+                'title',
+                'series_imdb_id',
+                'imdb_id',
+                'series_tvdb_id',
+                'tvdb_id',
+            }
+        ),
+        outputs=frozenset(
+            {
+                'series',
+                'alternative_series',
+                'original_series',
+                'country',
+                'year',
+                'title',
+                'series_imdb_id',
+                'imdb_id',
+                'series_tvdb_id',
+                'tvdb_id',
+            }
+        ),
+    ),
+    'tmdb': RefinerFields(
+        inputs=frozenset(
+            {
+                'series',
+                'alternative_series',
+                'title',
+                'alternative_titles',
+                'country',
+                'year',
+                'season',
+                'episode',
+                'series_imdb_id',
+                'imdb_id',
+                'series_tmdb_id',
+                'tmdb_id',
+                'series_tvdb_id',
+                'tvdb_id',
+            }
+        ),
+        outputs=frozenset(
+            {
+                'series',
+                'alternative_series',
+                'title',
+                'alternative_titles',
+                'year',
+                'series_imdb_id',
+                'imdb_id',
+                'series_tmdb_id',
+                'tmdb_id',
+                'series_tvdb_id',
+                'tvdb_id',
+            }
+        ),
+    ),
+}
+
+
+def refiners_conflict(first: str, second: str) -> bool:
+    """Whether two refiners must run one after the other, in their order.
+
+    :param str first: the name of the refiner running first.
+    :param str second: the name of the refiner running second.
+    :return: True if a refiner writes an attribute read or written by the other, or if their attributes are unknown.
+    :rtype: bool
+
+    """
+    first_fields = refiner_fields.get(first)
+    second_fields = refiner_fields.get(second)
+    if first_fields is None or second_fields is None:
+        return True
+    return bool(
+        first_fields.outputs & (second_fields.inputs | second_fields.outputs)
+        or first_fields.inputs & second_fields.outputs
+    )
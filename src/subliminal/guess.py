@@ -0,0 +1,145 @@
+"""Cached calls to guessit, the same names are guessed many times when scanning videos and matching subtitles."""
+
+from __future__ import annotations
+
+import copy
+import logging
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from dogpile.cache.api import NO_VALUE
+from guessit import __version__ as guessit_version  # type: ignore[import-untyped]
+from guessit import guessit as _guessit  # type: ignore[import-untyped]
+
+from .cache import GUESS_EXPIRATION_TIME, region
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+logger = logging.getLogger(__name__)
+
+#: Default maximum number of guesses kept in memory
+DEFAULT_GUESS_CACHE_SIZE = 4096
+
+
+class GuessCache:
+    """Cache of guessit results, with a bounded LRU in memory and an optional persistent tier.
+
+    The results are keyed by the guessed string and the guessit options. The persistent tier uses the
+    subliminal cache :data:`~subliminal.cache.region`, if it is configured, and is keyed by the guessit version too.
+
+    The cached results are copied when they are returned, so they can be modified by the caller.
+
+    :param int maxsize: maximum number of guesses kept in memory, 0 to disable the memory cache.
+    :param bool persistent: also store the guesses in the subliminal cache region.
+
+    """
+
+    #: Maximum number of guesses kept in memory
+    maxsize: int
+
+    #: Also store the guesses in the subliminal cache region
+    persistent: bool
+
+    #: Number of guesses found in memory
+    hits: int
+
+    #: Number of guesses found in the persistent tier
+    persistent_hits: int
+
+    #: Number of calls to guessit
+    misses: int
+
+    def __init__(self, maxsize: int = DEFAULT_GUESS_CACHE_SIZE, *, persistent: bool = False) -> None:
+        self.maxsize = maxsize
+        self.persistent = persistent
+        self.hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+        self._cache: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _options_key(options: Mapping[str, Any] | None) -> str:
+        return repr(sorted(options.items())) if options else ''
+
+    def guess(self, string: str, options: Mapping[str, Any] | None = None) -> dict[str, Any]:
+        """Guess the properties of `string` with guessit, or take them from the cache.
+
+        :param str string: the name to guess.
+        :param options: the guessit options.
+        :return: the guessed properties.
+        :rtype: dict
+
+        """
+        key = (string, self._options_key(options))
+        with self._lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(result)
+
+        persistent_key = f'guessit:{guessit_version}:{key[0]}:{key[1]}'
+        use_region = self.persistent and region.is_configured
+        cached = region.get(persistent_key, expiration_time=GUESS_EXPIRATION_TIME) if use_region else NO_VALUE
+        if cached is not NO_VALUE:
+            result = cached
+            with self._lock:
+                self.persistent_hits += 1
+        else:
+            result = dict(_guessit(string, dict(options) if options else None))
+            with self._lock:
+                self.misses += 1
+            if use_region:
+                region.set(persistent_key, result)
+
+        if self.maxsize > 0:
+            with self._lock:
+                self._cache[key] = result
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+        return copy.deepcopy(result)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of the guesses taken from the memory or persistent cache."""
+        total = self.hits + self.persistent_hits + self.misses
+        return (self.hits + self.persistent_hits) / total if total else 0.0
+
+    def summary(self) -> str:
+        """Short description of the cache usage, for reporting."""
+        return (
+            f'{self.hits + self.persistent_hits + self.misses} guesses, {self.hit_rate:.0%} hit rate '
+            f'({self.hits} in memory, {self.persistent_hits} persistent, {self.misses} guessit calls)'
+        )
+
+    def clear(self) -> None:
+        """Clear the memory cache and the statistics."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.persistent_hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} [{len(self)}/{self.maxsize}]>'
+
+
+#: Cache used by :func:`guessit`
+guess_cache = GuessCache()
+
+
+def guessit(string: str, options: Mapping[str, Any] | None = None) -> dict[str, Any]:
+    """Guess the properties of `string` with guessit, using the :data:`guess_cache`.
+
+    :param str string: the name to guess.
+    :param options: the guessit options.
+    :return: the guessed properties.
+    :rtype: dict
+
+    """
+    return guess_cache.guess(string, options)
@@ -0,0 +1,299 @@
+"""Hash algorithms of the video files, used by the hash refiner and the providers.
+
+The OpenSubtitles hash, also used by BSPlayer, is the file size plus the sum of the 64-bit little-endian words of
+the first and last 64 KiB of the file. Each block is read in one call and summed in bulk, with
+`NumPy <https://numpy.org/>`_ if it is installed, otherwise with a :class:`memoryview` cast to 64-bit integers.
+
+Each algorithm of :data:`hash_algorithms` declares the byte ranges of the file it needs, so :func:`compute_hashes`
+reads the union of the ranges once and computes all the hashes from the same buffers. The ranges are mapped in memory
+with :mod:`mmap` when possible, so the data is hashed from the page cache without being copied.
+"""
+
+from __future__ import annotations
+
+import array
+import bisect
+import hashlib
+import logging
+import mmap
+import os
+import sys
+from contextlib import ExitStack
+from importlib.util import find_spec
+from stat import S_ISREG
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+    from io import BufferedReader
+
+# Check if numpy is installed, it is optional
+WITH_NUMPY = find_spec('numpy') is not None
+
+if WITH_NUMPY:  # pragma: no cover
+    import numpy as np  # type: ignore[import-not-found,unused-ignore]
+
+logger = logging.getLogger(__name__)
+
+#: Size of the blocks read at the beginning and at the end of the file for the OpenSubtitles hash
+OPENSUBTITLES_BLOCK_SIZE = 65536
+
+#: Size of the beginning of the file used for the NapiProjekt hash
+NAPIPROJEKT_READ_SIZE = 1024 * 1024 * 10
+
+#: Mask to keep the sums as 64-bit integers
+UINT64_MASK = 0xFFFFFFFFFFFFFFFF
+
+
+def sum_uint64_python(data: bytes | memoryview) -> int:
+    """Sum the 64-bit little-endian unsigned words of `data`, modulo 2**64, without NumPy.
+
+    :param data: the bytes, with a length multiple of 8.
+    :return: the sum.
+    :rtype: int
+
+    """
+    if sys.byteorder == 'little':
+        return sum(memoryview(data).cast('B').cast('Q')) & UINT64_MASK
+    words = array.array('Q', bytes(data))  # pragma: no cover
+    words.byteswap()  # pragma: no cover
+    return sum(words) & UINT64_MASK  # pragma: no cover
+
+
+def sum_uint64_numpy(data: bytes | memoryview) -> int:  # pragma: no cover
+    """Sum the 64-bit little-endian unsigned words of `data`, modulo 2**64, with NumPy.
+
+    :param data: the bytes, with a length multiple of 8.
+    :return: the sum.
+    :rtype: int
+
+    """
+    # the unsigned sum wraps around, as the modulo 2**64
+    return int(np.frombuffer(data, dtype='<u8').sum(dtype=np.uint64))
+
+
+#: Sum of the 64-bit words of a block, with the fastest available implementation
+sum_uint64 = sum_uint64_numpy if WITH_NUMPY else sum_uint64_python
+
+
+def opensubtitles_hash_from_blocks(filesize: int, head: bytes | memoryview, tail: bytes | memoryview) -> str:
+    """Compute the OpenSubtitles hash from the first and last blocks of a file.
+
+    :param int filesize: size of the file.
+    :param head: the first :data:`OPENSUBTITLES_BLOCK_SIZE` bytes of the file.
+    :param tail: the last :data:`OPENSUBTITLES_BLOCK_SIZE` bytes of the file.
+    :return: the hash, as 16 hexadecimal digits.
+    :rtype: str
+
+    """
+    filehash = (filesize + sum_uint64(head) + sum_uint64(tail)) & UINT64_MASK
+    return f'{filehash:016x}'
+
+
+def hash_opensubtitles(video_path: str | os.PathLike) -> str | None:
+    """Compute a hash using OpenSubtitles' algorithm.
+
+    :param (str | os.PathLike) video_path: path of the video.
+    :return: the hash, None if the file is too small.
+    :rtype: str
+
+    """
+    return compute_hashes(video_path, ['opensubtitles']).get('opensubtitles')
+
+
+class HashAlgorithm(NamedTuple):
+    """Hash algorithm of a video file, computed from some byte ranges of the file."""
+
+    #: Byte ranges needed to compute the hash, as (offset, size) tuples, from the size of the file.
+    #: None if the file cannot be hashed
+    ranges: Callable[[int], list[tuple[int, int]] | None]
+
+    #: Compute the hash from the size of the file and the data of the ranges, in the same order
+    digest: Callable[[int, Sequence[memoryview]], str]
+
+
+def _opensubtitles_ranges(filesize: int) -> list[tuple[int, int]] | None:
+    if filesize < OPENSUBTITLES_BLOCK_SIZE * 2:
+        return None
+    return [(0, OPENSUBTITLES_BLOCK_SIZE), (filesize - OPENSUBTITLES_BLOCK_SIZE, OPENSUBTITLES_BLOCK_SIZE)]
+
+
+def _opensubtitles_digest(filesize: int, blocks: Sequence[memoryview]) -> str:
+    return opensubtitles_hash_from_blocks(filesize, blocks[0], blocks[1])
+
+
+def _napiprojekt_ranges(filesize: int) -> list[tuple[int, int]] | None:
+    return [(0, min(filesize, NAPIPROJEKT_READ_SIZE))]
+
+
+def _napiprojekt_digest(filesize: int, blocks: Sequence[memoryview]) -> str:
+    return hashlib.md5(blocks[0]).hexdigest()  # noqa: S324
+
+
+#: Hash algorithms by name, a provider declares the algorithm of its hash with
+#: :attr:`~subliminal.providers.Provider.hash_algorithm`
+hash_algorithms: dict[str, HashAlgorithm] = {
+    'opensubtitles': HashAlgorithm(_opensubtitles_ranges, _opensubtitles_digest),
+    'napiprojekt': HashAlgorithm(_napiprojekt_ranges, _napiprojekt_digest),
+}
+
+
+def merge_ranges(ranges: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Merge the overlapping or contiguous byte ranges.
+
+    :param ranges: the byte ranges, as (offset, size) tuples.
+    :return: the sorted and merged byte ranges.
+    :rtype: list of tuple of (int, int)
+
+    """
+    merged: list[tuple[int, int]] = []
+    for offset, size in sorted(ranges):
+        if merged and offset <= merged[-1][0] + merged[-1][1]:
+            last_offset, last_size = merged[-1]
+            merged[-1] = (last_offset, max(last_size, offset + size - last_offset))
+        else:
+            merged.append((offset, size))
+    return merged
+
+
+class HashPlan:
+    """Byte ranges to read from a file to compute several hashes, each range being read once.
+
+    :param int filesize: size of the file.
+    :param algorithms: names of the algorithms in :data:`hash_algorithms`, the duplicates are ignored.
+
+    """
+
+    #: Size of the file
+    filesize: int
+
+    #: Byte ranges needed by each algorithm, the algorithms that cannot hash the file are not included
+    ranges: dict[str, list[tuple[int, int]]]
+
+    #: Merged byte ranges to read
+    reads: list[tuple[int, int]]
+
+    def __init__(self, filesize: int, algorithms: Iterable[str]) -> None:
+        self.filesize = filesize
+        self.ranges = {}
+        for name in dict.fromkeys(algorithms):
+            ranges = hash_algorithms[name].ranges(filesize)
+            if ranges is not None:
+                self.ranges[name] = ranges
+        self.reads = merge_ranges(r for ranges in self.ranges.values() for r in ranges)
+
+    def digest(self, buffers: Sequence[bytes | memoryview]) -> dict[str, str]:
+        """Compute the hashes from the data of the :attr:`reads`, without copying it.
+
+        :param buffers: the data of each range of :attr:`reads`, in the same order.
+        :return: the hashes, by algorithm name.
+        :rtype: dict[str, str]
+
+        """
+        views = [memoryview(b) for b in buffers]
+        offsets = [offset for offset, _ in self.reads]
+        hashes = {}
+        for name, ranges in self.ranges.items():
+            blocks = []
+            for offset, size in ranges:
+                i = bisect.bisect_right(offsets, offset) - 1
+                start = offset - offsets[i]
+                blocks.append(views[i][start : start + size])
+            hashes[name] = hash_algorithms[name].digest(self.filesize, blocks)
+        return hashes
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} [{", ".join(self.ranges)}] {len(self.reads)} reads>'
+
+
+def map_ranges(f: BufferedReader, reads: Sequence[tuple[int, int]], stack: ExitStack) -> tuple[list[memoryview], int]:
+    """Map the byte ranges of a file in memory, without copying the data.
+
+    The maps are closed when `stack` is closed, the views must not be used after that.
+
+    :param f: the file, opened in binary mode.
+    :param reads: the byte ranges, as (offset, size) tuples.
+    :param stack: the stack closing the maps.
+    :return: a view on the data of each range and the number of bytes mapped.
+    :rtype: tuple of (list of memoryview, int)
+    :raises: :class:`OSError` or :class:`ValueError`: the file cannot be mapped.
+
+    """
+    views = []
+    mapped = 0
+    for offset, size in reads:
+        # the offset of a map must be a multiple of the allocation granularity
+        start = offset % mmap.ALLOCATIONGRANULARITY
+        mapping = mmap.mmap(f.fileno(), start + size, offset=offset - start, access=mmap.ACCESS_READ)
+        stack.callback(mapping.close)
+        view = memoryview(mapping)[start : start + size]
+        stack.callback(view.release)
+        views.append(view)
+        mapped += start + size
+    return views, mapped
+
+
+def compute_hashes(
+    video_path: str | os.PathLike,
+    algorithms: Iterable[str],
+    *,
+    use_mmap: bool = True,
+) -> dict[str, str]:
+    """Compute several hashes of a video, reading each needed byte range once.
+
+    The byte ranges are mapped in memory with :func:`map_ranges`, falling back to buffered reads if the file
+    does not support it, e.g. a file on some network filesystems. Only the regular files are hashed, the size
+    of a pipe or a device is unknown.
+
+    :param (str | os.PathLike) video_path: path of the video.
+    :param algorithms: names of the algorithms in :data:`hash_algorithms`.
+    :param bool use_mmap: map the byte ranges in memory instead of reading them.
+    :return: the hashes, by algorithm name, without the algorithms that cannot hash the file.
+    :rtype: dict[str, str]
+
+    """
+    # check before opening the file, opening a pipe blocks until it is written to
+    file_stat = os.stat(video_path)
+    if not S_ISREG(file_stat.st_mode):
+        logger.debug('Not hashing %r, it is not a regular file', os.fspath(video_path))
+        return {}
+
+    plan = HashPlan(file_stat.st_size, algorithms)
+    if not plan.reads:
+        return {}
+
+    # estimate of the system calls for the debug logs: stat, open, close and two by range (map or seek and read)
+    syscalls = 3 + 2 * len(plan.reads)
+    with open(video_path, 'rb') as f:
+        if use_mmap:
+            try:
+                with ExitStack() as stack:
+                    views, mapped = map_ranges(f, plan.reads, stack)
+                    hashes = plan.digest(views)
+                    del views
+            except (OSError, ValueError) as e:
+                logger.debug('Cannot map %r in memory, reading it instead: %s', os.fspath(video_path), e)
+            else:
+                logger.debug(
+                    'Hashed %r with %d mapped ranges (peak memory of %d bytes mapped, about %d system calls) for %s',
+                    os.fspath(video_path),
+                    len(plan.reads),
+                    mapped,
+                    syscalls,
+                    ', '.join(plan.ranges),
+                )
+                return hashes
+
+        buffers = []
+        for offset, size in plan.reads:
+            f.seek(offset)
+            buffers.append(f.read(size))
+    logger.debug(
+        'Hashed %r with %d reads (peak memory of %d bytes copied, about %d system calls) for %s',
+        os.fspath(video_path),
+        len(plan.reads),
+        sum(len(b) for b in buffers),
+        syscalls,
+        ', '.join(plan.ranges),
+    )
+    return plan.digest(buffers)
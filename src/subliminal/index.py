@@ -0,0 +1,328 @@
+"""Persistent index of the scanned videos, to skip scanning and refining the videos that did not change."""
+
+from __future__ import annotations
+
+import contextlib
+import copy
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
+from babelfish import Language  # type: ignore[import-untyped]
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from types import TracebackType
+
+    from subliminal.video import Video
+
+logger = logging.getLogger(__name__)
+
+#: Version of the database schema, the index is cleared when it changes
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS videos (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    refined INTEGER NOT NULL,
+    refiners TEXT NOT NULL,
+    providers TEXT NOT NULL,
+    updated REAL NOT NULL,
+    video BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS subtitle_languages (
+    path TEXT NOT NULL REFERENCES videos (path) ON DELETE CASCADE,
+    language TEXT NOT NULL,
+    PRIMARY KEY (path, language)
+);
+CREATE INDEX IF NOT EXISTS subtitle_languages_language ON subtitle_languages (language);
+"""
+
+
+class IndexEntry(NamedTuple):
+    """Video found in the :class:`LibraryIndex`."""
+
+    #: The indexed video, without its external subtitles
+    video: Video
+
+    #: Whether the video was refined before being indexed
+    refined: bool
+
+    #: Refiners used to refine the video
+    refiners: tuple[str, ...] = ()
+
+    #: Sorted providers used to refine the video, the hashes depend on them
+    providers: tuple[str, ...] = ()
+
+    def is_refined(self, refiners: Iterable[str], providers: Iterable[str]) -> bool:
+        """Whether the video was refined with these `refiners` and `providers`.
+
+        A video refined with other refiners or providers can miss some information or hashes, it must be refined again.
+
+        :param refiners: the refiners to use.
+        :param providers: the providers to use.
+        :rtype: bool
+
+        """
+        return self.refined and self.refiners == tuple(refiners) and self.providers == tuple(sorted(providers))
+
+
+def _split_names(names: str) -> tuple[str, ...]:
+    """Split comma-separated extension names, as stored in the index."""
+    return tuple(names.split(',')) if names else ()
+
+
+def file_key(path: str | os.PathLike) -> tuple[int, int, int] | None:
+    """Identity of the content of a file, to detect the changes.
+
+    :param str path: path of the file.
+    :return: the size, the modification time in nanoseconds and the inode of the file, None if it does not exist.
+    :rtype: tuple of int or None
+
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+
+class LibraryIndex:
+    """Persistent index of the scanned videos, in a SQLite database.
+
+    The videos are indexed by absolute path, with the size, the modification time and the inode of the file:
+    a video is only returned by :meth:`get` if the file did not change since it was indexed. The index
+    also records the languages of the known subtitles of each video, and :meth:`missing_languages` finds
+    the videos lacking some languages without accessing the files.
+
+    The external subtitles are not stored with the video, as they can change without the video changing,
+    they must be searched again with :func:`~subliminal.core.search_external_subtitles`.
+
+    The changes are written to the database with :meth:`commit`, and on closing the index.
+
+    :param str filename: path of the database file, ``':memory:'`` for an in-memory index.
+
+    """
+
+    #: Path of the database file
+    filename: str
+
+    def __init__(self, filename: str | os.PathLike = ':memory:') -> None:
+        self.filename = os.fspath(filename)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.filename, check_same_thread=False)
+        self._connection.execute('PRAGMA foreign_keys = ON')
+        if self.filename != ':memory:':
+            self._connection.execute('PRAGMA journal_mode = WAL')
+            self._connection.execute('PRAGMA synchronous = NORMAL')
+
+        (version,) = self._connection.execute('PRAGMA user_version').fetchone()
+        if version != SCHEMA_VERSION:
+            if version:
+                logger.info('Index schema changed from version %d to %d, clearing the index', version, SCHEMA_VERSION)
+            self._connection.executescript(
+                f'DROP TABLE IF EXISTS subtitle_languages; DROP TABLE IF EXISTS videos; '
+                f'PRAGMA user_version = {SCHEMA_VERSION};'
+            )
+        self._connection.executescript(SCHEMA)
+        self._connection.commit()
+
+    @staticmethod
+    def _key(path: str | os.PathLike) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+    def get(self, path: str | os.PathLike) -> IndexEntry | None:
+        """Get the indexed video at `path`, if the file did not change since it was indexed.
+
+        :param str path: path of the video.
+        :return: the indexed video, with `path` as name, or None if not indexed or changed.
+        :rtype: :class:`IndexEntry` or None
+
+        """
+        key = file_key(path)
+        if key is None:
+            return None
+
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT size, mtime_ns, inode, refined, refiners, providers, video FROM videos WHERE path = ?',
+                (self._key(path),),
+            ).fetchone()
+        if row is None or tuple(row[:3]) != key:
+            return None
+
+        try:
+            # the database is only written by subliminal, in the user cache directory
+            video = pickle.loads(row[6])  # noqa: S301
+        except Exception:  # noqa: BLE001
+            logger.warning('Could not load the indexed video %r', os.fspath(path))
+            return None
+
+        # the same file can be reached with another path, relative or absolute
+        name = os.fspath(path)
+        if video.name != name:
+            video = video.with_name(name)
+
+        return IndexEntry(video, bool(row[3]), _split_names(row[4]), _split_names(row[5]))
+
+    def add(
+        self,
+        video: Video,
+        *,
+        refined: bool = False,
+        refiners: Iterable[str] = (),
+        providers: Iterable[str] = (),
+    ) -> None:
+        """Add or replace a video in the index, with the languages of its subtitles.
+
+        :param video: the video, the file must exist.
+        :type video: :class:`~subliminal.video.Video`
+        :param bool refined: whether the video was refined.
+        :param refiners: the refiners used to refine the video.
+        :param providers: the providers used to refine the video.
+
+        """
+        key = file_key(video.name)
+        if key is None:
+            logger.debug('Not indexing non-existing video %r', video.name)
+            return
+
+        # do not store the external subtitles
+        stored_video = copy.copy(video)
+        stored_video.subtitles = [s for s in video.subtitles if s.embedded]
+        data = pickle.dumps(stored_video, protocol=pickle.HIGHEST_PROTOCOL)
+
+        path = self._key(video.name)
+        with self._lock:
+            self._connection.execute('DELETE FROM subtitle_languages WHERE path = ?', (path,))
+            self._connection.execute(
+                'INSERT OR REPLACE INTO videos '
+                '(path, size, mtime_ns, inode, refined, refiners, providers, updated, video) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (path, *key, int(refined), ','.join(refiners), ','.join(sorted(providers)), time.time(), data),
+            )
+            self._add_languages(path, video.subtitle_languages)
+
+    def add_subtitle_languages(self, path: str | os.PathLike, languages: Iterable[Language]) -> None:
+        """Record new subtitle languages for an indexed video, e.g. after saving subtitles.
+
+        :param str path: path of the video.
+        :param languages: languages of the subtitles.
+
+        """
+        with self._lock:
+            self._add_languages(self._key(path), languages)
+
+    def _add_languages(self, path: str, languages: Iterable[Language]) -> None:
+        """Record subtitle languages, with the lock held."""
+        with contextlib.suppress(sqlite3.IntegrityError):
+            self._connection.executemany(
+                'INSERT OR IGNORE INTO subtitle_languages (path, language) VALUES (?, ?)',
+                [(path, str(language)) for language in set(languages)],
+            )
+
+    def subtitle_languages(self, path: str | os.PathLike) -> set[Language]:
+        """Languages of the known subtitles of an indexed video.
+
+        :param str path: path of the video.
+        :rtype: set of :class:`~babelfish.language.Language`
+
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT language FROM subtitle_languages WHERE path = ?',
+                (self._key(path),),
+            ).fetchall()
+        return {Language.fromietf(language) for (language,) in rows}
+
+    def missing_languages(
+        self,
+        languages: Iterable[Language],
+        *,
+        prefix: str | os.PathLike | None = None,
+    ) -> dict[str, set[Language]]:
+        """Find the indexed videos lacking subtitles in some `languages`, only from the index.
+
+        :param languages: the wanted languages.
+        :param (str | None) prefix: only consider the videos in this directory.
+        :return: the missing languages, by absolute path of the video.
+        :rtype: dict[str, set[:class:`~babelfish.language.Language`]]
+
+        """
+        query = 'SELECT path FROM videos WHERE path NOT IN (SELECT path FROM subtitle_languages WHERE language = ?)'
+        parameters: tuple[int | str, ...] = ()
+        if prefix is not None:
+            query += ' AND substr(path, 1, ?) = ?'
+            directory = os.path.join(self._key(prefix), '')
+            parameters = (len(directory), directory)
+
+        missing: dict[str, set[Language]] = {}
+        with self._lock:
+            for language in languages:
+                for (path,) in self._connection.execute(query, (str(language), *parameters)):
+                    missing.setdefault(path, set()).add(language)
+        return missing
+
+    def remove(self, paths: Sequence[str | os.PathLike]) -> None:
+        """Remove videos from the index.
+
+        :param paths: paths of the videos.
+
+        """
+        with self._lock:
+            self._connection.executemany('DELETE FROM videos WHERE path = ?', [(self._key(p),) for p in paths])
+
+    def prune(self) -> int:
+        """Remove the videos that do not exist anymore from the index.
+
+        :return: the number of removed videos.
+        :rtype: int
+
+        """
+        with self._lock:
+            paths = [path for (path,) in self._connection.execute('SELECT path FROM videos')]
+        removed = [path for path in paths if not os.path.exists(path)]
+        self.remove(removed)
+        return len(removed)
+
+    def clear(self) -> None:
+        """Remove all the videos from the index."""
+        with self._lock:
+            self._connection.execute('DELETE FROM videos')
+
+    def commit(self) -> None:
+        """Write the changes to the database."""
+        with self._lock:
+            self._connection.commit()
+
+    def close(self) -> None:
+        """Write the changes and close the database."""
+        self.commit()
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute('SELECT COUNT(*) FROM videos').fetchone()
+        return int(count)
+
+    def __enter__(self) -> LibraryIndex:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} [{self.filename!r}]>'
@@ -0,0 +1,94 @@
+"""Metrics about the requests to the providers."""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+#: Default upper bounds of the buckets of a :class:`LatencyHistogram`, in seconds
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60)
+
+
+class LatencyHistogram:
+    """Histogram of request durations, with fixed buckets.
+
+    A duration is counted in the first bucket with an upper bound greater or equal to the duration,
+    the durations greater than the last bound are counted in an extra bucket.
+
+    :param buckets: sorted upper bounds of the buckets, in seconds.
+
+    """
+
+    #: Upper bounds of the buckets, in seconds
+    buckets: tuple[float, ...]
+
+    #: Number of durations per bucket, with an extra bucket for the durations above the last bound
+    counts: list[int]
+
+    #: Number of recorded durations
+    count: int
+
+    #: Sum of the recorded durations, in seconds
+    total: float
+
+    #: Maximum recorded duration, in seconds
+    maximum: float
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        if list(buckets) != sorted(buckets):
+            msg = f'buckets must be sorted, got {buckets!r}'
+            raise ValueError(msg)
+
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, duration: float) -> None:
+        """Record a duration, in seconds."""
+        with self._lock:
+            self.counts[bisect.bisect_left(self.buckets, duration)] += 1
+            self.count += 1
+            self.total += duration
+            self.maximum = max(self.maximum, duration)
+
+    @property
+    def mean(self) -> float:
+        """Mean of the recorded durations, in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile of the recorded durations, as the upper bound of the bucket containing it.
+
+        :param float q: the quantile, between 0 and 1.
+        :return: the estimated quantile in seconds, the maximum duration if it is above the last bound.
+        :rtype: float
+
+        """
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = max(math.ceil(q * self.count), 1)
+            cumulative = 0
+            for i, bucket_count in enumerate(self.counts):
+                cumulative += bucket_count
+                if cumulative >= rank:
+                    return self.buckets[i] if i < len(self.buckets) else self.maximum
+            return self.maximum  # pragma: no cover
+
+    def summary(self) -> str:
+        """Short description of the distribution of the durations, for reporting."""
+        return (
+            f'{self.count} requests, mean {self.mean:.2f}s, p50 <= {self.quantile(0.5):.2f}s, '
+            f'p90 <= {self.quantile(0.9):.2f}s, p99 <= {self.quantile(0.99):.2f}s, max {self.maximum:.2f}s'
+        )
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} [{self.count} requests]>'
@@ -4,20 +4,27 @@ Providers list and download subtitles for a :class:`~subliminal.video.Video` obj
 A Provider is a ContextManager with ``__enter__`` and ``__exit__`` methods and
 two public methods: :meth:`~subliminal.providers.Provider.list_subtitles` and
 :meth:`~subliminal.providers.Provider.download_subtitle`.
+
+An :class:`~subliminal.providers.AsyncProvider` additionally exposes these methods as :mod:`asyncio` coroutines.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import socket
 import ssl
+import threading
 from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar
 from xmlrpc.client import SafeTransport
 
 # Do not put babelfish in a TYPE_CHECKING block for intersphinx to work properly
 from babelfish import Language  # type: ignore[import-untyped]  # noqa: TC002
 from bs4 import BeautifulSoup, FeatureNotFound
-from requests import adapters
+from requests import Session, adapters
 from urllib3 import poolmanager  # type: ignore[import-untyped]
+from urllib3.connection import HTTPConnection  # type: ignore[import-untyped]
+from urllib3.util import Retry  # type: ignore[import-untyped]
 
 from subliminal import __short_version__
 from subliminal.subtitle import Subtitle
@@ -25,7 +32,8 @@ from subliminal.video import Episode, Movie, Video
 
 if TYPE_CHECKING:
     import os
-    from collections.abc import Sequence, Set
+    from collections.abc import Callable, Coroutine, Mapping, Sequence, Set
+    from concurrent.futures import Executor
     from http.client import HTTPSConnection
     from types import TracebackType
     from typing import Self
@@ -82,6 +90,161 @@ class TimeoutSafeTransport(SafeTransport):
         return c
 
 
+class SharedHTTPAdapter(adapters.HTTPAdapter):
+    """:class:`~requests.adapters.HTTPAdapter` shared by several sessions, with TCP keep-alive.
+
+    Closing a session does not close the shared connection pool, use :meth:`close_shared` instead.
+
+    :param bool keep_alive: enable TCP keep-alive on the connections.
+    :param kwargs: additional parameters for :class:`~requests.adapters.HTTPAdapter`.
+
+    """
+
+    def __init__(self, *, keep_alive: bool = True, **kwargs: Any) -> None:
+        self.keep_alive = keep_alive
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any) -> None:  # noqa: FBT001, FBT002
+        """Create and initialize the urllib3 PoolManager."""
+        if self.keep_alive:
+            pool_kwargs['socket_options'] = [
+                *HTTPConnection.default_socket_options,
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+            ]
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+
+    def close(self) -> None:
+        """Do not close the shared connection pool with the session."""
+
+    def close_shared(self) -> None:
+        """Close the shared connection pool."""
+        super().close()
+
+
+class SessionFactory:
+    """Create :class:`~requests.Session` sharing a pool of connections, with retries and compression.
+
+    All the sessions created by a factory use the same :class:`SharedHTTPAdapter`, so the connections
+    to a server are reused by all the providers and all the threads, instead of opening a new connection
+    for each session.
+
+    :param int pool_connections: number of connection pools to cache, one pool per host.
+    :param int pool_maxsize: maximum number of connections to keep per host, for concurrent requests.
+    :param bool keep_alive: enable TCP keep-alive on the connections.
+    :param int max_retries: maximum number of retries on server errors. The connection errors are retried
+        at most once and the read errors are not retried, a read timeout would otherwise be waited for again.
+    :param float backoff_factor: factor of the exponential backoff between retries, in seconds.
+    :param status_forcelist: HTTP status codes triggering a retry of idempotent requests.
+
+    """
+
+    #: Number of connection pools to cache
+    pool_connections: int
+
+    #: Maximum number of connections to keep per host
+    pool_maxsize: int
+
+    #: Enable TCP keep-alive on the connections
+    keep_alive: bool
+
+    #: Retry configuration
+    retries: Retry
+
+    def __init__(
+        self,
+        pool_connections: int = 16,
+        pool_maxsize: int = 32,
+        *,
+        keep_alive: bool = True,
+        max_retries: int = 2,
+        backoff_factor: float = 0.5,
+        status_forcelist: Sequence[int] = (500, 502, 503, 504),
+    ) -> None:
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.retries = Retry(
+            total=max_retries,
+            connect=min(max_retries, 1),
+            read=0,
+            backoff_factor=backoff_factor,
+            status_forcelist=status_forcelist,
+            # let the provider handle the last error response
+            raise_on_status=False,
+            # a long Retry-After would block the worker, the rate limiter and the providers handle it
+            respect_retry_after_header=False,
+        )
+        self._adapter: SharedHTTPAdapter | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def adapter(self) -> SharedHTTPAdapter:
+        """The adapter shared by all the sessions, created on first use."""
+        if self._adapter is None:
+            with self._lock:
+                if self._adapter is None:
+                    self._adapter = SharedHTTPAdapter(
+                        keep_alive=self.keep_alive,
+                        pool_connections=self.pool_connections,
+                        pool_maxsize=self.pool_maxsize,
+                        max_retries=self.retries,
+                    )
+        return self._adapter
+
+    def create_session(self, *, user_agent: str | None = None, headers: Mapping[str, str] | None = None) -> Session:
+        """Create a :class:`~requests.Session` using the shared connection pool.
+
+        :param (str | None) user_agent: the User-Agent header of the session.
+        :param headers: additional headers of the session.
+        :return: the session.
+        :rtype: :class:`~requests.Session`
+
+        """
+        session = Session()
+        session.mount('https://', self.adapter)
+        session.mount('http://', self.adapter)
+        session.headers['Accept-Encoding'] = 'gzip, deflate'
+        if user_agent is not None:
+            session.headers['User-Agent'] = user_agent
+        session.headers.update(headers or {})
+        return session
+
+    def close(self) -> None:
+        """Close the shared connection pool, the next session will use a new one."""
+        with self._lock:
+            if self._adapter is not None:
+                self._adapter.close_shared()
+                self._adapter = None
+
+
+#: Default :class:`SessionFactory` used by the providers and the refiners
+session_factory = SessionFactory()
+
+
+def configure_session_factory(**kwargs: Any) -> SessionFactory:
+    """Replace the default :data:`session_factory` used by the providers and the refiners.
+
+    The sessions that were already created keep using the previous connection pool.
+
+    :param kwargs: parameters for :class:`SessionFactory`.
+    :return: the new session factory.
+    :rtype: :class:`SessionFactory`
+
+    """
+    global session_factory
+    session_factory = SessionFactory(**kwargs)
+    return session_factory
+
+
+def create_session(*, user_agent: str | None = None, headers: Mapping[str, str] | None = None) -> Session:
+    """Create a :class:`~requests.Session` with the default :data:`session_factory`.
+
+    See :meth:`SessionFactory.create_session`.
+
+    """
+    return session_factory.create_session(user_agent=user_agent, headers=headers)
+
+
 class ParserBeautifulSoup(BeautifulSoup):
     """A :class:`~bs4.BeautifulSoup` that picks the first parser available in `parsers`.
 
@@ -117,6 +280,7 @@ class ParserBeautifulSoup(BeautifulSoup):
 
 
 S = TypeVar('S', bound=Subtitle)
+T = TypeVar('T')
 
 
 class Provider(Generic[S]):
@@ -139,9 +303,19 @@ class Provider(Generic[S]):
     #: Required hash, if any
     required_hash: ClassVar[str | None] = None
 
+    #: Algorithm of the video hash, in :data:`~subliminal.hashing.hash_algorithms`, if any.
+    #: The hashes of all the providers are then computed from a single read of the video
+    hash_algorithm: ClassVar[str | None] = None
+
     #: Subtitle class to use
     subtitle_class: ClassVar[type[S] | None] = None  # type: ignore[misc]
 
+    #: Default maximum number of calls per second to list or download subtitles, if any
+    rate_limit: ClassVar[float | None] = None
+
+    #: Default maximum number of concurrent calls to list or download subtitles, if any
+    max_concurrency: ClassVar[int | None] = None
+
     #: User Agent to use
     user_agent: str = f'Subliminal/{__short_version__}'
 
@@ -271,3 +445,131 @@ class Provider(Generic[S]):
 
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__} [{self.video_types!r}]>'
+
+
+class AsyncProvider(Provider[S]):
+    """Base class for providers with a native :mod:`asyncio` interface.
+
+    The coroutines :meth:`async_initialize`, :meth:`async_terminate`, :meth:`async_list_subtitles` and
+    :meth:`async_download_subtitle` are used by :class:`~subliminal.core.AsyncioProviderPool`.
+    The synchronous methods of :class:`Provider` run the coroutines in an event loop owned by the provider,
+    so an :class:`AsyncProvider` can still be used with a :class:`~subliminal.core.ProviderPool`.
+    The loop runs in a background thread from :meth:`initialize` to :meth:`terminate`, so the clients
+    bound to it are reused between the calls, which can also be made from a thread running another loop.
+
+    """
+
+    #: Event loop running the coroutines of the synchronous methods
+    _loop: asyncio.AbstractEventLoop | None = None
+
+    #: Thread running :attr:`_loop`
+    _loop_thread: threading.Thread | None = None
+
+    #: Lock creating :attr:`_loop`
+    _loop_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    async def async_initialize(self) -> None:
+        """Initialize the provider, see :meth:`Provider.initialize`."""
+        raise NotImplementedError
+
+    async def async_terminate(self) -> None:
+        """Terminate the provider, see :meth:`Provider.terminate`."""
+        raise NotImplementedError
+
+    async def async_list_subtitles(self, video: Video, languages: Set[Language]) -> list[S]:
+        """List subtitles for the `video` with the given `languages`, see :meth:`Provider.list_subtitles`."""
+        raise NotImplementedError
+
+    async def async_download_subtitle(self, subtitle: S) -> None:
+        """Download `subtitle`'s content, see :meth:`Provider.download_subtitle`."""
+        raise NotImplementedError
+
+    def _run_sync(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run the `coroutine` in the event loop of the provider and wait for its result."""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name=f'{self.__class__.__name__}-loop',
+                    daemon=True,
+                )
+                self._loop_thread.start()
+            loop = self._loop
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    def _close_loop(self) -> None:
+        """Stop and close the event loop of the provider."""
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    def initialize(self) -> None:
+        """Initialize the provider, running :meth:`async_initialize`."""
+        self._run_sync(self.async_initialize())
+
+    def terminate(self) -> None:
+        """Terminate the provider, running :meth:`async_terminate`, and close its event loop."""
+        try:
+            self._run_sync(self.async_terminate())
+        finally:
+            self._close_loop()
+
+    def list_subtitles(self, video: Video, languages: Set[Language]) -> list[S]:
+        """List subtitles, running :meth:`async_list_subtitles`."""
+        return self._run_sync(self.async_list_subtitles(video, languages))
+
+    def download_subtitle(self, subtitle: S) -> None:
+        """Download `subtitle`'s content, running :meth:`async_download_subtitle`."""
+        self._run_sync(self.async_download_subtitle(subtitle))
+
+
+class SyncProviderAdapter(AsyncProvider[S]):
+    """Expose a synchronous :class:`Provider` with the :class:`AsyncProvider` interface.
+
+    The blocking calls of the wrapped provider run in the `executor`, or in the default executor of the event loop.
+
+    :param provider: the synchronous provider to wrap.
+    :type provider: :class:`Provider`
+    :param executor: executor running the blocking calls.
+    :type executor: :class:`~concurrent.futures.Executor`
+
+    """
+
+    #: Wrapped provider
+    provider: Provider[S]
+
+    #: Executor running the blocking calls
+    executor: Executor | None
+
+    def __init__(self, provider: Provider[S], executor: Executor | None = None) -> None:
+        self.provider = provider
+        self.executor = executor
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    async def async_initialize(self) -> None:
+        """Initialize the wrapped provider."""
+        await self._run(self.provider.initialize)
+
+    async def async_terminate(self) -> None:
+        """Terminate the wrapped provider."""
+        await self._run(self.provider.terminate)
+
+    async def async_list_subtitles(self, video: Video, languages: Set[Language]) -> list[S]:
+        """List subtitles with the wrapped provider."""
+        return await self._run(self.provider.list_subtitles, video, languages)
+
+    async def async_download_subtitle(self, subtitle: S) -> None:
+        """Download `subtitle`'s content with the wrapped provider."""
+        await self._run(self.provider.download_subtitle, subtitle)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} [{self.provider!r}]>'
@@ -14,22 +14,23 @@ from urllib.parse import unquote
 
 from babelfish import Language, language_converters  # type: ignore[import-untyped]
 from babelfish.exceptions import LanguageReverseError  # type: ignore[import-untyped]
-from guessit import guessit  # type: ignore[import-untyped]
-from requests import Response, Session
 from requests.cookies import RequestsCookieJar
 
 from subliminal.cache import SHOW_EXPIRATION_TIME, region
 from subliminal.exceptions import ConfigurationError, DownloadLimitExceeded, NotInitializedProviderError
+from subliminal.guess import guessit
 from subliminal.matches import guess_matches
 from subliminal.subtitle import Subtitle
 from subliminal.utils import sanitize
 from subliminal.video import Episode, Video
 
-from . import ParserBeautifulSoup, Provider
+from . import ParserBeautifulSoup, Provider, create_session
 
 if TYPE_CHECKING:
     from collections.abc import Mapping, Set
 
+    from requests import Response, Session
+
 logger = logging.getLogger(__name__)
 
 with contextlib.suppress(ValueError):
@@ -216,6 +217,8 @@ class Addic7edProvider(Provider):
     video_types: ClassVar = (Episode,)
     server_url: ClassVar[str] = 'https://www.addic7ed.com'
     subtitle_class: ClassVar = Addic7edSubtitle
+    rate_limit: ClassVar[float | None] = 1
+    max_concurrency: ClassVar[int | None] = 1
 
     username: str | None
     password: str | None
@@ -248,7 +251,7 @@ class Addic7edProvider(Provider):
 
     def initialize(self) -> None:
         """Initialize the provider."""
-        self.session = Session()
+        self.session = create_session()
         self.session.headers['Accept-Language'] = 'en-US,en;q=1.0'
         self.session.headers['Referer'] = self.server_url
 
@@ -3,27 +3,28 @@
 from __future__ import annotations
 
 import logging
-import os
 import re
 import secrets
-import struct
 import zlib
 from time import sleep
 from typing import TYPE_CHECKING, ClassVar, cast, overload
 
 from babelfish import Language, language_converters  # type: ignore[import-untyped]
 from defusedxml import ElementTree  # type: ignore[import-untyped]
-from requests import Session
 
 from subliminal.exceptions import AuthenticationError, NotInitializedProviderError
+from subliminal.hashing import hash_opensubtitles
 from subliminal.subtitle import Subtitle
 
-from . import Provider
+from . import Provider, create_session
 
 if TYPE_CHECKING:
+    import os
     from collections.abc import Set
     from xml.etree.ElementTree import Element
 
+    from requests import Session
+
     from subliminal.video import Video
 
 logger = logging.getLogger(__name__)
@@ -187,6 +188,8 @@ class BSPlayerProvider(Provider):
     """BSPlayer Provider."""
 
     languages: ClassVar[Set[Language]] = {Language.fromalpha3b(lang) for lang in language_converters['alpha3b'].codes}
+    max_concurrency: ClassVar[int | None] = 2
+    hash_algorithm: ClassVar[str | None] = 'opensubtitles'
 
     timeout: int
     token: str | None
@@ -196,42 +199,18 @@ class BSPlayerProvider(Provider):
     def __init__(self, search_url: str | None = None, timeout: int = 10) -> None:
         self.timeout = timeout
         self.token = None
-        self.session = Session()
+        self.session = create_session()
         self.search_url = search_url or get_sub_domain()
 
     @staticmethod
     def hash_video(video_path: str | os.PathLike) -> str | None:
-        """Compute a hash using BSPlayer algorithm.
+        """Compute a hash using BSPlayer algorithm, the same as OpenSubtitles' algorithm.
 
         :param str video_path: path of the video.
         :return: the hash.
         :rtype: str
         """
-        little_endian_long_long = '<q'  # little-endian long long
-        byte_size = struct.calcsize(little_endian_long_long)
-
-        with open(video_path, 'rb') as f:
-            file_size = os.path.getsize(video_path)
-            file_hash = file_size
-
-            if file_size < 65536 * 2:
-                return None
-
-            for _ in range(65536 // byte_size):
-                buff = f.read(byte_size)
-                (l_value,) = struct.unpack(little_endian_long_long, buff)
-                file_hash += l_value
-                file_hash &= 0xFFFFFFFFFFFFFFFF  # to remain as 64bit number
-
-            f.seek(max(0, file_size - 65536), 0)
-
-            for _ in range(65536 // byte_size):
-                buff = f.read(byte_size)
-                (l_value,) = struct.unpack(little_endian_long_long, buff)
-                file_hash += l_value
-                file_hash &= 0xFFFFFFFFFFFFFFFF
-
-        return f'{file_hash:016x}'
+        return hash_opensubtitles(video_path)
 
     def _api_request(self, func_name: str = 'logIn', params: str = '', tries: int = 5) -> Element:
         """Request data from search url.
@@ -7,16 +7,16 @@ import re
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from babelfish import Language  # type: ignore[import-untyped]
-from guessit import guessit  # type: ignore[import-untyped]
 from requests import HTTPError, Session
 
 from subliminal.exceptions import DownloadLimitExceeded, NotInitializedProviderError
+from subliminal.guess import guessit
 from subliminal.matches import guess_matches
 from subliminal.subtitle import Subtitle
 from subliminal.utils import sanitize
 from subliminal.video import Episode, Video
 
-from . import Provider
+from . import Provider, create_session
 
 if TYPE_CHECKING:
     from collections.abc import Set
@@ -164,7 +164,7 @@ class GestdownProvider(Provider):
 
     def initialize(self) -> None:
         """Initialize the provider."""
-        self.session = Session()
+        self.session = create_session()
         self.session.headers['User-Agent'] = self.user_agent
         self.session.headers['accept'] = 'application/json'
 
@@ -8,9 +8,9 @@ from itertools import count
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from babelfish import LANGUAGES, Language  # type: ignore[import-untyped]
-from guessit import guessit  # type: ignore[import-untyped]
 
 from subliminal.exceptions import DiscardingError, NotInitializedProviderError
+from subliminal.guess import guessit
 from subliminal.matches import guess_matches
 from subliminal.subtitle import Subtitle
 from subliminal.video import Episode, Movie, Video
@@ -2,24 +2,25 @@
 
 from __future__ import annotations
 
-import hashlib
 import io
 import logging
 from gzip import BadGzipFile, GzipFile
 from typing import TYPE_CHECKING, ClassVar
 
 from babelfish import Language  # type: ignore[import-untyped]
-from requests import Session
 
 from subliminal.exceptions import NotInitializedProviderError
+from subliminal.hashing import compute_hashes
 from subliminal.subtitle import Subtitle, fix_line_ending
 
-from . import Provider
+from . import Provider, create_session
 
 if TYPE_CHECKING:
     import os
     from collections.abc import Set
 
+    from requests import Session
+
     from subliminal.video import Video
 
 logger = logging.getLogger(__name__)
@@ -88,6 +89,7 @@ class NapiProjektProvider(Provider):
     subtitle_class: ClassVar = NapiProjektSubtitle
 
     required_hash: ClassVar = 'napiprojekt'
+    hash_algorithm: ClassVar[str | None] = 'napiprojekt'
     server_url: ClassVar[str] = 'https://napiprojekt.pl/unit_napisy/dl.php'
 
     timeout: int
@@ -106,14 +108,11 @@ class NapiProjektProvider(Provider):
         :rtype: str
 
         """
-        readsize = 1024 * 1024 * 10
-        with open(video_path, 'rb') as f:
-            data = f.read(readsize)
-        return hashlib.md5(data).hexdigest()  # noqa: S324
+        return compute_hashes(video_path, ['napiprojekt']).get('napiprojekt')
 
     def initialize(self) -> None:
         """Initialize the provider."""
-        self.session = Session()
+        self.session = create_session()
         self.session.headers['User-Agent'] = self.user_agent
 
     def terminate(self) -> None:
@@ -12,7 +12,6 @@ from typing import TYPE_CHECKING, Any, ClassVar
 from xmlrpc.client import ServerProxy
 
 from babelfish import Language, language_converters  # type: ignore[import-untyped]
-from guessit import guessit  # type: ignore[import-untyped]
 
 from subliminal.exceptions import (
     AuthenticationError,
@@ -21,6 +20,7 @@ from subliminal.exceptions import (
     ProviderError,
     ServiceUnavailable,
 )
+from subliminal.guess import guessit
 from subliminal.matches import guess_matches
 from subliminal.subtitle import Subtitle
 from subliminal.utils import decorate_imdb_id, sanitize_id
@@ -180,6 +180,7 @@ class OpenSubtitlesProvider(Provider):
         Language.fromopensubtitles(lang) for lang in language_converters['opensubtitles'].codes
     }
     subtitle_class: ClassVar = OpenSubtitlesSubtitle
+    hash_algorithm: ClassVar[str | None] = 'opensubtitles'
 
     server_url: ClassVar[str] = 'https://api.opensubtitles.org/xml-rpc'
     # user_agent = 'subliminal v%s' % __short_version__
@@ -11,8 +11,6 @@ from typing import TYPE_CHECKING, Any, Callable, ClassVar, TypeVar, cast
 
 from babelfish import Language, language_converters  # type: ignore[import-untyped]
 from dogpile.cache.api import NO_VALUE
-from guessit import guessit  # type: ignore[import-untyped]
-from requests import Response, Session
 
 from subliminal import __short_version__
 from subliminal.cache import region
@@ -24,15 +22,18 @@ from subliminal.exceptions import (
     ProviderError,
     ServiceUnavailable,
 )
+from subliminal.guess import guessit
 from subliminal.matches import guess_matches
 from subliminal.subtitle import Subtitle
 from subliminal.video import Episode, Movie, Video
 
-from . import Provider
+from . import Provider, create_session
 
 if TYPE_CHECKING:
     from collections.abc import Mapping, Set
 
+    from requests import Response, Session
+
 C = TypeVar('C', bound=Callable)
 
 logger = logging.getLogger(__name__)
@@ -378,6 +379,8 @@ class OpenSubtitlesComProvider(Provider):
     server_url: ClassVar[str] = 'https://api.opensubtitles.com/api/v1/'
     subtitle_class: ClassVar = OpenSubtitlesComSubtitle
     languages: ClassVar[Set[Language]] = opensubtitlescom_languages
+    hash_algorithm: ClassVar[str | None] = 'opensubtitles'
+    rate_limit: ClassVar[float | None] = 4
 
     user_agent: str = f'Subliminal v{__short_version__}'
     subtitle_format: str = 'srt'
@@ -410,7 +413,7 @@ class OpenSubtitlesComProvider(Provider):
 
     def initialize(self) -> None:
         """Initialize the provider."""
-        self.session = Session()
+        self.session = create_session()
         self.session.headers['User-Agent'] = self.user_agent
         self.session.headers['Api-Key'] = self.apikey
         self.session.headers['Accept'] = '*/*'
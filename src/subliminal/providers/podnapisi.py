@@ -9,19 +9,20 @@ from typing import TYPE_CHECKING, Any, ClassVar
 from zipfile import ZipFile
 
 from babelfish import Language, language_converters  # type: ignore[import-untyped]
-from guessit import guessit  # type: ignore[import-untyped]
-from requests import Session
 
 from subliminal.exceptions import NotInitializedProviderError, ProviderError
+from subliminal.guess import guessit
 from subliminal.matches import guess_matches
 from subliminal.subtitle import Subtitle
 from subliminal.video import Episode, Movie, Video
 
-from . import Provider, SecLevelOneTLSAdapter
+from . import Provider, SecLevelOneTLSAdapter, create_session
 
 if TYPE_CHECKING:
     from collections.abc import Sequence, Set
 
+    from requests import Session
+
 
 logger = logging.getLogger(__name__)
 
@@ -100,7 +101,7 @@ class PodnapisiProvider(Provider):
 
     def initialize(self) -> None:
         """Initialize the provider."""
-        self.session = Session()
+        self.session = create_session()
         self.session.mount('https://', SecLevelOneTLSAdapter())
         self.session.headers['User-Agent'] = self.user_agent
         self.session.headers['Accept'] = 'application/json'
@@ -9,22 +9,21 @@ from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from babelfish import Language, language_converters  # type: ignore[import-untyped]
 from bs4 import Tag
-from guessit import guessit  # type: ignore[import-untyped]
-from requests import Session
 
 from subliminal import __short_version__
 from subliminal.cache import SHOW_EXPIRATION_TIME, region
 from subliminal.exceptions import NotInitializedProviderError, ProviderError
+from subliminal.guess import guessit
 from subliminal.matches import guess_matches
 from subliminal.subtitle import Subtitle
 from subliminal.video import Episode
 
-from . import ParserBeautifulSoup, Provider
+from . import ParserBeautifulSoup, Provider, create_session
 
 if TYPE_CHECKING:
     from collections.abc import Set
 
-    from requests import Response
+    from requests import Response, Session
 
     from subliminal.video import Video
 
@@ -135,7 +134,7 @@ class SubtitulamosProvider(Provider):
 
     def initialize(self) -> None:
         """Initialize the provider."""
-        self.session = Session()
+        self.session = create_session()
         self.session.headers['User-Agent'] = f'Subliminal/{__short_version__}'
 
     def terminate(self) -> None:
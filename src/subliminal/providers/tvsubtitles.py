@@ -10,21 +10,22 @@ from typing import TYPE_CHECKING, ClassVar
 from zipfile import ZipFile
 
 from babelfish import Language, language_converters  # type: ignore[import-untyped]
-from guessit import guessit  # type: ignore[import-untyped]
-from requests import Session
 
 from subliminal.cache import EPISODE_EXPIRATION_TIME, SHOW_EXPIRATION_TIME, region
 from subliminal.exceptions import NotInitializedProviderError, ProviderError
+from subliminal.guess import guessit
 from subliminal.matches import guess_matches
 from subliminal.subtitle import Subtitle
 from subliminal.utils import sanitize
 from subliminal.video import Episode, Video
 
-from . import ParserBeautifulSoup, Provider
+from . import ParserBeautifulSoup, Provider, create_session
 
 if TYPE_CHECKING:
     from collections.abc import Set
 
+    from requests import Session
+
 logger = logging.getLogger(__name__)
 
 with contextlib.suppress(ValueError):
@@ -137,7 +138,7 @@ class TVsubtitlesProvider(Provider):
 
     def initialize(self) -> None:
         """Initialize the provider."""
-        self.session = Session()
+        self.session = create_session()
         self.session.headers['User-Agent'] = self.user_agent
         self.session.headers['Referer'] = f'{self.server_url}/'
         self.session.headers['X-Requested-With'] = 'XMLHttpRequest'
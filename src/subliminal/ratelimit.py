@@ -0,0 +1,193 @@
+"""Client-side throttling of the calls to the providers."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, TypedDict
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Mapping
+    from types import TracebackType
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitOptions(TypedDict, total=False):
+    """Options of a :class:`RateLimiter`, that can be set per provider."""
+
+    rate_limit: float | None
+    rate_burst: int | None
+    max_concurrency: int | None
+
+
+#: Keys of the provider configuration used to configure the :class:`RateLimiter` of a provider
+RATE_LIMIT_OPTIONS: tuple[str, ...] = tuple(RateLimitOptions.__annotations__)
+
+#: Description of the :data:`RATE_LIMIT_OPTIONS`
+RATE_LIMIT_OPTIONS_DOC: dict[str, str] = {
+    'rate_limit': 'maximum number of calls per second to the provider, to list or download subtitles.',
+    'rate_burst': 'maximum number of calls made at once to the provider, after some inactivity.',
+    'max_concurrency': 'maximum number of concurrent calls to the provider.',
+}
+
+
+class RateLimiter:
+    """Limit the rate and the concurrency of calls, blocking the caller when needed.
+
+    The rate is limited with a token bucket: a call consumes a token and the bucket is refilled
+    with `rate_limit` tokens per second, up to `rate_burst` tokens.
+    The concurrency is limited with a semaphore.
+
+    The provider pools use it around each call to a provider, to list or download subtitles.
+    Such a call can send several HTTP requests, so the limits apply to the calls and not to the requests.
+
+    Use it as a context manager around each call, or as an asynchronous context manager in a coroutine::
+
+        limiter = RateLimiter(rate_limit=2, max_concurrency=4)
+        with limiter:
+            provider.list_subtitles(video, languages)
+
+    A limiter is used either synchronously or asynchronously: the concurrency of the two is limited separately.
+
+    :param (float | None) rate_limit: maximum number of calls per second, not limited if None.
+    :param (int | None) rate_burst: maximum number of calls that can be made at once,
+        after some inactivity. Defaults to 1.
+    :param (int | None) max_concurrency: maximum number of concurrent calls, not limited if None.
+    :param clock: function returning the current time in seconds.
+    :param sleep: function waiting for a duration in seconds.
+    :param async_sleep: coroutine function waiting for a duration in seconds.
+
+    """
+
+    #: Maximum number of calls per second
+    rate_limit: float | None
+
+    #: Maximum number of calls made at once
+    rate_burst: int
+
+    #: Maximum number of concurrent calls
+    max_concurrency: int | None
+
+    def __init__(
+        self,
+        rate_limit: float | None = None,
+        rate_burst: int | None = None,
+        max_concurrency: int | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Any] = time.sleep,
+        async_sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ) -> None:
+        if rate_limit is not None and rate_limit <= 0:
+            msg = f'rate_limit must be positive, got {rate_limit!r}'
+            raise ValueError(msg)
+        if max_concurrency is not None and max_concurrency <= 0:
+            msg = f'max_concurrency must be positive, got {max_concurrency!r}'
+            raise ValueError(msg)
+
+        self.rate_limit = rate_limit
+        self.rate_burst = max(rate_burst or 1, 1)
+        self.max_concurrency = max_concurrency
+        self._clock = clock
+        self._sleep = sleep
+        self._async_sleep = async_sleep
+        self._lock = threading.Lock()
+        self._tokens = float(self.rate_burst)
+        self._last_refill = clock()
+        self._semaphore = threading.BoundedSemaphore(max_concurrency) if max_concurrency is not None else None
+        self._async_semaphore: asyncio.Semaphore | None = None
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> RateLimiter:
+        """Create a :class:`RateLimiter` from a mapping with :data:`RATE_LIMIT_OPTIONS` keys.
+
+        The values can be strings, as read from the command line.
+        """
+        rate_limit = options.get('rate_limit')
+        rate_burst = options.get('rate_burst')
+        max_concurrency = options.get('max_concurrency')
+        return cls(
+            rate_limit=float(rate_limit) if rate_limit not in (None, '') else None,
+            rate_burst=int(rate_burst) if rate_burst not in (None, '') else None,
+            max_concurrency=int(max_concurrency) if max_concurrency not in (None, '') else None,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the calls are limited at all."""
+        return self.rate_limit is not None or self.max_concurrency is not None
+
+    def _take_token(self) -> float:
+        """Take a token if available, otherwise return the time to wait for the next token."""
+        if self.rate_limit is None:
+            return 0
+
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.rate_burst, self._tokens + (now - self._last_refill) * self.rate_limit)
+            self._last_refill = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) / self.rate_limit
+
+    def acquire(self) -> None:
+        """Wait until a call can be made."""
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+        while (delay := self._take_token()) > 0:
+            logger.debug('Rate limit reached, waiting %.3fs', delay)
+            self._sleep(delay)
+
+    def release(self) -> None:
+        """Notify that a call has completed."""
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+    async def async_acquire(self) -> None:
+        """Wait until a call can be made, without blocking the event loop."""
+        if self.max_concurrency is not None:
+            if self._async_semaphore is None:
+                self._async_semaphore = asyncio.Semaphore(self.max_concurrency)
+            await self._async_semaphore.acquire()
+        while (delay := self._take_token()) > 0:
+            logger.debug('Rate limit reached, waiting %.3fs', delay)
+            await self._async_sleep(delay)
+
+    def async_release(self) -> None:
+        """Notify that a call made after :meth:`async_acquire` has completed."""
+        if self._async_semaphore is not None:
+            self._async_semaphore.release()
+
+    def __enter__(self) -> RateLimiter:
+        self.acquire()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.release()
+
+    async def __aenter__(self) -> RateLimiter:
+        await self.async_acquire()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.async_release()
+
+    def __repr__(self) -> str:
+        return (
+            f'<{self.__class__.__name__} [rate_limit={self.rate_limit!r}, rate_burst={self.rate_burst!r}, '
+            f'max_concurrency={self.max_concurrency!r}]>'
+        )
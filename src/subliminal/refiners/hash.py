@@ -3,14 +3,20 @@
 from __future__ import annotations
 
 import logging
-import os
-import struct
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, cast
 
+from dogpile.cache.api import NO_VALUE
+
+from subliminal.cache import HASH_EXPIRATION_TIME, region
 from subliminal.extensions import get_default_providers, provider_manager
+from subliminal.hashing import compute_hashes, hash_algorithms, hash_opensubtitles
+from subliminal.utils import get_file_identity, handle_exception
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence, Set
+    import os
+    from collections.abc import Iterable, Sequence, Set
     from typing import Callable, TypeAlias
 
     from babelfish import Language  # type: ignore[import-untyped]
@@ -22,36 +28,7 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-
-def hash_opensubtitles(video_path: str | os.PathLike) -> str | None:
-    """Compute a hash using OpenSubtitles' algorithm.
-
-    :param (str | os.PathLike) video_path: path of the video.
-    :return: the hash.
-    :rtype: str
-
-    """
-    video_path = os.fspath(video_path)
-    bytesize = struct.calcsize(b'<q')
-    with open(video_path, 'rb') as f:
-        filesize = os.path.getsize(video_path)
-        filehash = filesize
-        if filesize < 65536 * 2:
-            return None
-        for _ in range(65536 // bytesize):
-            filebuffer = f.read(bytesize)
-            (l_value,) = struct.unpack(b'<q', filebuffer)
-            filehash += l_value
-            filehash &= 0xFFFFFFFFFFFFFFFF  # to remain as 64bit number
-        f.seek(max(0, filesize - 65536), 0)
-        for _ in range(65536 // bytesize):
-            filebuffer = f.read(bytesize)
-            (l_value,) = struct.unpack(b'<q', filebuffer)
-            filehash += l_value
-            filehash &= 0xFFFFFFFFFFFFFFFF
-    return f'{filehash:016x}'
-
-
+#: Generic hash functions, for the providers without a :attr:`~subliminal.providers.Provider.hash_algorithm`
 hash_functions: dict[str, HashFunc] = {
     'opensubtitles': hash_opensubtitles,
     'opensubtitlesvip': hash_opensubtitles,
@@ -60,11 +37,28 @@ hash_functions: dict[str, HashFunc] = {
 }
 
 
+def hash_cache_key(video_path: str | os.PathLike) -> str | None:
+    """Key of the hashes of a video in the cache region, None if the file does not exist.
+
+    The key is made of the device, the inode, the size and the modification time of the file,
+    so the cached hashes are not used anymore when the file is replaced or modified.
+
+    :param (str | os.PathLike) video_path: path of the video.
+    :rtype: str or None
+
+    """
+    identity = get_file_identity(video_path)
+    if identity is None:
+        return None
+    return 'hashes:{}:{}:{}:{}'.format(*identity)
+
+
 def refine(
     video: Video,
     *,
     providers: Sequence[str] | None = None,
     languages: Set[Language] | None = None,
+    hash_cache: bool = True,
     **kwargs: Any,
 ) -> Video:
     """Refine a video computing required hashes for the given providers.
@@ -73,9 +67,13 @@ def refine(
 
       * :attr:`~subliminal.video.Video.hashes`
 
+    The hashes are stored in the cache :data:`~subliminal.cache.region`, if it is configured, with a key
+    from :func:`hash_cache_key`, so the files are only read again when they change.
+
     :param Video video: the Video to refine.
     :param providers: list of providers for which the video hash should be computed.
     :param languages: set of languages that need to be compatible with the providers.
+    :param bool hash_cache: use the hashes stored in the cache region, and store the new ones.
 
     """
     if video.size is None or video.size <= 10485760:
@@ -84,7 +82,14 @@ def refine(
 
     providers = providers if providers is not None else get_default_providers()
 
+    # the cached hashes, by algorithm name or by provider name for the providers without an algorithm
+    cache_key = hash_cache_key(video.name) if hash_cache and region.is_configured else None
+    cached = region.get(cache_key, expiration_time=HASH_EXPIRATION_TIME) if cache_key is not None else NO_VALUE
+    cached_hashes: dict[str, str] = dict(cached) if cached is not NO_VALUE else {}
+    new_hashes: dict[str, str] = {}
+
     logger.debug('Computing hashes for %r', video.name)
+    providers_by_algorithm: dict[str, list[str]] = defaultdict(list)
     for name in providers:
         provider = cast('Provider', provider_manager[name].plugin)
         if not provider.check_types(video):
@@ -93,16 +98,97 @@ def refine(
         if languages is not None and not provider.check_languages(languages):
             continue
 
+        # Compute the hashes of the known algorithms together, from a single read
+        algorithm = getattr(provider, 'hash_algorithm', None)
+        if algorithm in hash_algorithms:
+            providers_by_algorithm[algorithm].append(name)
+            continue
+
+        # Take the hash from the cache
+        cache_name = f'provider:{name}'
+        h = cached_hashes.get(cache_name)
+
         # Try provider static method
-        h = provider.hash_video(video.name)
+        if h is None:
+            h = provider.hash_video(video.name)
+
+            # Try generic hashes
+            if h is None and name in hash_functions:
+                h = hash_functions[name](video.name)
 
-        # Try generic hashes
-        if h is None and name in hash_functions:
-            h = hash_functions[name](video.name)
+            if h is not None:
+                new_hashes[cache_name] = h
 
         # Add hash
         if h is not None:
             video.hashes[name] = h
 
+    hashes = {a: cached_hashes[a] for a in providers_by_algorithm if a in cached_hashes}
+    missing_algorithms = [a for a in providers_by_algorithm if a not in hashes]
+    if missing_algorithms:
+        computed_hashes = compute_hashes(video.name, missing_algorithms)
+        hashes.update(computed_hashes)
+        new_hashes.update(computed_hashes)
+    for algorithm, names in providers_by_algorithm.items():
+        if algorithm in hashes:
+            video.hashes.update(dict.fromkeys(names, hashes[algorithm]))
+
+    # Store the new hashes with the cached ones
+    if cache_key is not None and new_hashes:
+        region.set(cache_key, {**cached_hashes, **new_hashes})
+
     logger.debug('Computed hashes %r', video.hashes)
     return video
+
+
+def _disk_order(video: Video) -> tuple[int, int]:
+    """Device and inode of the video file, to read the files in an order close to their order on the disk."""
+    identity = get_file_identity(video.name)
+    return identity[:2] if identity is not None else (-1, -1)
+
+
+def hash_videos(
+    videos: Iterable[Video],
+    *,
+    workers: int | None = None,
+    sort: bool = True,
+    **kwargs: Any,
+) -> list[Video]:
+    """Refine several videos with :func:`refine`, reading the video files concurrently.
+
+    Hashing a video only reads a few blocks at the beginning and at the end of the file, so the time is spent
+    waiting for the disk seeks, or for the network with remote files: the reads of several videos are sent
+    together in worker threads.
+
+    .. note::
+
+        Exceptions raised when hashing a video are logged, the other videos are still hashed.
+
+    :param videos: the videos to refine.
+    :param workers: maximum number of videos hashed at the same time, None for the default of
+        :class:`~concurrent.futures.ThreadPoolExecutor`.
+    :param bool sort: hash the videos by device and inode, an approximation of their position on the disk.
+    :param kwargs: additional parameters for :func:`refine`.
+    :return: the refined videos, in the same order.
+    :rtype: list of :class:`~subliminal.video.Video`
+
+    """
+    videos = list(videos)
+    ordered_videos = sorted(videos, key=_disk_order) if sort else videos
+
+    def hash_video(video: Video) -> None:
+        try:
+            refine(video, **kwargs)
+        except Exception as e:  # noqa: BLE001
+            handle_exception(e, f'Failed to hash video {video.name!r}')
+
+    if workers == 1 or len(ordered_videos) <= 1:
+        for video in ordered_videos:
+            hash_video(video)
+    else:
+        with ThreadPoolExecutor(workers, thread_name_prefix='subliminal-hash') as executor:
+            # consume the results to wait for all the videos
+            list(executor.map(hash_video, ordered_videos))
+
+    logger.info('Hashed %d videos', len(videos))
+    return videos
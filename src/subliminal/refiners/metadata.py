@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import logging
+import threading
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
 from babelfish import Language  # type: ignore[import-untyped]
+from dogpile.cache.api import NO_VALUE
+from knowit import __version__ as knowit_version  # type: ignore[import-untyped]
 from knowit.api import available_providers, dependencies, know  # type: ignore[import-untyped]
 
+from subliminal.cache import METADATA_EXPIRATION_TIME, region
 from subliminal.subtitle import EmbeddedSubtitle
+from subliminal.utils import get_file_identity
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
@@ -19,15 +24,138 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def loaded_providers(options: dict[str, Any] | None = None) -> dict[str, bool]:
-    """Return a dict with knowit providers and if they are installed."""
-    # clear knowit cached available providers
-    available_providers.clear()
-    # find knowit providers with options
-    deps = dependencies(options)
-    # mediainfo requires more work, because 'pymediainfo' is always installed
-    # but it's not working alone.
-    return {k: len({v for v in d if v != 'pymediainfo'}) > 0 for k, d in deps.items()}
+class KnowitProviders:
+    """Installed knowit providers, found once for each knowit options.
+
+    Finding the providers looks for their executables and libraries, so the result is kept for each options,
+    and the knowit providers are reused while the options do not change.
+    """
+
+    def __init__(self) -> None:
+        self._loaded: dict[str, dict[str, bool]] = {}
+        #: Options of the providers in knowit `available_providers`, None if they are unknown
+        self._current: str | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _options_key(options: Mapping[str, Any] | None) -> str:
+        return repr(sorted(options.items())) if options else ''
+
+    def _use_options(self, key: str) -> None:
+        """Clear the knowit providers if they were created with other options."""
+        if key != self._current:
+            available_providers.clear()
+            self._current = key
+
+    def get(self, options: dict[str, Any] | None = None, *, refresh: bool = False) -> dict[str, bool]:
+        """Return a dict with knowit providers and if they are installed.
+
+        :param dict options: the knowit options, like executable paths.
+        :param bool refresh: find the providers again, even if they are known for these options.
+        :return: if each knowit provider is installed, by name.
+        :rtype: dict[str, bool]
+
+        """
+        key = self._options_key(options)
+        with self._lock:
+            self._use_options(key)
+            if not refresh and key in self._loaded:
+                return dict(self._loaded[key])
+
+            # clear knowit cached available providers
+            available_providers.clear()
+            # find knowit providers with options
+            deps = dependencies(options)
+            # mediainfo requires more work, because 'pymediainfo' is always installed
+            # but it's not working alone.
+            providers = {k: len({v for v in d if v != 'pymediainfo'}) > 0 for k, d in deps.items()}
+            self._loaded[key] = providers
+            return dict(providers)
+
+    def clear(self) -> None:
+        """Forget the providers, to find them again after installing or removing one."""
+        with self._lock:
+            self._loaded.clear()
+            available_providers.clear()
+            self._current = None
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} [{len(self._loaded)}]>'
+
+
+#: Knowit providers used by :func:`loaded_providers`
+knowit_providers = KnowitProviders()
+
+
+def loaded_providers(options: dict[str, Any] | None = None, *, refresh: bool = False) -> dict[str, bool]:
+    """Return a dict with knowit providers and if they are installed.
+
+    The result is kept by :data:`knowit_providers`, call :meth:`KnowitProviders.clear` after installing
+    or removing a provider.
+
+    :param dict options: the knowit options, like executable paths.
+    :param bool refresh: find the providers again, even if they are known for these options.
+    :return: if each knowit provider is installed, by name.
+    :rtype: dict[str, bool]
+
+    """
+    return knowit_providers.get(options, refresh=refresh)
+
+
+def summarize_media(media: Mapping[str, Any]) -> dict[str, Any]:
+    """Keep the knowit metadata used by :func:`refine`, with types that can be stored in the cache."""
+    summary: dict[str, Any] = {'provider': str(media.get('provider'))}
+    if 'duration' in media:
+        summary['duration'] = get_float(media['duration'])
+    summary['video'] = [
+        {
+            'default': track.get('default', False),
+            **({'resolution': str(track['resolution'])} if 'resolution' in track else {}),
+            **({'frame_rate': get_float(track['frame_rate'])} if 'frame_rate' in track else {}),
+            **({'codec': track['codec']} if 'codec' in track else {}),
+        }
+        for track in media.get('video', [])
+    ]
+    summary['audio'] = [
+        {'default': track.get('default', False), **({'codec': track['codec']} if 'codec' in track else {})}
+        for track in media.get('audio', [])
+    ]
+    summary['subtitle'] = [
+        {k: track[k] for k in ('language', 'hearing_impaired', 'closed_caption', 'forced', 'format') if k in track}
+        for track in media.get('subtitle', [])
+    ]
+    return summary
+
+
+def read_media(video_path: str, options: Mapping[str, Any], *, force: bool = False) -> dict[str, Any]:
+    """Read the metadata of a video with knowit, or take them from the cache.
+
+    The metadata are stored in the cache :data:`~subliminal.cache.region`, if it is configured, with a key made
+    of the knowit provider and of the device, the inode, the size and the modification time of the file.
+
+    :param str video_path: path of the video.
+    :param options: the knowit options.
+    :param bool force: read the metadata even if they are in the cache.
+    :return: the metadata, as returned by :func:`summarize_media`.
+    :rtype: dict
+
+    """
+    identity = get_file_identity(video_path) if region.is_configured else None
+    key = None
+    if identity is not None:
+        provider = options.get('provider', 'default')
+        key = 'metadata:{}:{}:{}:{}:{}:{}'.format(knowit_version, provider, *identity)
+        if not force:
+            cached = region.get(key, expiration_time=METADATA_EXPIRATION_TIME)
+            if cached is not NO_VALUE:
+                logger.debug('Found metadata of %r in the cache', video_path)
+                return cached  # type: ignore[no-any-return]
+
+    logger.debug('Retrieving metadata from %r', video_path)
+    media = summarize_media(know(video_path, dict(options)))
+    if key is not None:
+        region.set(key, media)
+    return media
 
 
 def refine(
@@ -36,6 +164,7 @@ def refine(
     embedded_subtitles: bool = True,
     metadata_provider: str | None = None,
     metadata_options: Mapping[str, Any] | None = None,
+    force: bool = False,
     **kwargs: Any,
 ) -> Video:
     """Refine a video by searching its metadata.
@@ -67,6 +196,7 @@ def refine(
         Should be one of ['mediainfo', 'ffmpeg', 'mkvmerge', 'enzyme']. None defaults to `mediainfo`.
     :param dict metadata_options: keyword arguments to pass to knowit, like executable paths:
         `metadata_options={'ffmpeg': '/opt/bin/ffmpeg'}`.
+    :param bool force: if True, read the metadata of the video even if they are in the cache.
 
     """
     # skip non existing videos
@@ -99,8 +229,7 @@ def refine(
             options['provider'] = metadata_provider
 
     # get video metadata
-    logger.debug('Retrieving metadata from %r', video.name)
-    media = know(video.name, options)
+    media = read_media(video.name, options, force=force)
 
     provider_info = media['provider']
     logger.debug('Using provider %r', provider_info)
@@ -6,16 +6,17 @@ import logging
 import operator
 from typing import TYPE_CHECKING, Any, ClassVar, cast
 
-import requests
-
 from subliminal import __short_version__
 from subliminal.cache import REFINER_EXPIRATION_TIME, region
+from subliminal.providers import create_session
 from subliminal.utils import decorate_imdb_id, sanitize_id
 from subliminal.video import Episode, Movie, Video
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    import requests
+
 logger = logging.getLogger(__name__)
 
 #: OMDB subliminal API key
@@ -52,7 +53,7 @@ class OMDBClient:
         self.timeout = timeout
 
         #: Session for the requests
-        self.session = session if session is not None else requests.Session()
+        self.session = session if session is not None else create_session()
         self.session.headers['User-Agent'] = self.user_agent
         self.session.headers.update(headers or {})
         self.session.params['r'] = 'json'  # type: ignore[index]
@@ -206,9 +207,9 @@ class OMDBClient:
 
 def refine_episode(client: OMDBClient, video: Episode, *, force: bool = False, **kwargs: Any) -> None:
     """Refine an Episode by searching `OMDb API <https://omdbapi.com/>`_."""
-    # exit if the information is complete
-    if not force and video.series_imdb_id and video.imdb_id:  # pragma: no cover
-        logger.debug('No need to search, IMDB ids already exist for the video.')
+    # exit if the series is known, only the series information is searched
+    if not force and video.series_imdb_id:
+        logger.debug('No need to search, IMDB id of the series already exists for the video.')
         return
 
     # search the series
@@ -308,7 +309,7 @@ def refine(video: Video, *, apikey: str | None = None, force: bool = False, **kw
     :param Video video: the Video to refine.
     :param (str | None) apikey: a personal API key to use OMDb.
     :param bool force: if True, refine even if IMDB id is already known for a Movie or
-        if both the IMDB ids of the series and of the episodes are known for an Episode.
+        if the IMDB id of the series is known for an Episode.
 
     """
     # update the API key
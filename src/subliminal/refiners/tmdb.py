@@ -4,15 +4,17 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any, ClassVar, cast
-
-import requests
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from subliminal import __short_version__
 from subliminal.cache import REFINER_EXPIRATION_TIME, region
+from subliminal.providers import create_session
 from subliminal.utils import decorate_imdb_id, sanitize, sanitize_id
 from subliminal.video import Episode, Movie, Video
 
+if TYPE_CHECKING:
+    import requests
+
 logger = logging.getLogger(__name__)
 
 series_re = re.compile(r'^(?P<series>.*?)(?: \((?:(?P<year>\d{4})|(?P<country>[A-Z]{2}))\))?$')
@@ -67,7 +69,7 @@ class TMDBClient:
         self.timeout = timeout
 
         #: Session for the requests
-        self.session = session if session is not None else requests.Session()
+        self.session = session if session is not None else create_session()
         self.session.headers['User-Agent'] = self.user_agent
         self.session.headers.update(headers or {})
         self.session.headers['Content-Type'] = 'application/json'
@@ -235,12 +237,17 @@ def refine_episode(client: TMDBClient, video: Episode, *, force: bool = False, *
         logger.debug('No need to search, TMDB ids already exist for the video.')
         return
 
-    # search the series id
-    country_code = None if video.country is None else str(video.country)
-    tmdb_id = client.get_id(video.series, is_movie=False, year=video.year, country=country_code)
-    if tmdb_id is None:
-        logger.warning('No results for series')
-        return
+    # search the series id, unless it is already known
+    tmdb_id: int | None
+    if not force and video.series_tmdb_id:
+        logger.debug('No need to search the series, TMDB id already exists for the video.')
+        tmdb_id = video.series_tmdb_id
+    else:
+        country_code = None if video.country is None else str(video.country)
+        tmdb_id = client.get_id(video.series, is_movie=False, year=video.year, country=country_code)
+        if tmdb_id is None:
+            logger.warning('No results for series')
+            return
 
     # search the series
     result_series = client.query(tmdb_id, is_movie=False)
@@ -323,7 +330,8 @@ def refine(video: Video, *, apikey: str | None = None, force: bool = False, **kw
     :param Video video: the Video to refine.
     :param (str | None) apikey: a personal API key to use TMDB.
     :param bool force: if True, refine even if TMDB id is already known for a Movie or
-        if both the TMDB ids of the series and of the episodes are known for an Episode.
+        if both the TMDB ids of the series and of the episodes are known for an Episode,
+        and search the series even if its TMDB id is known.
 
     """
     # update the API key
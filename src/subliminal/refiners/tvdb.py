@@ -6,17 +6,20 @@ import logging
 import re
 from datetime import datetime, timedelta, timezone
 from functools import wraps
-from typing import Any, Callable, ClassVar, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, TypeVar, cast
 
 import guessit  # type: ignore[import-untyped]
-import requests
 from babelfish import Country  # type: ignore[import-untyped]
 
 from subliminal import __short_version__
 from subliminal.cache import REFINER_EXPIRATION_TIME, region
+from subliminal.providers import create_session
 from subliminal.utils import decorate_imdb_id, sanitize, sanitize_id
 from subliminal.video import Episode, Video
 
+if TYPE_CHECKING:
+    import requests
+
 C = TypeVar('C', bound=Callable)
 
 
@@ -107,7 +110,7 @@ class TVDBClient:
         self.timeout = timeout
 
         #: Session for the requests
-        self.session = session if session is not None else requests.Session()
+        self.session = session if session is not None else create_session()
         self.session.headers['User-Agent'] = self.user_agent
         self.session.headers.update(headers or {})
         self.session.headers['Content-Type'] = 'application/json'
@@ -336,49 +339,21 @@ tvdb_client = TVDBClient()
 guessit.api.configure()
 
 
-def refine(video: Video, *, apikey: str | None = None, force: bool = False, **kwargs: Any) -> Video:
-    """Refine a video by searching `TheTVDB <https://thetvdb.com/>`_.
-
-    .. note::
-
-        This refiner only work for instances of :class:`~subliminal.video.Episode`.
+def refine_series(video: Episode) -> bool:
+    """Search the series of an episode on TheTVDB and add the series information.
 
-    Several attributes can be found:
-
-      * :attr:`~subliminal.video.Episode.series`
-      * :attr:`~subliminal.video.Episode.year`
-      * :attr:`~subliminal.video.Episode.series_imdb_id`
-      * :attr:`~subliminal.video.Episode.series_tvdb_id`
-      * :attr:`~subliminal.video.Episode.title`
-      * :attr:`~subliminal.video.Video.imdb_id`
-      * :attr:`~subliminal.video.Episode.tvdb_id`
-
-    :param Video video: the Video to refine.
-    :param (str | None) apikey: a personal API key to use TheTVDB.
-    :param bool force: if True, refine even if both the IMDB ids of the series and
-        of the episodes are known for an Episode.
+    :param video: the episode.
+    :type video: :class:`~subliminal.video.Episode`
+    :return: whether the series was found.
+    :rtype: bool
 
     """
-    # only deal with Episode videos
-    if not isinstance(video, Episode):
-        logger.error('Cannot refine movies')
-        return video
-
-    # exit if the information is complete
-    if not force and video.series_tvdb_id and video.tvdb_id:
-        logger.debug('No need to search, TheTVDB ids already exist for the video.')
-        return video
-
-    # update the API key
-    if apikey is not None:
-        tvdb_client.apikey = apikey
-
     # search the series
     logger.info('Searching series %r', video.series)
     results = tvdb_client.search_series(video.series.lower())
     if not results:
         logger.warning('No results for series')
-        return video
+        return False
     logger.debug('Found %d results', len(results))
 
     # search for exact matches
@@ -452,10 +427,10 @@ def refine(video: Video, *, apikey: str | None = None, force: bool = False, **kw
     # exit if we don't have exactly 1 matching result
     if not matching_results:
         logger.error('No matching series found')
-        return video
+        return False
     if len(matching_results) > 1:
         logger.error('Multiple matches found')
-        return video
+        return False
 
     # get the series
     matching_result = matching_results[0]
@@ -471,6 +446,52 @@ def refine(video: Video, *, apikey: str | None = None, force: bool = False, **kw
     video.series_tvdb_id = sanitize_id(series['id'])
     video.series_imdb_id = decorate_imdb_id(sanitize_id(series['imdbId'] or None))
 
+    return True
+
+
+def refine(video: Video, *, apikey: str | None = None, force: bool = False, **kwargs: Any) -> Video:
+    """Refine a video by searching `TheTVDB <https://thetvdb.com/>`_.
+
+    .. note::
+
+        This refiner only work for instances of :class:`~subliminal.video.Episode`.
+
+    Several attributes can be found:
+
+      * :attr:`~subliminal.video.Episode.series`
+      * :attr:`~subliminal.video.Episode.year`
+      * :attr:`~subliminal.video.Episode.series_imdb_id`
+      * :attr:`~subliminal.video.Episode.series_tvdb_id`
+      * :attr:`~subliminal.video.Episode.title`
+      * :attr:`~subliminal.video.Video.imdb_id`
+      * :attr:`~subliminal.video.Episode.tvdb_id`
+
+    :param Video video: the Video to refine.
+    :param (str | None) apikey: a personal API key to use TheTVDB.
+    :param bool force: if True, refine even if both the TheTVDB ids of the series and
+        of the episodes are known for an Episode, and search the series even if its TheTVDB id is known.
+
+    """
+    # only deal with Episode videos
+    if not isinstance(video, Episode):
+        logger.error('Cannot refine movies')
+        return video
+
+    # exit if the information is complete
+    if not force and video.series_tvdb_id and video.tvdb_id:
+        logger.debug('No need to search, TheTVDB ids already exist for the video.')
+        return video
+
+    # update the API key
+    if apikey is not None:
+        tvdb_client.apikey = apikey
+
+    # search the series, unless its id is already known
+    if not force and video.series_tvdb_id:
+        logger.debug('No need to search the series, TheTVDB id already exists for the video.')
+    elif not refine_series(video):
+        return video
+
     # get the episode
     logger.info('Getting series episode %dx%d', video.season, video.episode)
     episode = tvdb_client.get_series_episode(video.series_tvdb_id, video.season, video.episode)
@@ -248,16 +248,57 @@ def get_age(
     :return: the age of the file.
     :rtype: `datetime.timedelta`
     """
-    if not os.path.exists(filepath):
+    try:
+        stat = os.stat(filepath)
+    except OSError:
         return timedelta()
 
-    file_date = modification_date(filepath)
+    return get_stat_age(stat, reference_date=reference_date, use_ctime=use_ctime)
+
+
+def get_stat_age(
+    stat: os.stat_result,
+    *,
+    reference_date: datetime | None = None,
+    use_ctime: bool = False,
+) -> timedelta:
+    """Get the age of a file from its stat result, like :func:`get_age` without accessing the file again.
+
+    :param stat: the stat result of the file, e.g. from :meth:`os.DirEntry.stat`.
+    :param (`datetime.datetime` | None) reference_date: the datetime object
+        to use as reference to calculate age.
+        Defaults to `datetime.now(timeinfo.utc)`.
+    :param bool use_ctime: if True, use the latest of modification
+        and creation time to calculate age, instead of using
+        only the modification time.
+    :return: the age of the file.
+    :rtype: `datetime.timedelta`
+    """
+    file_date = stat.st_mtime
     if use_ctime:
-        file_date = max(file_date, creation_date(filepath))
+        if platform.system() == 'Windows':  # pragma: no cover
+            file_date = max(file_date, stat.st_ctime)
+        else:
+            file_date = max(file_date, getattr(stat, 'st_birthtime', stat.st_mtime))
     reference_date = reference_date if reference_date is not None else datetime.now(timezone.utc)
     return reference_date - datetime.fromtimestamp(file_date, timezone.utc)
 
 
+def get_file_identity(filepath: os.PathLike | str) -> tuple[int, int, int, int] | None:
+    """Get the identity of a file, that changes when the file is replaced or modified.
+
+    :param str filepath: the path of the file.
+    :return: the device, the inode, the size and the modification time in nanoseconds of the file,
+        None if it does not exist.
+    :rtype: tuple of int or None
+    """
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
 def merge_extend_and_ignore_unions(
     lists: ExtendedLists[str],
     default_lists: ExtendedLists[str],
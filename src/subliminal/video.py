@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
+import copy
 import logging
 import os
 from typing import TYPE_CHECKING, Any
 
-from guessit import guessit  # type: ignore[import-untyped]
-
 from subliminal.exceptions import GuessingError
+from subliminal.guess import guessit
 from subliminal.utils import ensure_list, get_age, matches_extended_title
 
 if TYPE_CHECKING:
@@ -234,6 +234,19 @@ class Video:
         # Because it is used in __hash__, it needs to be immutable.
         return self._name
 
+    def with_name(self, name: str) -> Video:
+        """Copy of the video with another `name`, e.g. another path to the same file.
+
+        :param str name: the name or path of the copy.
+        :return: the copy of the video.
+        :rtype: :class:`Video`
+
+        """
+        # the name is immutable, so a copy is returned
+        video = copy.copy(self)
+        video._name = name
+        return video
+
     @property
     def exists(self) -> bool:
         """Test whether the video exists."""
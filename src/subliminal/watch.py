@@ -0,0 +1,387 @@
+"""Watch directories for new videos, with inotify or by polling the directory tree."""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import time
+from stat import S_ISREG
+from typing import TYPE_CHECKING
+
+from .archives import ARCHIVE_EXTENSIONS
+from .video import VIDEO_EXTENSIONS
+
+if TYPE_CHECKING:
+    import threading
+    from collections.abc import Iterator, Sequence
+    from types import TracebackType
+
+logger = logging.getLogger(__name__)
+
+#: inotify event masks, from ``<sys/inotify.h>``
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+#: inotify events of a watched directory
+INOTIFY_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+#: Header of an inotify event: watch descriptor, mask, cookie and length of the name
+INOTIFY_EVENT = struct.Struct('iIII')
+
+
+def is_watched_file(filename: str, *, archives: bool = True) -> bool:
+    """Whether a file is a video or an archive to watch.
+
+    The files are filtered like in :func:`~subliminal.core.collect_video_filepaths`.
+
+    :param str filename: name of the file.
+    :param bool archives: watch the archives.
+    :rtype: bool
+
+    """
+    lower_filename = filename.lower()
+    if not lower_filename.endswith(VIDEO_EXTENSIONS) and not (archives and lower_filename.endswith(ARCHIVE_EXTENSIONS)):
+        return False
+    return not filename.startswith('.') and os.path.splitext(lower_filename)[0] != 'sample'
+
+
+def is_watched_directory(dirname: str) -> bool:
+    """Whether a directory is watched, the hidden and sample directories are skipped.
+
+    :param str dirname: name of the directory.
+    :rtype: bool
+
+    """
+    return not dirname.startswith('.') and dirname.lower() != 'sample'
+
+
+def walk_watched_files(path: str, *, archives: bool = True) -> Iterator[str]:
+    """Walk the directory tree from `path`, yielding the watched files.
+
+    :param str path: path of the directory.
+    :param bool archives: watch the archives.
+    :return: the paths of the watched files.
+    :rtype: Iterator of str
+
+    """
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames[:] = [d for d in dirnames if is_watched_directory(d)]
+        for filename in filenames:
+            if is_watched_file(filename, archives=archives):
+                yield os.path.join(dirpath, filename)
+
+
+def stat_key(path: str) -> tuple[int, int] | None:
+    """Size and modification time in nanoseconds of a regular file, None if it is not one."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    if not S_ISREG(stat.st_mode):
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class PollingBackend:
+    """Detect the changed files by walking the directory trees periodically.
+
+    :param paths: the directories to watch.
+    :param bool archives: watch the archives.
+    :param float interval: time between two walks of the directory trees, in seconds.
+
+    """
+
+    def __init__(self, paths: Sequence[str], *, archives: bool = True, interval: float = 30.0) -> None:
+        self.paths = list(paths)
+        self.archives = archives
+        self.interval = interval
+        self._snapshot = self._walk()
+        self._next_walk = time.monotonic() + interval
+
+    def _walk(self) -> dict[str, tuple[int, int]]:
+        snapshot = {}
+        for path in self.paths:
+            for filepath in walk_watched_files(path, archives=self.archives):
+                key = stat_key(filepath)
+                if key is not None:
+                    snapshot[filepath] = key
+        return snapshot
+
+    def read(self, timeout: float | None) -> set[str]:
+        """Wait for the next walk of the directory trees, at most `timeout` seconds.
+
+        :param (float | None) timeout: maximum time to wait, in seconds, None to wait for the next walk.
+        :return: the new or modified files since the previous walk.
+        :rtype: set of str
+
+        """
+        remaining = self._next_walk - time.monotonic()
+        if timeout is not None and timeout < remaining:
+            time.sleep(max(timeout, 0))
+            return set()
+        time.sleep(max(remaining, 0))
+
+        self._next_walk = time.monotonic() + self.interval
+        snapshot = self._walk()
+        changed = {p for p, key in snapshot.items() if self._snapshot.get(p) != key}
+        self._snapshot = snapshot
+        return changed
+
+    def close(self) -> None:
+        """Stop watching."""
+
+
+class InotifyBackend:
+    """Detect the changed files with the Linux inotify API, with a watch for each directory.
+
+    :param paths: the directories to watch.
+    :param bool archives: watch the archives.
+    :raises: :class:`OSError`: inotify is not available or the directories cannot be watched,
+        e.g. because the limit of watches is reached.
+
+    """
+
+    def __init__(self, paths: Sequence[str], *, archives: bool = True) -> None:
+        if not sys.platform.startswith('linux'):
+            msg = 'inotify is only available on Linux'
+            raise OSError(msg)
+        try:
+            self._libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+            self._libc.inotify_init1  # noqa: B018
+        except (OSError, AttributeError) as e:
+            msg = 'inotify is not available'
+            raise OSError(msg) from e
+
+        self.paths = list(paths)
+        self.archives = archives
+        self._started = time.time_ns()
+        self._directories: dict[int, str] = {}
+
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        try:
+            for path in self.paths:
+                self._add_tree(path)
+        except OSError:
+            self.close()
+            raise
+
+    def _add_watch(self, path: str) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), INOTIFY_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), path)
+        self._directories[wd] = path
+
+    def _add_tree(self, path: str) -> list[str]:
+        """Watch a directory tree, and return the watched files already in the tree."""
+        filepaths: list[str] = []
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames[:] = [d for d in dirnames if is_watched_directory(d)]
+            self._add_watch(dirpath)
+            filepaths.extend(os.path.join(dirpath, f) for f in filenames if is_watched_file(f, archives=self.archives))
+        return filepaths
+
+    def _new_files(self) -> set[str]:
+        """Files modified since the backend was started, to recover from a queue overflow."""
+        changed = set()
+        for path in self.paths:
+            for filepath in walk_watched_files(path, archives=self.archives):
+                try:
+                    if os.stat(filepath).st_mtime_ns >= self._started:
+                        changed.add(filepath)
+                except OSError:  # pragma: no cover
+                    continue
+        return changed
+
+    def read(self, timeout: float | None) -> set[str]:
+        """Wait for inotify events, at most `timeout` seconds.
+
+        :param (float | None) timeout: maximum time to wait, in seconds, None to wait for an event.
+        :return: the new or modified files.
+        :rtype: set of str
+
+        """
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:  # pragma: no cover
+            return set()
+
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = INOTIFY_EVENT.unpack_from(data, offset)
+            name = os.fsdecode(data[offset + INOTIFY_EVENT.size : offset + INOTIFY_EVENT.size + length].rstrip(b'\0'))
+            offset += INOTIFY_EVENT.size + length
+
+            if mask & IN_Q_OVERFLOW:
+                logger.warning('Too many inotify events, searching the new files')
+                changed.update(self._new_files())
+                continue
+            if mask & IN_IGNORED:
+                self._directories.pop(wd, None)
+                continue
+            dirpath = self._directories.get(wd)
+            if dirpath is None or not name:
+                continue
+
+            path = os.path.join(dirpath, name)
+            if mask & IN_ISDIR:
+                # watch the new directory, it can already contain files if it was moved
+                if mask & (IN_CREATE | IN_MOVED_TO) and is_watched_directory(name):
+                    try:
+                        changed.update(self._add_tree(path))
+                    except OSError:
+                        logger.warning('Cannot watch directory %r', path)
+            elif is_watched_file(name, archives=self.archives):
+                changed.add(path)
+
+        return changed
+
+    def close(self) -> None:
+        """Stop watching."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        self._directories.clear()
+
+
+class VideoWatcher:
+    """Watch directories for new videos and archives.
+
+    The files are reported once they are complete: when their size and modification time did not
+    change for `settle` seconds, to skip the files that are still being written or copied.
+    The files that exist when the watcher is created are not reported.
+
+    The changes are detected with inotify on Linux, otherwise, or if `polling` is True, the directory trees
+    are walked every `interval` seconds.
+
+    :param paths: the directories to watch.
+    :param bool archives: watch the archives.
+    :param float settle: time without changes before a file is considered complete, in seconds.
+    :param float interval: time between two walks of the directory trees when polling, in seconds.
+    :param bool polling: walk the directory trees instead of using inotify.
+
+    """
+
+    #: Backend detecting the changed files
+    backend: InotifyBackend | PollingBackend
+
+    def __init__(
+        self,
+        paths: Sequence[str | os.PathLike],
+        *,
+        archives: bool = True,
+        settle: float = 5.0,
+        interval: float = 30.0,
+        polling: bool = False,
+    ) -> None:
+        directories = [os.path.abspath(p) for p in paths]
+        for directory in directories:
+            if not os.path.isdir(directory):
+                msg = f'Path is not a directory: {directory!r}'
+                raise ValueError(msg)
+
+        self.settle = settle
+        if not polling:
+            try:
+                self.backend = InotifyBackend(directories, archives=archives)
+            except OSError as e:
+                logger.warning('Cannot use inotify, polling the directories instead: %s', e)
+                polling = True
+        if polling:
+            self.backend = PollingBackend(directories, archives=archives, interval=interval)
+        logger.info('Watching %d directories with %s', len(directories), type(self.backend).__name__)
+
+        #: Files not complete yet, with their size, modification time and the time of their last change
+        self._pending: dict[str, tuple[tuple[int, int], float]] = {}
+        #: Complete files with their size and modification time, to report them only once
+        self._completed: dict[str, tuple[int, int]] = {}
+
+    def _settled(self) -> list[str]:
+        """Update the pending files and return the complete ones."""
+        now = time.monotonic()
+        completed = []
+        for path, (key, since) in list(self._pending.items()):
+            new_key = stat_key(path)
+            if new_key is None:
+                logger.debug('Pending file %r was removed', path)
+                del self._pending[path]
+            elif new_key != key:
+                self._pending[path] = (new_key, now)
+            elif now - since >= self.settle:
+                del self._pending[path]
+                if self._completed.get(path) != key and key[0] > 0:
+                    self._completed[path] = key
+                    completed.append(path)
+        return sorted(completed)
+
+    def poll(self, timeout: float | None = None) -> list[str]:
+        """Wait for changes, at most `timeout` seconds, and return the files that are complete.
+
+        :param (float | None) timeout: maximum time to wait, in seconds, None to wait for a change.
+        :return: the paths of the complete files.
+        :rtype: list of str
+
+        """
+        # check the pending files often enough to report them when they are complete
+        if self._pending:
+            timeout = min(self.settle / 2, timeout) if timeout is not None else self.settle / 2
+
+        changed = self.backend.read(timeout)
+        # the settle time starts when the changes are read, not before waiting for them
+        now = time.monotonic()
+        for path in changed:
+            key = stat_key(path)
+            if key is not None and self._completed.get(path) != key:
+                logger.debug('File %r changed', path)
+                self._pending[path] = (key, now)
+
+        return self._settled()
+
+    def watch(self, stop: threading.Event | None = None, *, timeout: float = 1.0) -> Iterator[list[str]]:
+        """Watch the directories, yielding the files as soon as they are complete.
+
+        :param stop: stop watching when this event is set.
+        :type stop: :class:`threading.Event`
+        :param float timeout: maximum time between two checks of the `stop` event, in seconds.
+        :return: the paths of the complete files, by batch.
+        :rtype: Iterator of list of str
+
+        """
+        while stop is None or not stop.is_set():
+            completed = self.poll(timeout)
+            if completed:
+                yield completed
+
+    def close(self) -> None:
+        """Stop watching."""
+        self.backend.close()
+
+    def __enter__(self) -> VideoWatcher:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} [{type(self.backend).__name__}]>'
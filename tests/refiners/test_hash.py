@@ -1,9 +1,15 @@
+import os
+import shutil
 from pathlib import Path
+from unittest.mock import Mock
 
+import pytest
 from babelfish import Language  # type: ignore[import-untyped]
+from dogpile.cache import make_region
 
+import subliminal.refiners.hash
 from subliminal.extensions import get_default_providers
-from subliminal.refiners.hash import hash_opensubtitles, refine
+from subliminal.refiners.hash import hash_cache_key, hash_opensubtitles, hash_videos, refine
 from subliminal.video import Movie
 
 
@@ -56,3 +62,83 @@ def test_refine_no_language(mkv: dict[str, str]) -> None:
     refine(video, providers=['napiprojekt'], languages=languages)
 
     assert len(video.hashes) == 0
+
+
+@pytest.fixture
+def memory_region(monkeypatch: pytest.MonkeyPatch) -> None:
+    region = make_region().configure('dogpile.cache.memory')
+    monkeypatch.setattr(subliminal.refiners.hash, 'region', region)
+
+
+def test_hash_cache_key(mkv: dict[str, str], tmp_path: Path) -> None:
+    path = shutil.copy(mkv['test1'], tmp_path / 'test1.mkv')
+    key = hash_cache_key(path)
+    assert key is not None
+    assert key.startswith('hashes:')
+
+    # the key changes with the file
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert hash_cache_key(path) != key
+
+    assert hash_cache_key(tmp_path / 'missing.mkv') is None
+
+
+@pytest.mark.usefixtures('memory_region')
+def test_refine_hash_cache(mkv: dict[str, str], tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = shutil.copy(mkv['test1'], tmp_path / 'test1.mkv')
+    providers = ['opensubtitles', 'napiprojekt']
+    expected = {'opensubtitles': '40b44a7096b71ec3', 'napiprojekt': '9884a2b66dcb2965d0f45ce84e37b60c'}
+
+    video = Movie.fromguess(os.fspath(path), {'type': 'movie', 'title': 'Titanic'})
+    video.size = 10485761
+    refine(video, providers=providers)
+    assert video.hashes == expected
+
+    # the file is not read again
+    compute_hashes = Mock(wraps=subliminal.refiners.hash.compute_hashes)
+    monkeypatch.setattr(subliminal.refiners.hash, 'compute_hashes', compute_hashes)
+    video = Movie.fromguess(os.fspath(path), {'type': 'movie', 'title': 'Titanic'})
+    video.size = 10485761
+    refine(video, providers=providers)
+    assert video.hashes == expected
+    compute_hashes.assert_not_called()
+
+    # the cache is bypassed
+    video.hashes = {}
+    refine(video, providers=providers, hash_cache=False)
+    assert video.hashes == expected
+    compute_hashes.assert_called_once()
+
+    # the file changed
+    stat = os.stat(path)
+    with open(path, 'r+b') as f:
+        f.write(b'changed')
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    compute_hashes.reset_mock()
+    video.hashes = {}
+    refine(video, providers=providers)
+    assert video.hashes.keys() == expected.keys()
+    assert video.hashes != expected
+    compute_hashes.assert_called_once()
+
+
+@pytest.mark.parametrize(('workers', 'sort'), [(1, True), (4, True), (4, False)])
+def test_hash_videos(mkv: dict[str, str], tmp_path: Path, workers: int, sort: bool) -> None:
+    videos = []
+    for i in range(5):
+        path = shutil.copy(mkv['test1'], tmp_path / f'test{i}.mkv')
+        video = Movie.fromguess(os.fspath(path), {'type': 'movie', 'title': 'Titanic'})
+        video.size = 10485761
+        videos.append(video)
+
+    # the errors are logged, the other videos are hashed
+    missing = Movie.fromguess(os.fspath(tmp_path / 'missing.mkv'), {'type': 'movie', 'title': 'Titanic'})
+    missing.size = 10485761
+    videos.insert(2, missing)
+
+    refined = hash_videos(videos, workers=workers, sort=sort, providers=['opensubtitles'], hash_cache=False)
+
+    assert refined == videos
+    assert missing.hashes == {}
+    assert all(v.hashes == {'opensubtitles': '40b44a7096b71ec3'} for v in videos if v is not missing)
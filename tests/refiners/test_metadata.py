@@ -1,20 +1,30 @@
 from __future__ import annotations
 
 import logging
+import os
 from datetime import timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
+from unittest.mock import Mock
 
 import pytest
 from babelfish import Language  # type: ignore[import-untyped]
+from dogpile.cache import make_region
 from knowit.units import units  # type: ignore[import-untyped]
 
+import subliminal.refiners.metadata
 from subliminal.core import scan_video
 from subliminal.refiners.metadata import (
+    KnowitProviders,
     get_float,
     get_subtitle_format,
     loaded_providers,
     refine,
+    summarize_media,
 )
+from subliminal.video import Movie
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 providers = ['mediainfo', 'ffmpeg', 'mkvmerge', 'enzyme']
 
@@ -141,3 +151,79 @@ def test_refine_no_subtitle_track(mkv: dict[str, Any]) -> None:
     assert scanned_video.duration == 87.336
     assert scanned_video.resolution == '480p'
     assert len(scanned_video.subtitle_languages) == 0
+
+
+media = {
+    'provider': 'mediainfo',
+    'duration': timedelta(seconds=46.665),
+    'video': [{'resolution': '720p', 'frame_rate': 24 * units.FPS, 'codec': 'H.264'}],
+    'audio': [{'codec': 'AAC', 'channels': 2}],
+    'subtitle': [{'language': Language('fra'), 'forced': True, 'format': 'SubRip', 'name': 'French'}],
+}
+
+
+def test_summarize_media() -> None:
+    assert summarize_media(media) == {
+        'provider': 'mediainfo',
+        'duration': 46.665,
+        'video': [{'default': False, 'resolution': '720p', 'frame_rate': 24.0, 'codec': 'H.264'}],
+        'audio': [{'default': False, 'codec': 'AAC'}],
+        'subtitle': [{'language': Language('fra'), 'forced': True, 'format': 'SubRip'}],
+    }
+
+
+def test_refine_metadata_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(subliminal.refiners.metadata, 'region', make_region().configure('dogpile.cache.memory'))
+    know = Mock(return_value=media)
+    monkeypatch.setattr(subliminal.refiners.metadata, 'know', know)
+    path = tmp_path / 'man.of.steel.2013.720p.bluray.x264-felony.mkv'
+    path.write_bytes(b'video')
+
+    video = Movie(os.fspath(path), 'Man of Steel')
+    refine(video)
+    assert know.call_count == 1
+    assert video.duration == 46.665
+    assert video.frame_rate == 24.0
+    assert video.subtitle_languages == {Language('fra')}
+
+    # the metadata are taken from the cache
+    video = Movie(os.fspath(path), 'Man of Steel')
+    refine(video)
+    assert know.call_count == 1
+    assert video.video_codec == 'H.264'
+    assert video.audio_codec == 'AAC'
+    assert video.subtitle_languages == {Language('fra')}
+
+    # the cache is bypassed
+    refine(video, force=True)
+    assert know.call_count == 2
+
+    # the file changed
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    refine(video)
+    assert know.call_count == 3
+
+
+def test_knowit_providers(monkeypatch: pytest.MonkeyPatch) -> None:
+    dependencies = Mock(return_value={'mediainfo': {'pymediainfo': '6.0', 'libmediainfo': '23.0'}, 'ffmpeg': {}})
+    monkeypatch.setattr(subliminal.refiners.metadata, 'dependencies', dependencies)
+    knowit_providers = KnowitProviders()
+    expected = {'mediainfo': True, 'ffmpeg': False}
+
+    assert knowit_providers.get() == expected
+    assert knowit_providers.get() == expected
+    assert dependencies.call_count == 1
+
+    # other options
+    assert knowit_providers.get({'ffmpeg': '/opt/bin/ffmpeg'}) == expected
+    assert dependencies.call_count == 2
+    assert knowit_providers.get({'ffmpeg': '/opt/bin/ffmpeg'}) == expected
+    assert dependencies.call_count == 2
+
+    # explicit invalidation
+    knowit_providers.get(refresh=True)
+    assert dependencies.call_count == 3
+    knowit_providers.clear()
+    knowit_providers.get()
+    assert dependencies.call_count == 4
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import pytest
+
+from subliminal.circuitbreaker import CircuitBreaker, CircuitState
+
+# Core test
+pytestmark = pytest.mark.core
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def time(self) -> float:
+        return self.now
+
+
+def test_circuit_breaker_closed() -> None:
+    breaker = CircuitBreaker(window=10, min_requests=4, error_rate_threshold=0.5)
+    for _ in range(10):
+        assert breaker.allow_request()
+        breaker.record(success=True)
+
+    # a few errors do not open the circuit
+    for _ in range(4):
+        assert breaker.allow_request()
+        breaker.record(success=False)
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.error_rate == pytest.approx(0.4)
+    assert breaker.successes == 10
+    assert breaker.failures == 4
+
+
+def test_circuit_breaker_error_rate() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(window=10, min_requests=4, error_rate_threshold=0.5, recovery_timeout=60, clock=clock.time)
+
+    breaker.record(success=True)
+    breaker.record(success=False)
+    breaker.record(success=True)
+    assert breaker.state is CircuitState.CLOSED
+    breaker.record(success=False)
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.times_opened == 1
+
+    assert not breaker.allow_request()
+    assert breaker.rejected == 1
+
+
+def test_circuit_breaker_latency() -> None:
+    breaker = CircuitBreaker(min_requests=2, latency_threshold=1)
+    breaker.record(success=True, latency=0.5)
+    breaker.record(success=True, latency=5)
+    assert breaker.slow_requests == 1
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_circuit_breaker_recovery() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(recovery_timeout=60, clock=clock.time)
+
+    breaker.trip()
+    assert breaker.state is CircuitState.OPEN
+    clock.now += 59
+    assert not breaker.allow_request()
+
+    # a single trial request is allowed
+    clock.now += 1
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+    # the trial request fails, open again
+    breaker.record(success=False)
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.times_opened == 2
+
+    # the trial request succeeds, close
+    clock.now += 60
+    assert breaker.allow_request()
+    breaker.record(success=True)
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.allow_request()
+    assert 'closed' in breaker.summary()
+
+
+def test_circuit_breaker_no_recovery() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(recovery_timeout=None, clock=clock.time)
+
+    breaker.trip()
+    clock.now += 1e6
+    assert breaker.state is CircuitState.OPEN
+
+    breaker.reset()
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_circuit_breaker_invalid() -> None:
+    with pytest.raises(ValueError):  # noqa: PT011
+        CircuitBreaker(error_rate_threshold=0)
@@ -4,7 +4,7 @@ from __future__ import annotations
 import os
 from pathlib import Path
 from textwrap import dedent
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest.mock import Mock
 
 import pytest
@@ -203,7 +203,117 @@ def test_cli_download(tmp_path: os.PathLike[str]) -> None:
     assert content.startswith(expected)
 
 
-def test_cli_download_directory(tmp_path: os.PathLike[str]) -> None:
+def test_cli_download_index(tmp_path: os.PathLike[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    runner = CliRunner()
+    cache_dir = os.path.join(tmp_path, 'cache')
+    movie_name = os.path.join('Man of Steel (2013)', 'man.of.steel.2013.720p.bluray.x264-felony.mkv')
+    episode_name = 'Marvels.Agents.of.S.H.I.E.L.D.S02E06.720p.HDTV.x264-KILLERS.mkv'
+
+    with runner.isolated_filesystem(temp_dir=tmp_path):
+        ensure(movie_name)
+        ensure(episode_name)
+        args = ['--cache-dir', cache_dir, 'download', '--index', '-l', 'en', '-p', 'podnapisi', '.']
+
+        result = runner.invoke(subliminal_cli, args)
+        assert result.exit_code == 0
+        assert result.output.endswith('Downloaded 2 subtitles\n')
+
+        result = runner.invoke(subliminal_cli, ['--cache-dir', cache_dir, 'index', '-l', 'en', '-l', 'fr'])
+        assert result.exit_code == 0
+        assert len(result.output.splitlines()) == 2
+        assert all(line.endswith(': fr') for line in result.output.splitlines())
+
+        # the unchanged videos are not scanned nor refined again
+        mock_scan_video_path = Mock()
+        monkeypatch.setattr('subliminal.cli.scan_video_path', mock_scan_video_path)
+        mock_refine_many = Mock()
+        monkeypatch.setattr('subliminal.cli.refine_many', mock_refine_many)
+        result = runner.invoke(subliminal_cli, [*args[:-1], '-l', 'fr', '.'])
+        assert result.exit_code == 0
+        mock_scan_video_path.assert_not_called()
+        assert mock_refine_many.call_args.args[0] == []
+
+        # the videos are refined again with other providers
+        result = runner.invoke(subliminal_cli, [*args[:-1], '-p', 'gestdown', '-l', 'fr', '.'])
+        assert result.exit_code == 0
+        mock_scan_video_path.assert_not_called()
+        assert len(mock_refine_many.call_args.args[0]) == 2
+
+        result = runner.invoke(subliminal_cli, ['--cache-dir', cache_dir, 'index'])
+        assert result.exit_code == 0
+        assert result.output == '2 videos in the library index.\n'
+
+        result = runner.invoke(subliminal_cli, ['--cache-dir', cache_dir, 'index', '--clear'])
+        assert result.exit_code == 0
+        assert result.output == 'Library index cleared.\n'
+
+
+def test_cli_watch(tmp_path: os.PathLike[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    runner = CliRunner()
+    video_name = 'Marvels.Agents.of.S.H.I.E.L.D.S02E06.720p.HDTV.x264-KILLERS.mkv'
+
+    mock_watcher = Mock()
+    mock_watcher.return_value.__enter__ = Mock(return_value=mock_watcher.return_value)
+    mock_watcher.return_value.__exit__ = Mock(return_value=None)
+    mock_watcher.return_value.watch.return_value = iter([[video_name]])
+    monkeypatch.setattr('subliminal.cli.VideoWatcher', mock_watcher)
+
+    with runner.isolated_filesystem(temp_dir=tmp_path):
+        ensure(video_name)
+        result = runner.invoke(subliminal_cli, ['watch', '-l', 'en', '-p', 'podnapisi', '--settle', '1', '.'])
+
+        assert result.exit_code == 0
+        assert mock_watcher.call_args.kwargs['settle'] == 1
+        assert result.output.endswith(f'1 subtitle downloaded for {video_name}\n')
+        assert os.path.isfile(os.path.splitext(video_name)[0] + '.en.srt')
+
+
+def test_cli_watch_download_options_and_errors(tmp_path: os.PathLike[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    import subliminal.cli
+
+    runner = CliRunner()
+    video_name = 'Marvels.Agents.of.S.H.I.E.L.D.S02E06.720p.HDTV.x264-KILLERS.mkv'
+
+    mock_watcher = Mock()
+    mock_watcher.return_value.__enter__ = Mock(return_value=mock_watcher.return_value)
+    mock_watcher.return_value.__exit__ = Mock(return_value=None)
+    mock_watcher.return_value.watch.return_value = iter([[video_name], [video_name]])
+    monkeypatch.setattr('subliminal.cli.VideoWatcher', mock_watcher)
+
+    mock_iter_download_videos = Mock(wraps=subliminal.cli.iter_download_videos)
+    monkeypatch.setattr('subliminal.cli.iter_download_videos', mock_iter_download_videos)
+
+    # the first batch fails to save the subtitles
+    save_subtitles = subliminal.cli.save_subtitles
+    mock_save_subtitles = Mock(side_effect=[PermissionError('Permission denied'), None])
+
+    def failing_save_subtitles(*args: Any, **kwargs: Any) -> Any:
+        mock_save_subtitles(*args, **kwargs)
+        return save_subtitles(*args, **kwargs)
+
+    monkeypatch.setattr('subliminal.cli.save_subtitles', failing_save_subtitles)
+
+    with runner.isolated_filesystem(temp_dir=tmp_path):
+        ensure(video_name)
+        result = runner.invoke(
+            subliminal_cli,
+            ['watch', '-l', 'en', '-p', 'podnapisi', '-FO', '-F', 'srt', '--language-format', 'alpha3', '.'],
+        )
+
+        # the watcher goes on after the error
+        assert result.exit_code == 0
+        assert f'{video_name} errored' in result.output
+        assert result.output.endswith(f'1 subtitle downloaded for {video_name}\n')
+        assert mock_save_subtitles.call_count == 2
+
+        # the download options are used
+        assert mock_iter_download_videos.call_args.kwargs['foreign_only'] is False
+        assert mock_save_subtitles.call_args.kwargs['subtitle_format'] == 'srt'
+        assert os.path.isfile(os.path.splitext(video_name)[0] + '.eng.srt')
+
+
+@pytest.mark.parametrize('scan_jobs', [1, 2])
+def test_cli_download_directory(tmp_path: os.PathLike[str], scan_jobs: int) -> None:
     runner = CliRunner()
     movie_name = os.path.join('Man of Steel (2013)', 'man.of.steel.2013.720p.bluray.x264-felony.mkv')
     episode_name = 'Marvels.Agents.of.S.H.I.E.L.D.S02E06.720p.HDTV.x264-KILLERS.mkv'
@@ -212,7 +322,10 @@ def test_cli_download_directory(tmp_path: os.PathLike[str]) -> None:
         ensure(movie_name)
         ensure(episode_name)
 
-        result = runner.invoke(subliminal_cli, ['download', '-l', 'en', '-p', 'podnapisi', '.'])
+        result = runner.invoke(
+            subliminal_cli,
+            ['download', '-l', 'en', '-p', 'podnapisi', '--scan-jobs', str(scan_jobs), '.'],
+        )
 
         assert result.exit_code == 0
         assert result.output.startswith('Collecting videos')
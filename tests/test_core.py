@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import os
+import types
 from datetime import datetime, timedelta, timezone
 from textwrap import dedent
 from typing import TYPE_CHECKING, Any
@@ -11,15 +12,20 @@ import pytest
 from babelfish import Language  # type: ignore[import-untyped]
 
 from subliminal.core import (
+    SubtitleListing,
     check_video,
+    collect_video_filepaths,
+    hash_match_predicate,
     save_subtitles,
     scan_name,
     scan_path,
+    scan_paths,
     scan_video,
     scan_video_or_archive,
     scan_videos,
     search_external_subtitles,
 )
+from subliminal.index import LibraryIndex
 from subliminal.subtitle import Subtitle
 from subliminal.utils import timestamp
 from subliminal.video import Episode, Movie
@@ -28,10 +34,32 @@ from tests.conftest import ensure
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from subliminal.providers.mock import MockSubtitle
+
 # Core test
 pytestmark = pytest.mark.core
 
 
+def test_hash_match_predicate(movies: dict[str, Movie], subtitles: dict[str, MockSubtitle]) -> None:
+    video = movies['man_of_steel']
+    hash_subtitle = subtitles['man_of_steel==hash']
+    other_subtitle = subtitles['man_of_steel==imdb_id']
+
+    predicate = hash_match_predicate(video, {Language('eng')})
+    assert not predicate([])
+    assert not predicate([other_subtitle])
+    assert predicate([other_subtitle, hash_subtitle])
+
+    # a hash match is needed for every language, unless only one subtitle is needed
+    languages = {Language('eng'), Language('fra')}
+    assert not hash_match_predicate(video, languages)([hash_subtitle])
+    assert hash_match_predicate(video, languages, only_one=True)([hash_subtitle])
+
+    # subtitles that would not be selected are not considered
+    assert not hash_match_predicate(video, {Language('eng')}, ignore_subtitles=[hash_subtitle.id])([hash_subtitle])
+    assert not hash_match_predicate(video, {Language('eng')}, hearing_impaired=True)([hash_subtitle])
+
+
 def test_check_video_languages(movies: dict[str, Movie]) -> None:
     video = movies['man_of_steel']
     languages = {Language('fra'), Language('eng')}
@@ -130,6 +158,45 @@ def test_search_external_subtitles_in_directory(episodes: dict[str, Episode], tm
     assert subtitle_languages == expected_subtitles
 
 
+def test_search_external_subtitles_listing(
+    episodes: dict[str, Episode],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    video_names = [os.path.basename(episodes['bbt_s07e05'].name), os.path.basename(episodes['got_s03e10'].name)]
+    for video_name in video_names:
+        ensure(tmp_path / 'tvshows' / video_name)
+        video_root = os.path.splitext(video_name)[0]
+        ensure(tmp_path / 'tvshows' / (video_root + '.en.srt'))
+        ensure(tmp_path / 'tvshows' / (video_name + '.fr.sub'))
+    ensure(tmp_path / 'tvshows' / 'other.en.srt')
+
+    # the directory is listed when walking it
+    subtitle_listing = SubtitleListing()
+    filepaths = list(collect_video_filepaths(tmp_path / 'tvshows', subtitle_listing=subtitle_listing))
+    assert len(subtitle_listing) == 1
+    mock_listdir = Mock(side_effect=os.listdir)
+    monkeypatch.setattr('subliminal.core.os.listdir', mock_listdir)
+
+    for filepath in filepaths:
+        subtitles = search_external_subtitles(filepath, subtitle_listing=subtitle_listing)
+        assert {s.language for s in subtitles.values()} == {Language('eng'), Language('fra')}
+    mock_listdir.assert_not_called()
+
+    # the same subtitles are found without the listing
+    for filepath in filepaths:
+        expected = search_external_subtitles(filepath)
+        subtitles = search_external_subtitles(filepath, subtitle_listing=subtitle_listing)
+        assert {p: s.language for p, s in subtitles.items()} == {p: s.language for p, s in expected.items()}
+
+    # the directory is listed again once invalidated
+    subtitle_listing.invalidate()
+    mock_listdir.reset_mock()
+    search_external_subtitles(filepaths[0], subtitle_listing=subtitle_listing)
+    search_external_subtitles(filepaths[1], subtitle_listing=subtitle_listing)
+    assert mock_listdir.call_count == 1
+
+
 def test_scan_video_movie(movies: dict[str, Movie], tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     video = movies['man_of_steel']
     monkeypatch.chdir(tmp_path)
@@ -364,6 +431,93 @@ def test_scan_videos(movies: dict[str, Movie], tmp_path: Path, monkeypatch: pyte
     mock_scan_archive.assert_has_calls(scan_archive_calls, any_order=True)  # type: ignore[arg-type]
 
 
+@pytest.mark.parametrize('max_workers', [1, 4])
+def test_collect_video_filepaths(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, max_workers: int) -> None:
+    monkeypatch.chdir(tmp_path)
+    ensure(tmp_path / 'videos' / 'b.mkv')
+    ensure(tmp_path / 'videos' / 'a.mkv')
+    ensure(tmp_path / 'videos' / 'a.nfo')
+    ensure(tmp_path / 'videos' / 'archive.rar')
+    ensure(tmp_path / 'videos' / 'show' / 'season 1' / 'episode.mkv')
+    ensure(tmp_path / 'videos' / 'show' / 'sample' / 'episode.mkv')
+    ensure(tmp_path / 'videos' / '.hidden' / 'episode.mkv')
+    ensure(tmp_path / 'other' / 'movie.mkv')
+    (tmp_path / 'videos' / 'link').symlink_to(tmp_path / 'other', target_is_directory=True)
+    ts = timestamp(datetime.now(timezone.utc) - timedelta(days=10))
+    os.utime(ensure(tmp_path / 'videos' / 'show' / 'old.mkv'), (ts, ts))
+
+    filepaths = collect_video_filepaths('videos', max_workers=max_workers)
+    assert isinstance(filepaths, types.GeneratorType)
+    filepaths_list = list(filepaths)
+    assert sorted(filepaths_list) == [
+        os.path.join('videos', 'a.mkv'),
+        os.path.join('videos', 'archive.rar'),
+        os.path.join('videos', 'b.mkv'),
+        os.path.join('videos', 'show', 'old.mkv'),
+        os.path.join('videos', 'show', 'season 1', 'episode.mkv'),
+    ]
+    # files of a directory are sorted
+    assert filepaths_list.index(os.path.join('videos', 'a.mkv')) < filepaths_list.index(os.path.join('videos', 'b.mkv'))
+
+    filepaths_list = list(
+        collect_video_filepaths('videos', age=timedelta(days=7), archives=False, max_workers=max_workers)
+    )
+    assert sorted(filepaths_list) == [
+        os.path.join('videos', 'a.mkv'),
+        os.path.join('videos', 'b.mkv'),
+        os.path.join('videos', 'show', 'season 1', 'episode.mkv'),
+    ]
+
+
+def test_collect_video_filepaths_close(tmp_path: Path) -> None:
+    for i in range(10):
+        ensure(tmp_path / f'dir{i}' / 'video.mkv')
+
+    filepaths = collect_video_filepaths(tmp_path)
+    assert next(filepaths).endswith('video.mkv')
+    filepaths.close()
+
+
+def test_scan_videos_index(movies: dict[str, Movie], tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    ensure(tmp_path / 'movies' / movies['man_of_steel'].name)
+    mock_scan_video = Mock(wraps=scan_video)
+    monkeypatch.setattr('subliminal.core.scan_video', mock_scan_video)
+    monkeypatch.chdir(tmp_path)
+
+    with LibraryIndex() as index:
+        videos = scan_videos('movies', index=index)
+        assert len(videos) == 1
+        assert mock_scan_video.call_count == 1
+
+        # the unchanged video is taken from the index
+        indexed_videos = scan_videos('movies', index=index)
+        assert mock_scan_video.call_count == 1
+        assert [v.name for v in indexed_videos] == [videos[0].name]
+        assert indexed_videos[0].title == videos[0].title
+
+        # the changed video is scanned again
+        with open(videos[0].name, 'ab') as f:
+            f.write(b'content')
+        scan_videos('movies', index=index)
+        assert mock_scan_video.call_count == 2
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_scan_paths(episodes: dict[str, Episode], tmp_path: Path, workers: int) -> None:
+    video_path = ensure(tmp_path / 'videos' / episodes['bbt_s07e05'].name)
+    nfo_path = ensure(tmp_path / 'videos' / 'video.nfo')
+    filepaths = [episodes['got_s03e10'].name, os.fspath(video_path), os.fspath(nfo_path)]
+
+    results = list(scan_paths(filepaths, workers=workers))
+
+    assert [path for path, _ in results] == filepaths
+    assert isinstance(results[0][1], Episode)
+    assert results[0][1].series == episodes['got_s03e10'].series
+    assert isinstance(results[1][1], Episode)
+    assert results[1][1].size == 0
+    assert results[2][1] is None
+
+
 def test_scan_videos_age(movies: dict[str, Movie], tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     ensure(tmp_path / 'movies' / movies['man_of_steel'].name)
     ts = timestamp(datetime.now(timezone.utc) - timedelta(days=10))
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pytest
+from dogpile.cache import make_region
+
+from subliminal.guess import GuessCache
+
+# Core test
+pytestmark = pytest.mark.core
+
+release_name = 'The.Big.Bang.Theory.S05E18.HDTV.x264-LOL.mp4'
+
+
+def test_guess_cache() -> None:
+    cache = GuessCache()
+    guess = cache.guess(release_name)
+    assert guess['title'] == 'The Big Bang Theory'
+    assert guess['season'] == 5
+    assert cache.misses == 1
+
+    # the result is copied
+    guess['title'] = 'Modified'
+    assert cache.guess(release_name)['title'] == 'The Big Bang Theory'
+    assert cache.hits == 1
+
+    # the options are part of the key
+    assert cache.guess(release_name, {'type': 'movie'})['type'] == 'movie'
+    assert cache.misses == 2
+    assert cache.hit_rate == pytest.approx(1 / 3)
+    assert cache.summary() == '3 guesses, 33% hit rate (1 in memory, 0 persistent, 2 guessit calls)'
+
+
+def test_guess_cache_maxsize(monkeypatch: pytest.MonkeyPatch) -> None:
+    mock_guessit = Mock(side_effect=lambda string, options: {'title': string})
+    monkeypatch.setattr('subliminal.guess._guessit', mock_guessit)
+
+    cache = GuessCache(maxsize=2)
+    for name in ('a', 'b', 'a', 'c', 'a', 'b'):
+        cache.guess(name)
+
+    # 'b' was the least recently used when 'c' was added
+    assert len(cache) == 2
+    assert [c.args[0] for c in mock_guessit.call_args_list] == ['a', 'b', 'c', 'b']
+    assert cache.hits == 2
+
+
+def test_guess_cache_persistent(monkeypatch: pytest.MonkeyPatch) -> None:
+    region = make_region().configure('dogpile.cache.memory')
+    monkeypatch.setattr('subliminal.guess.region', region)
+    mock_guessit = Mock(side_effect=lambda string, options: {'title': string})
+    monkeypatch.setattr('subliminal.guess._guessit', mock_guessit)
+
+    GuessCache(persistent=True).guess(release_name)
+    cache = GuessCache(persistent=True)
+    assert cache.guess(release_name) == {'title': release_name}
+    assert mock_guessit.call_count == 1
+    assert cache.persistent_hits == 1
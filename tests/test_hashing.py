@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import errno
+import hashlib
+import mmap
+import os
+import struct
+from typing import TYPE_CHECKING
+
+import pytest
+
+from subliminal.hashing import (
+    HashPlan,
+    compute_hashes,
+    hash_opensubtitles,
+    merge_ranges,
+    sum_uint64_numpy,
+    sum_uint64_python,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Core test
+pytestmark = pytest.mark.core
+
+
+def reference_hash_opensubtitles(video_path: str | os.PathLike) -> str:
+    """The OpenSubtitles hash, reading 8 bytes at a time."""
+    filesize = os.path.getsize(video_path)
+    filehash = filesize
+    with open(video_path, 'rb') as f:
+        for offset in (0, filesize - 65536):
+            f.seek(offset)
+            for _ in range(65536 // 8):
+                (value,) = struct.unpack('<q', f.read(8))
+                filehash = (filehash + value) & 0xFFFFFFFFFFFFFFFF
+    return f'{filehash:016x}'
+
+
+@pytest.mark.parametrize('size', [65536 * 2, 65536 * 2 + 1, 1_000_003])
+def test_hash_opensubtitles_reference(tmp_path: Path, size: int) -> None:
+    path = tmp_path / 'video.mkv'
+    path.write_bytes(os.urandom(size))
+    assert hash_opensubtitles(path) == reference_hash_opensubtitles(path)
+
+
+def test_hash_opensubtitles_overflow(tmp_path: Path) -> None:
+    path = tmp_path / 'video.mkv'
+    path.write_bytes(b'\xff' * 200_000)
+    assert hash_opensubtitles(path) == reference_hash_opensubtitles(path)
+
+
+def test_sum_uint64_python() -> None:
+    data = struct.pack('<3Q', 1, 2, 0xFFFFFFFFFFFFFFFF)
+    assert sum_uint64_python(data) == 2
+
+
+def test_sum_uint64_numpy() -> None:
+    pytest.importorskip('numpy')
+
+    data = os.urandom(65536)
+    assert sum_uint64_numpy(data) == sum_uint64_python(data)
+    # the sum wraps around like the pure Python implementation
+    data = struct.pack('<3Q', 1, 2, 0xFFFFFFFFFFFFFFFF)
+    assert sum_uint64_numpy(data) == sum_uint64_python(data) == 2
+    assert sum_uint64_numpy(memoryview(b'\xff' * 65536)) == sum_uint64_python(b'\xff' * 65536)
+
+
+def test_merge_ranges() -> None:
+    assert merge_ranges([(100, 10), (0, 50), (40, 20), (60, 5)]) == [(0, 65), (100, 10)]
+    assert merge_ranges([(0, 100), (10, 10)]) == [(0, 100)]
+    assert merge_ranges([]) == []
+
+
+def test_hash_plan() -> None:
+    # the NapiProjekt range contains the OpenSubtitles head block, the algorithms are deduplicated
+    plan = HashPlan(20 * 1024 * 1024, ['opensubtitles', 'napiprojekt', 'opensubtitles'])
+    assert list(plan.ranges) == ['opensubtitles', 'napiprojekt']
+    assert plan.reads == [(0, 10 * 1024 * 1024), (20 * 1024 * 1024 - 65536, 65536)]
+
+    # a small file is read at once
+    assert HashPlan(1024 * 1024, ['opensubtitles', 'napiprojekt']).reads == [(0, 1024 * 1024)]
+
+    # the file is too small for the OpenSubtitles hash
+    plan = HashPlan(1000, ['opensubtitles'])
+    assert plan.ranges == {}
+    assert plan.reads == []
+
+
+@pytest.mark.parametrize('use_mmap', [True, False])
+@pytest.mark.parametrize('size', [1000, 1_000_003, 11 * 1024 * 1024])
+def test_compute_hashes(tmp_path: Path, size: int, use_mmap: bool) -> None:
+    path = tmp_path / 'video.mkv'
+    data = os.urandom(size)
+    path.write_bytes(data)
+
+    hashes = compute_hashes(path, ['opensubtitles', 'napiprojekt'], use_mmap=use_mmap)
+
+    if size < 2 * 65536:
+        assert 'opensubtitles' not in hashes
+    else:
+        assert hashes['opensubtitles'] == reference_hash_opensubtitles(path)
+    assert hashes['napiprojekt'] == hashlib.md5(data[: 10 * 1024 * 1024]).hexdigest()
+
+
+def test_compute_hashes_mmap_fallback(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / 'video.mkv'
+    path.write_bytes(os.urandom(1_000_003))
+    expected = compute_hashes(path, ['opensubtitles', 'napiprojekt'])
+
+    def mmap_error(*args: object, **kwargs: object) -> mmap.mmap:
+        raise OSError(errno.ENODEV, os.strerror(errno.ENODEV))
+
+    monkeypatch.setattr(mmap, 'mmap', mmap_error)
+    assert compute_hashes(path, ['opensubtitles', 'napiprojekt']) == expected
+
+
+def test_compute_hashes_empty(tmp_path: Path) -> None:
+    path = tmp_path / 'video.mkv'
+    path.touch()
+    assert compute_hashes(path, ['opensubtitles', 'napiprojekt']) == {'napiprojekt': hashlib.md5(b'').hexdigest()}
+
+
+@pytest.mark.skipif(not hasattr(os, 'mkfifo'), reason='named pipes are not supported')
+def test_compute_hashes_not_regular_file(tmp_path: Path) -> None:
+    path = tmp_path / 'video.mkv'
+    os.mkfifo(path)
+    # the pipe is not opened, it would block without a writer
+    assert compute_hashes(path, ['opensubtitles', 'napiprojekt']) == {}
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+from typing import TYPE_CHECKING
+
+import pytest
+from babelfish import Language  # type: ignore[import-untyped]
+
+from subliminal.index import LibraryIndex
+from subliminal.subtitle import EmbeddedSubtitle, ExternalSubtitle
+from subliminal.video import Episode
+from tests.conftest import ensure
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Core test
+pytestmark = pytest.mark.core
+
+
+@pytest.fixture
+def video_path(tmp_path: Path) -> str:
+    path = ensure(tmp_path / 'videos' / 'The.Big.Bang.Theory.S05E18.HDTV.x264-LOL.mp4')
+    path.write_bytes(b'video')
+    return os.fspath(path)
+
+
+def test_library_index(video_path: str) -> None:
+    video = Episode(video_path, 'The Big Bang Theory', 5, 18, hashes={'opensubtitles': '0123456789abcdef'})
+    video.subtitles = [
+        EmbeddedSubtitle(Language('eng'), subtitle_id='0'),
+        ExternalSubtitle(Language('fra'), subtitle_id=video_path + '.fr.srt'),
+    ]
+
+    with LibraryIndex() as index:
+        assert index.get(video_path) is None
+        index.add(video, refined=True, refiners=['hash', 'omdb'], providers=['podnapisi', 'bsplayer'])
+        assert len(index) == 1
+
+        entry = index.get(video_path)
+        assert entry is not None
+        assert entry.refined
+        assert entry.refiners == ('hash', 'omdb')
+        assert entry.providers == ('bsplayer', 'podnapisi')
+        assert entry.is_refined(['hash', 'omdb'], ['bsplayer', 'podnapisi'])
+        # refine again with other refiners or providers
+        assert not entry.is_refined(['hash', 'omdb', 'tvdb'], ['bsplayer', 'podnapisi'])
+        assert not entry.is_refined(['hash', 'omdb'], ['bsplayer', 'opensubtitles', 'podnapisi'])
+        assert isinstance(entry.video, Episode)
+        assert entry.video.series == 'The Big Bang Theory'
+        assert entry.video.hashes == {'opensubtitles': '0123456789abcdef'}
+        # the external subtitles are not stored
+        assert entry.video.subtitle_languages == {Language('eng')}
+        assert index.subtitle_languages(video_path) == {Language('eng'), Language('fra')}
+
+        # the name of the video is the given path
+        relative_path = os.path.relpath(video_path)
+        entry = index.get(relative_path)
+        assert entry is not None
+        assert entry.video.name == relative_path
+        assert hash(entry.video) == hash(relative_path)
+
+
+def test_library_index_changed_file(video_path: str) -> None:
+    with LibraryIndex() as index:
+        index.add(Episode(video_path, 'The Big Bang Theory', 5, 18))
+        assert index.get(video_path) is not None
+
+        with open(video_path, 'ab') as f:
+            f.write(b'more content')
+        assert index.get(video_path) is None
+
+        os.remove(video_path)
+        assert index.get(video_path) is None
+        assert index.prune() == 1
+        assert len(index) == 0
+
+
+def test_library_index_missing_languages(tmp_path: Path, video_path: str) -> None:
+    other_path = os.fspath(ensure(tmp_path / 'other' / 'Man.of.Steel.2013.mkv'))
+
+    with LibraryIndex() as index:
+        index.add(Episode(video_path, 'The Big Bang Theory', 5, 18))
+        index.add(Episode(other_path, 'Man of Steel', 1, 1))
+        index.add_subtitle_languages(video_path, [Language('fra'), Language('por', 'BR')])
+        # ignored for non-indexed videos
+        index.add_subtitle_languages(os.fspath(tmp_path / 'not-indexed.mkv'), [Language('fra')])
+
+        missing = index.missing_languages([Language('fra'), Language('por', 'BR'), Language('eng')])
+        assert missing == {
+            os.path.normcase(video_path): {Language('eng')},
+            os.path.normcase(other_path): {Language('fra'), Language('por', 'BR'), Language('eng')},
+        }
+
+        missing = index.missing_languages([Language('eng')], prefix=tmp_path / 'videos')
+        assert list(missing) == [os.path.normcase(video_path)]
+
+
+def test_library_index_persistent(tmp_path: Path, video_path: str) -> None:
+    filename = tmp_path / 'index.db'
+    with LibraryIndex(filename) as index:
+        index.add(Episode(video_path, 'The Big Bang Theory', 5, 18))
+
+    with LibraryIndex(filename) as index:
+        assert index.get(video_path) is not None
+
+    # the index is cleared when the schema changes
+    connection = sqlite3.connect(filename)
+    connection.execute('PRAGMA user_version = 1000')
+    connection.commit()
+    connection.close()
+    with LibraryIndex(filename) as index:
+        assert len(index) == 0
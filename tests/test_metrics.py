@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import pytest
+
+from subliminal.metrics import LatencyHistogram
+
+# Core test
+pytestmark = pytest.mark.core
+
+
+def test_latency_histogram() -> None:
+    histogram = LatencyHistogram(buckets=[0.1, 1, 10])
+    assert histogram.count == 0
+    assert histogram.quantile(0.5) == 0
+
+    for duration in (0.05, 0.1, 0.5, 0.7, 2, 50):
+        histogram.record(duration)
+
+    assert histogram.counts == [2, 2, 1, 1]
+    assert histogram.count == 6
+    assert histogram.mean == pytest.approx(53.35 / 6)
+    assert histogram.maximum == 50
+    assert histogram.quantile(0.3) == 0.1
+    assert histogram.quantile(0.5) == 1
+    assert histogram.quantile(0.8) == 10
+    # above the last bucket, the maximum is used
+    assert histogram.quantile(0.99) == 50
+    assert '6 requests' in histogram.summary()
+
+
+def test_latency_histogram_unsorted_buckets() -> None:
+    with pytest.raises(ValueError):  # noqa: PT011
+        LatencyHistogram(buckets=[1, 0.1])
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import pytest
 
-from subliminal.providers import FeatureNotFound, ParserBeautifulSoup, Provider
+from subliminal.providers import FeatureNotFound, ParserBeautifulSoup, Provider, SessionFactory
 from subliminal.video import Episode, Movie
 
 # Core test
@@ -34,22 +34,60 @@ def test_parserbeautifulsoup() -> None:
     ParserBeautifulSoup('', ['lxml', 'html.parser'])
 
 
-def test_check_episodes_only(episodes: dict[str, Episode], movies: dict[str, Movie]) -> None:
-    Provider.video_types = (Episode,)
-    Provider.required_hash = None
+def test_check_episodes_only(
+    episodes: dict[str, Episode],
+    movies: dict[str, Movie],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(Provider, 'video_types', (Episode,))
+    monkeypatch.setattr(Provider, 'required_hash', None)
     assert Provider.check(movies['man_of_steel']) is False
     assert Provider.check(episodes['bbt_s07e05']) is True
 
 
-def test_check_movies_only(episodes: dict[str, Episode], movies: dict[str, Movie]) -> None:
-    Provider.video_types = (Movie,)
-    Provider.required_hash = None
+def test_check_movies_only(
+    episodes: dict[str, Episode],
+    movies: dict[str, Movie],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(Provider, 'video_types', (Movie,))
+    monkeypatch.setattr(Provider, 'required_hash', None)
     assert Provider.check(movies['man_of_steel']) is True
     assert Provider.check(episodes['bbt_s07e05']) is False
 
 
-def test_check_required_hash(episodes: dict[str, Episode], movies: dict[str, Movie]) -> None:
-    Provider.video_types = (Episode, Movie)
-    Provider.required_hash = 'opensubtitles'
+def test_check_required_hash(
+    episodes: dict[str, Episode],
+    movies: dict[str, Movie],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(Provider, 'video_types', (Episode, Movie))
+    monkeypatch.setattr(Provider, 'required_hash', 'opensubtitles')
     assert Provider.check(movies['man_of_steel']) is True
     assert Provider.check(episodes['dallas_s01e03']) is False
+
+
+def test_session_factory_shared_adapter() -> None:
+    factory = SessionFactory(pool_maxsize=4, max_retries=3)
+    session1 = factory.create_session(user_agent='agent', headers={'Accept': 'application/json'})
+    session2 = factory.create_session()
+
+    assert session1.get_adapter('https://example.com') is factory.adapter
+    assert session2.get_adapter('http://example.com') is factory.adapter
+    assert factory.adapter.max_retries.total == 3
+    assert factory.adapter.max_retries.connect == 1
+    assert factory.adapter.max_retries.read == 0
+    assert session1.headers['User-Agent'] == 'agent'
+    assert session1.headers['Accept'] == 'application/json'
+    assert session2.headers['Accept-Encoding'] == 'gzip, deflate'
+
+    # closing a session keeps the shared connection pool
+    adapter = factory.adapter
+    session1.close()
+    assert session2.get_adapter('https://example.com') is adapter
+    assert factory.adapter is adapter
+
+    # closing the factory creates a new connection pool
+    factory.close()
+    assert factory.adapter is not adapter
+    assert factory.create_session().get_adapter('https://example.com') is factory.adapter
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import copy
+import threading
+import time
 from typing import TYPE_CHECKING, Any, cast
 from unittest.mock import Mock, call
 
@@ -7,23 +11,32 @@ import pytest
 from babelfish import Language  # type: ignore[import-untyped]
 
 from subliminal.core import (
+    AsyncioProviderPool,
     AsyncProviderPool,
     ProviderPool,
     download_best_subtitles,
     download_subtitles,
+    iter_subtitles,
     list_subtitles,
     refine,
+    refine_many,
+    refiner_graph,
     refiner_manager,
+    series_key,
 )
+from subliminal.providers import AsyncProvider
 from subliminal.score import episode_scores
 from subliminal.subtitle import Subtitle
+from subliminal.video import Episode, Movie
 
 if TYPE_CHECKING:
+    from collections.abc import Set
     from typing import Callable
 
     from subliminal.extensions import RegistrableExtensionManager
-    from subliminal.providers.mock import MockProvider
-    from subliminal.video import Episode, Movie, Video
+    from subliminal.providers import SyncProviderAdapter
+    from subliminal.providers.mock import MockProvider, MockSubtitle
+    from subliminal.video import Video
 
 # Core test
 pytestmark = [
@@ -158,6 +171,215 @@ def test_async_provider_pool_list_subtitles(
         assert provider_manager[provider].plugin.list_subtitles.called
 
 
+@pytest.mark.usefixtures('_mock_providers')
+def test_async_provider_pool_reuse_executor(episodes: dict[str, Episode]) -> None:
+    pool = AsyncProviderPool()
+    pool.list_subtitles(episodes['bbt_s07e05'], {Language('eng')})
+    executor = pool.executor
+    pool.list_subtitles(episodes['got_s03e10'], {Language('eng')})
+    assert pool.executor is executor
+
+    # the executor is shut down with the pool
+    pool.terminate()
+    assert executor._shutdown
+    assert pool.executor is not executor
+    pool.terminate()
+
+
+@pytest.mark.usefixtures('_mock_providers')
+def test_provider_pool_rate_limiters(episodes: dict[str, Episode]) -> None:
+    provider_configs = {
+        'gestdown': {'rate_limit': 10, 'rate_burst': 5},
+        'podnapisi': {'max_concurrency': 2},
+    }
+    with ProviderPool(providers=['gestdown', 'podnapisi'], provider_configs=provider_configs) as pool:
+        subtitles = pool.list_subtitles(episodes['bbt_s07e05'], {Language('eng')})
+        # the rate limit options are not passed to the providers
+        assert 'gestdown' in pool.initialized_providers
+        assert subtitles
+
+        gestdown = pool.get_rate_limiter('gestdown')
+        assert gestdown.rate_limit == 10
+        assert gestdown.rate_burst == 5
+        assert gestdown.max_concurrency is None
+        podnapisi = pool.get_rate_limiter('podnapisi')
+        assert podnapisi.rate_limit is None
+        assert podnapisi.max_concurrency == 2
+
+    with AsyncProviderPool(
+        providers=['gestdown', 'podnapisi'],
+        provider_configs=provider_configs,
+        provider_max_workers={'gestdown': 1, 'podnapisi': 3},
+    ) as pool:
+        pool.list_subtitles(episodes['bbt_s07e05'], {Language('eng')})
+        assert pool.get_rate_limiter('gestdown').rate_limit == 10
+        assert pool.get_rate_limiter('gestdown').max_concurrency == 1
+        assert pool.get_rate_limiter('podnapisi').max_concurrency == 3
+
+    async def run() -> None:
+        async with AsyncioProviderPool(providers=['gestdown', 'podnapisi'], provider_configs=provider_configs) as pool:
+            assert await pool.list_subtitles(episodes['bbt_s07e05'], {Language('eng')})
+            assert pool.get_rate_limiter('gestdown').rate_limit == 10
+            assert pool.get_rate_limiter('podnapisi').max_concurrency == 2
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize('pool_class', [ProviderPool, AsyncProviderPool])
+def test_provider_pool_iter_subtitles(episodes: dict[str, Episode], pool_class: type[ProviderPool]) -> None:
+    video = episodes['bbt_s07e05']
+    languages = {Language('eng')}
+
+    with pool_class(providers=['gestdown', 'podnapisi']) as pool:
+        subtitles = pool.list_subtitles(video, languages)
+        iterated_subtitles = list(pool.iter_subtitles(video, languages))
+    assert {s.id for s in iterated_subtitles} == {s.id for s in subtitles}
+    assert {s.provider_name for s in subtitles} == {'gestdown', 'podnapisi'}
+
+    # stop after the first provider
+    with pool_class(providers=['gestdown', 'podnapisi']) as pool:
+        iterated_subtitles = list(pool.iter_subtitles(video, languages, until=lambda subs: len(subs) > 0))
+        if pool_class is ProviderPool:
+            assert 'podnapisi' not in pool.initialized_providers
+    assert len({s.provider_name for s in iterated_subtitles}) == 1
+
+
+@pytest.mark.parametrize('pool_class', [ProviderPool, AsyncProviderPool])
+def test_download_best_subtitles_stop_on_hash_match(
+    movies: dict[str, Movie],
+    monkeypatch: pytest.MonkeyPatch,
+    pool_class: type[ProviderPool],
+) -> None:
+    video = movies['man_of_steel']
+    languages = {Language('eng')}
+
+    with pool_class(providers=['opensubtitlescom', 'podnapisi']) as pool:
+        # the subtitle of the first provider matches the video hash
+        provider = cast('MockProvider', pool['opensubtitlescom'])
+        hash_subtitles = []
+        for subtitle in provider.subtitle_pool:
+            hash_subtitle = copy.copy(subtitle)
+            hash_subtitle.matches = subtitle.matches | {'hash'}
+            hash_subtitles.append(hash_subtitle)
+        monkeypatch.setattr(provider, 'subtitle_pool', hash_subtitles)
+
+        subtitles = pool.list_and_download_best_subtitles(video, languages, stop_on_hash_match=True)
+        assert [s.provider_name for s in subtitles] == ['opensubtitlescom']
+        if pool_class is ProviderPool:
+            assert 'podnapisi' not in pool.initialized_providers
+
+
+@pytest.mark.parametrize('pool_class', [ProviderPool, AsyncProviderPool])
+def test_provider_pool_deadline(
+    episodes: dict[str, Episode],
+    monkeypatch: pytest.MonkeyPatch,
+    pool_class: type[ProviderPool],
+) -> None:
+    video = episodes['bbt_s07e05']
+    languages = {Language('eng')}
+
+    with pool_class(providers=['gestdown', 'podnapisi'], deadline=0.2) as pool:
+        # the first provider is slow
+        provider = pool['gestdown']
+        list_subtitles = provider.list_subtitles
+
+        def slow_list_subtitles(video: Video, languages: Set[Language]) -> list[Subtitle]:
+            time.sleep(0.5)
+            return list_subtitles(video, languages)
+
+        monkeypatch.setattr(provider, 'list_subtitles', slow_list_subtitles)
+
+        start = time.monotonic()
+        subtitles = pool.list_subtitles(video, languages)
+        if pool_class is AsyncProviderPool:
+            # the slow provider is abandoned
+            assert time.monotonic() - start < 0.5
+            assert {s.provider_name for s in subtitles} == {'podnapisi'}
+        else:
+            # the next providers are skipped
+            assert {s.provider_name for s in subtitles} == {'gestdown'}
+            assert 'podnapisi' not in pool.latency_histograms
+            assert pool.latency_histograms['gestdown'].count == 1
+
+
+def test_async_provider_pool_deadline_stragglers(
+    episodes: dict[str, Episode],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    video = episodes['bbt_s07e05']
+    languages = {Language('eng')}
+
+    with AsyncProviderPool(max_workers=1, providers=['gestdown', 'podnapisi'], deadline=0.2) as pool:
+        # the first provider is slow
+        provider = pool['gestdown']
+        list_subtitles = provider.list_subtitles
+        returned = threading.Event()
+
+        def slow_list_subtitles(video: Video, languages: Set[Language]) -> list[Subtitle]:
+            time.sleep(0.5)
+            returned.set()
+            return list_subtitles(video, languages)
+
+        monkeypatch.setattr(provider, 'list_subtitles', slow_list_subtitles)
+
+        # the deadline bounds the listing of the video, the provider queued behind the slow one is cancelled
+        start = time.monotonic()
+        assert pool.list_subtitles(video, languages) == []
+        assert time.monotonic() - start < 0.4
+        assert pool.stragglers == {'gestdown'}
+        assert returned.wait(1)
+
+    with AsyncProviderPool(max_workers=2, providers=['gestdown', 'podnapisi'], deadline=0.2) as pool:
+        provider = pool['gestdown']
+        list_subtitles = provider.list_subtitles
+        returned.clear()
+        monkeypatch.setattr(provider, 'list_subtitles', slow_list_subtitles)
+
+        assert {s.provider_name for s in pool.list_subtitles(video, languages)} == {'podnapisi'}
+        assert pool.stragglers == {'gestdown'}
+
+        # the provider still running is skipped, without waiting for the deadline
+        start = time.monotonic()
+        assert {s.provider_name for s in pool.list_subtitles(video, languages)} == {'podnapisi'}
+        assert time.monotonic() - start < 0.2
+
+        # the provider is queried again once it returned
+        assert returned.wait(1)
+        time.sleep(0.01)
+        assert pool.stragglers == set()
+
+
+def test_provider_pool_latency_histograms(episodes: dict[str, Episode]) -> None:
+    with ProviderPool(providers=['gestdown', 'podnapisi']) as pool:
+        pool.list_subtitles(episodes['bbt_s07e05'], {Language('eng')})
+        pool.list_subtitles(episodes['got_s03e10'], {Language('eng')})
+
+        assert set(pool.latency_histograms) == {'gestdown', 'podnapisi'}
+        assert all(histogram.count == 2 for histogram in pool.latency_histograms.values())
+
+
+def test_iter_subtitles(episodes: dict[str, Episode]) -> None:
+    videos = [episodes['bbt_s07e05'], episodes['got_s03e10']]
+    languages = {Language('eng')}
+
+    listed = list_subtitles(set(videos), languages, providers=['gestdown', 'podnapisi'])
+    iterated = list(iter_subtitles(videos, languages, providers=['gestdown', 'podnapisi']))
+    assert {(v, s.id) for v, s in iterated} == {(v, s.id) for v, subs in listed.items() for s in subs}
+
+    # the predicate is called with the video
+    iterated = list(
+        iter_subtitles(
+            videos,
+            languages,
+            pool_class=AsyncProviderPool,
+            until=lambda v, subs: v == videos[0],
+            providers=['gestdown', 'podnapisi'],
+        )
+    )
+    assert len({s.provider_name for v, s in iterated if v == videos[0]}) == 1
+    assert {s.id for v, s in iterated if v == videos[1]} == {s.id for s in listed[videos[1]]}
+
+
 @pytest.mark.usefixtures('_mock_providers')
 def test_list_subtitles_movie(
     movies: dict[str, Movie],
@@ -367,6 +589,51 @@ def test_download_subtitles_discarded_provider(
     assert 'opensubtitlescom' in pool.discarded_providers
 
 
+def test_provider_pool_set_discarded_providers(
+    movies: dict[str, Movie],
+    provider_manager: RegistrableExtensionManager,
+) -> None:
+    video = movies['man_of_steel']
+    languages = {Language('eng')}
+
+    pool = ProviderPool(['opensubtitlescom', 'podnapisi'])
+    pool.discarded_providers = {'opensubtitlescom'}
+    assert pool.discarded_providers == {'opensubtitlescom'}
+    assert {s.provider_name for s in pool.list_subtitles(video, languages)} == {'podnapisi'}
+
+    pool.discarded_providers = set()
+    assert pool.discarded_providers == set()
+    assert {s.provider_name for s in pool.list_subtitles(video, languages)} == {'opensubtitlescom', 'podnapisi'}
+
+
+def test_provider_pool_discarded_provider_recovery(
+    movies: dict[str, Movie],
+    provider_manager: RegistrableExtensionManager,
+) -> None:
+    video = movies['man_of_steel']
+    languages = {Language('eng')}
+    now = 0.0
+
+    pool = ProviderPool(['opensubtitlescom'], circuit_breaker_options={'recovery_timeout': 60, 'clock': lambda: now})
+
+    # Mock a broken provider
+    provider = cast('MockProvider', pool['opensubtitlescom'])
+    provider.is_broken = True
+    assert pool.list_subtitles(video, languages) == []
+    assert 'opensubtitlescom' in pool.discarded_providers
+
+    # Mock the provider now works, it is queried again after the recovery timeout
+    provider.is_broken = False
+    assert pool.list_subtitles(video, languages) == []
+    now += 60
+    assert 'opensubtitlescom' not in pool.discarded_providers
+    assert len(pool.list_subtitles(video, languages)) == 1
+
+    breaker = pool.circuit_breakers['opensubtitlescom']
+    assert breaker.times_opened == 1
+    assert breaker.rejected == 1
+
+
 def test_download_best_subtitles(episodes: dict[str, Episode]) -> None:
     video = episodes['bbt_s07e05']
     languages = {Language('eng'), Language('fra')}
@@ -504,6 +771,89 @@ def test_download_best_subtitles_wrong_fps(episodes: dict[str, Episode]) -> None
     assert {(s.provider_name, s.id) for s in subtitles[video]} == expected_subtitles
 
 
+def test_download_best_subtitles_many_videos(episodes: dict[str, Episode], movies: dict[str, Movie]) -> None:
+    videos = {episodes['bbt_s07e05'], episodes['marvels_agents_of_shield_s02e06'], movies['man_of_steel']}
+    languages = {Language('eng')}
+    providers = ['gestdown', 'opensubtitlescom', 'podnapisi']
+
+    serial_subtitles = download_best_subtitles(videos, languages, providers=providers)
+    concurrent_subtitles = download_best_subtitles(
+        videos,
+        languages,
+        pool_class=AsyncProviderPool,
+        max_videos=3,
+        provider_max_workers={'opensubtitlescom': 1},
+        providers=providers,
+    )
+
+    assert len(concurrent_subtitles) == 3
+    assert {v: [s.id for s in subs] for v, subs in concurrent_subtitles.items()} == {
+        v: [s.id for s in subs] for v, subs in serial_subtitles.items()
+    }
+
+
+def test_async_provider_pool_iter_download_best_subtitles(episodes: dict[str, Episode]) -> None:
+    videos = [episodes['bbt_s07e05'], episodes['marvels_agents_of_shield_s02e06']]
+    languages = {Language('eng')}
+
+    with AsyncProviderPool(max_videos=1, providers=['gestdown', 'podnapisi']) as pool:
+        results = list(pool.iter_download_best_subtitles(videos, languages))
+    # one video at a time keeps the order
+    assert [v for v, _ in results] == videos
+    assert all(len(subtitles) == 1 for _, subtitles in results)
+
+    with AsyncProviderPool(max_videos=2, providers=['gestdown', 'podnapisi']) as pool:
+        results = list(pool.iter_download_best_subtitles(iter(videos), languages))
+    assert {v for v, _ in results} == set(videos)
+    assert all(len(subtitles) == 1 for _, subtitles in results)
+
+
+@pytest.mark.parametrize('speculative', [False, True])
+@pytest.mark.parametrize('only_one', [False, True])
+@pytest.mark.parametrize('pool_class', [ProviderPool, AsyncProviderPool])
+def test_download_best_subtitles_concurrent_downloads(
+    episodes: dict[str, Episode],
+    pool_class: type[ProviderPool],
+    only_one: bool,
+    speculative: bool,
+) -> None:
+    video = episodes['bbt_s07e05']
+    languages = {Language('eng'), Language('fra'), Language('por', 'BR')}
+    providers = ['gestdown', 'podnapisi', 'tvsubtitles']
+
+    with pool_class(providers=providers) as pool:
+        subtitles = pool.list_subtitles(video, languages)
+        expected = pool.download_best_subtitles(subtitles, video, languages, only_one=only_one)
+        downloaded = pool.download_best_subtitles(
+            subtitles,
+            video,
+            languages,
+            only_one=only_one,
+            concurrent_downloads=True,
+            speculative=speculative,
+        )
+
+    assert len(downloaded) == (1 if only_one else 2)
+    assert [s.id for s in downloaded] == [s.id for s in expected]
+
+
+def test_download_best_subtitles_concurrent_downloads_fallback(episodes: dict[str, Episode]) -> None:
+    video = episodes['bbt_s07e05']
+    languages = {Language('eng'), Language('fra')}
+
+    with ProviderPool(providers=['gestdown', 'podnapisi']) as pool:
+        subtitles = pool.list_subtitles(video, languages)
+        expected = pool.download_best_subtitles(subtitles, video, languages)
+        # the best subtitles cannot be downloaded
+        for subtitle in expected:
+            cast('MockSubtitle', subtitle).fake_content = b''
+        downloaded = pool.download_best_subtitles(subtitles, video, languages, concurrent_downloads=True)
+
+    assert len(downloaded) == 2
+    assert {s.language for s in downloaded} == languages
+    assert not {s.id for s in downloaded} & {s.id for s in expected}
+
+
 def test_download_bad_subtitle(movies: dict[str, Movie]) -> None:
     pool = ProviderPool()
     subtitles = pool.list_subtitles_provider('opensubtitlescom', movies['man_of_steel'], {Language('tur')})
@@ -573,3 +923,346 @@ def test_refine_movie_broken(movies: dict[str, Episode], mock_refiners_hash_brok
 
     calls = [call('metadata'), call('omdb'), call('tmdb')]
     mock_refiners_hash_broken.assert_has_calls(calls, any_order=True)
+
+
+def test_refiner_graph() -> None:
+    assert refiner_graph(['hash', 'metadata', 'omdb', 'tvdb', 'tmdb']) == {
+        'hash': set(),
+        'metadata': set(),
+        'omdb': set(),
+        'tvdb': {'omdb'},
+        'tmdb': {'omdb', 'tvdb'},
+    }
+
+    # the refiners without known attributes run alone
+    assert refiner_graph(['hash', 'custom', 'metadata', 'hash']) == {
+        'hash': set(),
+        'custom': {'hash'},
+        'metadata': {'custom'},
+    }
+
+
+@pytest.mark.parametrize('max_workers', [1, 4])
+def test_refine_episode_max_workers(episodes: dict[str, Episode], mock_refiners: Mock, max_workers: int) -> None:
+    video = episodes['bbt_s07e05']
+
+    refine(video, max_workers=max_workers)
+
+    calls = [call('hash'), call('metadata'), call('omdb'), call('tmdb'), call('tvdb')]
+    mock_refiners.assert_has_calls(calls, any_order=True)
+    # the online refiners keep their order
+    online = ('omdb', 'tmdb', 'tvdb')
+    names = [c.args[0] for c in mock_refiners.call_args_list]
+    assert [r for r in names if r in online] == [r for r in refiner_manager.names() if r in online]
+
+
+def test_refine_concurrent(episodes: dict[str, Episode], monkeypatch: pytest.MonkeyPatch) -> None:
+    video = episodes['bbt_s07e05']
+    online_done = threading.Event()
+    events = []
+
+    def mock_and_refine(refiner_name: str) -> Callable:
+        def mock_refine(video: Video, **kwargs: Any) -> None:
+            events.append(refiner_name)
+            if refiner_name == 'metadata':
+                # wait for the online refiners, they do not depend on the metadata
+                events.append(f'online done: {online_done.wait(5)}')
+            elif refiner_name == 'tmdb':
+                online_done.set()
+
+        return mock_refine
+
+    for refiner in refiner_manager:
+        monkeypatch.setattr(refiner, 'plugin', mock_and_refine(refiner.name))
+
+    refine(video, refiners=['metadata', 'omdb', 'tvdb', 'tmdb'], max_workers=2)
+
+    assert 'online done: True' in events
+    assert events.index('omdb') < events.index('tvdb') < events.index('tmdb')
+
+
+def test_series_key(episodes: dict[str, Episode]) -> None:
+    video = copy.copy(episodes['bbt_s07e05'])
+    key = series_key(video)
+    video.series = 'THE BIG BANG-THEORY'
+    assert series_key(video) == key
+    video.year = None
+    assert series_key(video) != key
+
+
+def test_refine_many(episodes: dict[str, Episode], movies: dict[str, Movie], monkeypatch: pytest.MonkeyPatch) -> None:
+    bbt_episodes = [
+        Episode(f'The.Big.Bang.Theory.S07E0{i}.720p.HDTV.X264-DIMENSION.mkv', 'The Big Bang Theory', 7, i, year=2007)
+        for i in range(1, 5)
+    ]
+    videos = [*bbt_episodes, movies['man_of_steel'], episodes['dallas_s01e03']]
+    events = []
+    lock = threading.Lock()
+
+    def mock_and_refine(refiner_name: str) -> Callable:
+        def mock_refine(video: Video, **kwargs: Any) -> None:
+            with lock:
+                events.append(('start', video))
+            time.sleep(0.01)
+            with lock:
+                events.append(('end', video))
+
+        return mock_refine
+
+    for refiner in refiner_manager:
+        monkeypatch.setattr(refiner, 'plugin', mock_and_refine(refiner.name))
+
+    refined = refine_many(videos, max_videos=4, refiners=['omdb'])
+
+    assert refined == videos
+    assert {video for _, video in events} == set(videos)
+    # the other episodes of the series wait for the first one
+    first_end = events.index(('end', bbt_episodes[0]))
+    assert all(events.index(('start', video)) > first_end for video in bbt_episodes[1:])
+
+
+def test_refine_many_series_search(monkeypatch: pytest.MonkeyPatch) -> None:
+    from subliminal.refiners.omdb import omdb_client
+    from subliminal.refiners.tmdb import tmdb_client
+    from subliminal.refiners.tvdb import tvdb_client
+
+    bbt_episodes = [
+        Episode(f'The.Big.Bang.Theory.S07E0{i}.720p.HDTV.X264-DIMENSION.mkv', 'the big bang theory', 7, i)
+        for i in range(1, 4)
+    ]
+    got_episodes = [
+        Episode(f'Game.of.Thrones.S03E0{i}.720p.HDTV.x264-EVOLVE.mkv', 'game of thrones', 3, i) for i in range(1, 3)
+    ]
+    series = {
+        'the big bang theory': (80379, 1418, 'tt0898266', 'The Big Bang Theory', '2007-09-24'),
+        'game of thrones': (121361, 1399, 'tt0944947', 'Game of Thrones', '2011-04-17'),
+    }
+    searches = Mock()
+
+    def search_series(name: str) -> list[dict[str, Any]]:
+        searches.tvdb(name)
+        tvdb_id, _, _, title, first_aired = series[name]
+        return [{'id': tvdb_id, 'seriesName': title, 'aliases': [], 'firstAired': first_aired}]
+
+    def get_series(tvdb_id: int) -> dict[str, Any]:
+        imdb_id = next(s[2] for s in series.values() if s[0] == tvdb_id)
+        return {'id': tvdb_id, 'aliases': [], 'imdbId': imdb_id}
+
+    def get_series_episode(tvdb_id: int, season: int, episode: int) -> dict[str, Any]:
+        return {'id': tvdb_id * 100 + episode, 'episodeName': f'Episode {episode}', 'imdbId': None}
+
+    def get_id(name: str, **kwargs: Any) -> int:
+        searches.tmdb(name)
+        return next(s[1] for s in series.values() if s[3] == name)
+
+    def query(tmdb_id: int, is_movie: bool, season: int | None = None, episode: int | None = None) -> dict[str, Any]:
+        tvdb_id, _, imdb_id, title, first_aired = next(s for s in series.values() if s[1] == tmdb_id)
+        if episode is not None:
+            return {'id': tmdb_id * 100 + episode, 'name': f'Episode {episode}', 'external_ids': {}}
+        external_ids = {'imdb_id': imdb_id, 'tvdb_id': tvdb_id}
+        return {
+            'id': tmdb_id,
+            'name': title,
+            'original_name': title,
+            'first_air_date': first_aired,
+            'external_ids': external_ids,
+        }
+
+    def search_all(title: str, **kwargs: Any) -> list[dict[str, Any]]:
+        searches.omdb(title)
+        return []
+
+    monkeypatch.setattr(tvdb_client, 'search_series', search_series)
+    monkeypatch.setattr(tvdb_client, 'get_series', get_series)
+    monkeypatch.setattr(tvdb_client, 'get_series_episode', get_series_episode)
+    monkeypatch.setattr(tmdb_client, 'get_id', get_id)
+    monkeypatch.setattr(tmdb_client, 'query', query)
+    monkeypatch.setattr(omdb_client, 'search_all', search_all)
+
+    refine_many(
+        [*bbt_episodes, *got_episodes],
+        max_videos=2,
+        refiners=['tvdb', 'tmdb', 'omdb'],
+        refiner_configs={'tmdb': {'apikey': 'apikey'}},
+    )
+
+    # the series is searched once per group by each refiner
+    assert searches.tvdb.call_count == 2
+    assert searches.tmdb.call_count == 2
+    # the series IMDB id was found by the other refiners
+    assert searches.omdb.call_count == 0
+
+    # the other episodes of the group get the series found for the first episode
+    assert {(e.series, e.year, e.series_tvdb_id, e.series_tmdb_id) for e in bbt_episodes} == {
+        ('The Big Bang Theory', 2007, 80379, 1418)
+    }
+    assert [e.tvdb_id for e in bbt_episodes] == [8037901, 8037902, 8037903]
+    assert [e.tmdb_id for e in got_episodes] == [139901, 139902]
+
+
+def test_refine_many_shared_executor(monkeypatch: pytest.MonkeyPatch) -> None:
+    videos = [Movie(f'Movie.{i}.mkv', f'Movie {i}') for i in range(6)]
+    threads = set()
+    lock = threading.Lock()
+
+    def mock_refine(video: Video, **kwargs: Any) -> None:
+        with lock:
+            threads.add(threading.current_thread().name)
+        time.sleep(0.01)
+
+    for refiner in refiner_manager:
+        monkeypatch.setattr(refiner, 'plugin', mock_refine)
+
+    refined = refine_many(videos, max_videos=3, refiners=['metadata', 'omdb', 'tmdb'], max_workers=2)
+
+    assert refined == videos
+    # the refiners of all the videos run in the same pool of 2 threads
+    assert len(threads) <= 2
+    assert all(name.startswith('subliminal-refiner') for name in threads)
+
+
+@pytest.mark.usefixtures('_mock_providers')
+def test_asyncio_provider_pool_list_subtitles(
+    episodes: dict[str, Episode],
+    provider_manager: RegistrableExtensionManager,
+) -> None:
+    async def run() -> list[Subtitle]:
+        async with AsyncioProviderPool() as pool:
+            return await pool.list_subtitles(episodes['bbt_s07e05'], {Language('eng')})
+
+    subtitles = asyncio.run(run())
+    assert sorted(subtitles) == [  # type: ignore[type-var,comparison-overlap]
+        'gestdown',
+        'opensubtitlescom',
+        'podnapisi',
+        'tvsubtitles',
+    ]
+    for provider in subtitles:
+        assert provider_manager[provider].plugin.initialize.called  # type: ignore[call-overload]
+        assert provider_manager[provider].plugin.terminate.called  # type: ignore[call-overload]
+
+
+def test_asyncio_provider_pool_download_best_subtitles(episodes: dict[str, Episode]) -> None:
+    video = episodes['bbt_s07e05']
+    languages = {Language('eng'), Language('fra')}
+    providers = ['gestdown', 'podnapisi']
+
+    async def run() -> list[Subtitle]:
+        async with AsyncioProviderPool(providers=providers, max_workers=1) as pool:
+            subtitles = await pool.list_subtitles(video, languages)
+            return await pool.download_best_subtitles(subtitles, video, languages)
+
+    subtitles = asyncio.run(run())
+    assert {(s.provider_name, s.id) for s in subtitles} == {('podnapisi', 'EdQo'), ('podnapisi', 'Dego')}
+
+
+def test_asyncio_provider_pool_iter_subtitles(episodes: dict[str, Episode]) -> None:
+    video = episodes['bbt_s07e05']
+    languages = {Language('eng')}
+
+    async def run(until: Callable[[Set[Subtitle]], bool] | None = None) -> list[Subtitle]:
+        async with AsyncioProviderPool(['gestdown', 'podnapisi']) as pool:
+            return [s async for s in pool.iter_subtitles(video, languages, until=until)]
+
+    subtitles = asyncio.run(run())
+    assert {s.provider_name for s in subtitles} == {'gestdown', 'podnapisi'}
+
+    subtitles = asyncio.run(run(until=lambda subs: len(subs) > 0))
+    assert len({s.provider_name for s in subtitles}) == 1
+
+
+def test_asyncio_provider_pool_discarded_provider(movies: dict[str, Movie]) -> None:
+    video = movies['man_of_steel']
+    languages = {Language('eng')}
+
+    async def run() -> None:
+        pool = AsyncioProviderPool(['opensubtitlescom'])
+        subtitles = await pool.list_subtitles(video, languages)
+        assert len(subtitles) == 1
+
+        # Mock a broken provider
+        adapter = cast('SyncProviderAdapter', await pool.get_provider('opensubtitlescom'))
+        cast('MockProvider', adapter.provider).is_broken = True
+        assert not await pool.download_subtitle(subtitles[0])
+        assert 'opensubtitlescom' in pool.discarded_providers
+        assert await pool.list_subtitles(video, languages) == []
+        await pool.terminate()
+
+    asyncio.run(run())
+
+
+def test_asyncio_provider_pool_async_provider(
+    monkeypatch: pytest.MonkeyPatch,
+    movies: dict[str, Movie],
+    provider_manager: RegistrableExtensionManager,
+) -> None:
+    from subliminal.providers.mock import MockSubtitle
+
+    video = movies['man_of_steel']
+    languages = {Language('eng')}
+    content = b'1\n00:00:01,000 --> 00:00:02,000\nHello\n'
+    NativeSubtitle = type('NativeSubtitle', (MockSubtitle,), {'provider_name': 'podnapisi'})
+
+    class NativeAsyncProvider(AsyncProvider):
+        languages = frozenset({Language('eng')})
+
+        async def async_initialize(self) -> None:
+            self.initialized = True
+
+        async def async_terminate(self) -> None:
+            self.initialized = False
+
+        async def async_list_subtitles(self, video: Video, languages: Set[Language]) -> list[MockSubtitle]:
+            await asyncio.sleep(0)
+            return [NativeSubtitle(language, fake_content=content) for language in languages]
+
+        async def async_download_subtitle(self, subtitle: MockSubtitle) -> None:
+            subtitle.set_content(subtitle.fake_content)
+
+    monkeypatch.setattr(provider_manager['podnapisi'], 'plugin', NativeAsyncProvider)
+
+    async def run() -> list[Subtitle]:
+        async with AsyncioProviderPool(['podnapisi']) as pool:
+            subtitles = await pool.list_subtitles(video, languages)
+            assert isinstance(await pool.get_provider('podnapisi'), NativeAsyncProvider)
+            return await pool.download_best_subtitles(subtitles, video, languages)
+
+    subtitles = asyncio.run(run())
+    assert len(subtitles) == 1
+    assert subtitles[0].is_valid()
+
+    # the async provider also works with the synchronous pool
+    with ProviderPool(['podnapisi']) as sync_pool:
+        assert len(sync_pool.list_subtitles(video, languages)) == 1
+
+
+def test_async_provider_sync_interface_loop() -> None:
+    loops: list[asyncio.AbstractEventLoop] = []
+
+    class LoopProvider(AsyncProvider):
+        async def async_initialize(self) -> None:
+            loops.append(asyncio.get_running_loop())
+
+        async def async_terminate(self) -> None:
+            loops.append(asyncio.get_running_loop())
+
+        async def async_list_subtitles(self, video: Video, languages: Set[Language]) -> list[Subtitle]:
+            loops.append(asyncio.get_running_loop())
+            return []
+
+    provider = LoopProvider()
+    provider.initialize()
+    provider.list_subtitles(Mock(), set())
+
+    # the synchronous interface can be called from a running event loop
+    async def run() -> list[Subtitle]:
+        return provider.list_subtitles(Mock(), set())
+
+    asyncio.run(run())
+    provider.terminate()
+
+    # the coroutines all ran in the same loop, closed by terminate
+    assert len(loops) == 4
+    assert len(set(loops)) == 1
+    assert loops[0].is_closed()
+    assert provider._loop is None
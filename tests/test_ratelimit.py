@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from subliminal.ratelimit import RateLimiter
+
+# Core test
+pytestmark = pytest.mark.core
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+def test_rate_limiter_disabled() -> None:
+    limiter = RateLimiter()
+    assert not limiter.enabled
+    for _ in range(100):
+        with limiter:
+            pass
+
+
+def test_rate_limiter_rate() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(rate_limit=2, clock=clock.time, sleep=clock.sleep)
+    assert limiter.enabled
+
+    for _ in range(5):
+        with limiter:
+            pass
+
+    # the first request is free, then one request every 0.5s
+    assert clock.now == pytest.approx(2)
+    assert len(clock.sleeps) == 4
+
+
+def test_rate_limiter_burst() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(rate_limit=1, rate_burst=3, clock=clock.time, sleep=clock.sleep)
+
+    for _ in range(3):
+        limiter.acquire()
+    assert clock.sleeps == []
+
+    limiter.acquire()
+    assert clock.now == pytest.approx(1)
+
+    # the bucket is refilled after some inactivity, up to the burst
+    clock.now += 10
+    for _ in range(3):
+        limiter.acquire()
+    assert clock.now == pytest.approx(11)
+
+
+def test_rate_limiter_max_concurrency() -> None:
+    limiter = RateLimiter(max_concurrency=2)
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def request() -> None:
+        nonlocal running, max_running
+        with limiter:
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+
+    threads = [threading.Thread(target=request) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max_running == 2
+
+
+def test_rate_limiter_async() -> None:
+    clock = FakeClock()
+    async_sleeps: list[float] = []
+
+    async def async_sleep(delay: float) -> None:
+        async_sleeps.append(delay)
+        clock.now += delay
+        await asyncio.sleep(0)
+
+    limiter = RateLimiter(rate_limit=2, rate_burst=3, max_concurrency=2, clock=clock.time, async_sleep=async_sleep)
+    running = 0
+    max_running = 0
+
+    async def call() -> None:
+        nonlocal running, max_running
+        async with limiter:
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0)
+            running -= 1
+
+    async def run() -> None:
+        await asyncio.gather(*(call() for _ in range(5)))
+
+    asyncio.run(run())
+
+    # the first 3 calls are free, then one call every 0.5s, without blocking the event loop
+    assert clock.now == pytest.approx(1)
+    assert async_sleeps
+    assert clock.sleeps == []
+    assert max_running == 2
+
+
+def test_rate_limiter_from_options() -> None:
+    limiter = RateLimiter.from_options({'rate_limit': '0.5', 'rate_burst': None, 'max_concurrency': 3, 'other': 1})
+    assert limiter.rate_limit == 0.5
+    assert limiter.rate_burst == 1
+    assert limiter.max_concurrency == 3
+
+
+@pytest.mark.parametrize('options', [{'rate_limit': 0}, {'max_concurrency': -1}])
+def test_rate_limiter_invalid(options: dict[str, int]) -> None:
+    with pytest.raises(ValueError):  # noqa: PT011
+        RateLimiter(**options)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import datetime
+import os
+from types import SimpleNamespace
 from typing import TYPE_CHECKING, Any, Callable
 from xmlrpc.client import ProtocolError
 
@@ -17,6 +19,7 @@ from subliminal.utils import (
     get_argument_doc,
     get_extend_and_ignore_union,
     get_parameters_from_signature,
+    get_stat_age,
     handle_exception,
     matches_extended_title,
     merge_extend_and_ignore_unions,
@@ -89,36 +92,48 @@ def test_get_creation_date(tmp_path: Path) -> None:
     assert abs((cdate - NOW).total_seconds()) < 2
 
 
-def test_get_age(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_get_age(tmp_path: Path) -> None:
     NOW = datetime.datetime.now(datetime.timezone.utc)
+    p = tmp_path / 'test.txt'
+    p.write_text('content', encoding='utf-8')
+    ts = (NOW - datetime.timedelta(weeks=2)).timestamp()
+    os.utime(p, (ts, ts))
 
-    # mock file age
-    def mock_modification_date(filepath: str, **kwargs: Any) -> float:
-        return (NOW - datetime.timedelta(weeks=2)).timestamp()
+    age = get_age(p, use_ctime=False, reference_date=NOW)
+    assert abs(age - datetime.timedelta(weeks=2)) < datetime.timedelta(seconds=1)
 
-    def mock_creation_date_later(*args: Any) -> float:
-        return (NOW - datetime.timedelta(weeks=1)).timestamp()
+    not_file_age = get_age(tmp_path / 'not-a-file.txt', reference_date=NOW)
+    assert not_file_age == datetime.timedelta()
 
-    def mock_creation_date_sooner(*args: Any) -> float:
-        return (NOW - datetime.timedelta(weeks=3)).timestamp()
 
-    monkeypatch.setattr('subliminal.utils.modification_date', mock_modification_date)
-    monkeypatch.setattr('subliminal.utils.creation_date', mock_creation_date_later)
+def test_get_stat_age(tmp_path: Path) -> None:
+    NOW = datetime.datetime.now(datetime.timezone.utc)
+    p = tmp_path / 'test.txt'
+    p.write_text('content', encoding='utf-8')
+    ts = (NOW - datetime.timedelta(weeks=2)).timestamp()
+    os.utime(p, (ts, ts))
 
-    age = get_age(__file__, use_ctime=False, reference_date=NOW)
-    assert age == datetime.timedelta(weeks=2)
+    age = get_stat_age(p.stat(), reference_date=NOW)
+    assert abs(age - datetime.timedelta(weeks=2)) < datetime.timedelta(seconds=1)
+    assert get_stat_age(p.stat(), reference_date=NOW) == get_age(p, reference_date=NOW)
 
-    c_age = get_age(__file__, use_ctime=True, reference_date=NOW)
-    assert c_age == datetime.timedelta(weeks=1)
 
-    not_file_age = get_age('not-a-file.txt', reference_date=NOW)
-    assert not_file_age == datetime.timedelta()
+def test_get_stat_age_ctime() -> None:
+    NOW = datetime.datetime.now(datetime.timezone.utc)
 
-    # creation sooner
-    monkeypatch.setattr('subliminal.utils.creation_date', mock_creation_date_sooner)
+    def mock_stat(creation: datetime.timedelta) -> Any:
+        ctime = (NOW - creation).timestamp()
+        mtime = (NOW - datetime.timedelta(weeks=2)).timestamp()
+        return SimpleNamespace(st_mtime=mtime, st_ctime=ctime, st_birthtime=ctime)
 
-    c_age_2 = get_age(__file__, use_ctime=True, reference_date=NOW)
-    assert c_age_2 == datetime.timedelta(weeks=2)
+    # creation later
+    stat = mock_stat(datetime.timedelta(weeks=1))
+    assert get_stat_age(stat, use_ctime=False, reference_date=NOW) == datetime.timedelta(weeks=2)
+    assert get_stat_age(stat, use_ctime=True, reference_date=NOW) == datetime.timedelta(weeks=1)
+
+    # creation sooner
+    stat = mock_stat(datetime.timedelta(weeks=3))
+    assert get_stat_age(stat, use_ctime=True, reference_date=NOW) == datetime.timedelta(weeks=2)
 
 
 @pytest.mark.parametrize(
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import os
+import sys
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from subliminal.watch import InotifyBackend, PollingBackend, VideoWatcher, is_watched_file
+from tests.conftest import ensure
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Core test
+pytestmark = pytest.mark.core
+
+video_name = 'The.Big.Bang.Theory.S05E18.HDTV.x264-LOL.mp4'
+
+
+def poll_until(watcher: VideoWatcher, duration: float) -> list[str]:
+    completed = []
+    end = time.monotonic() + duration
+    while time.monotonic() < end:
+        completed.extend(watcher.poll(0.05))
+    return completed
+
+
+@pytest.mark.parametrize(
+    ('filename', 'archives', 'expected'),
+    [
+        (video_name, True, True),
+        ('video.rar', True, True),
+        ('video.rar', False, False),
+        ('video.en.srt', True, False),
+        ('.hidden.mkv', True, False),
+        ('Sample.mkv', True, False),
+    ],
+)
+def test_is_watched_file(filename: str, archives: bool, expected: bool) -> None:
+    assert is_watched_file(filename, archives=archives) is expected
+
+
+def test_video_watcher_not_a_directory(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match='Path is not a directory'):
+        VideoWatcher([ensure(tmp_path / video_name)])
+
+
+@pytest.mark.parametrize('polling', [True, False])
+def test_video_watcher(tmp_path: Path, polling: bool) -> None:
+    if not polling and not sys.platform.startswith('linux'):
+        pytest.skip('inotify is only available on Linux')
+
+    ensure(tmp_path / 'existing.mkv').write_bytes(b'video')
+
+    with VideoWatcher([tmp_path], settle=0.2, interval=0.05, polling=polling) as watcher:
+        assert isinstance(watcher.backend, PollingBackend if polling else InotifyBackend)
+
+        # new files in a new directory, the subtitles are not watched
+        ensure(tmp_path / 'Season 05' / video_name).write_bytes(b'video')
+        ensure(tmp_path / 'Season 05' / 'video.en.srt').write_bytes(b'subtitle')
+        completed = poll_until(watcher, 1)
+
+    # the existing files are ignored
+    assert completed == [os.path.join(tmp_path, 'Season 05', video_name)]
+
+
+def test_video_watcher_settle(tmp_path: Path) -> None:
+    path = tmp_path / video_name
+
+    with VideoWatcher([tmp_path], settle=0.3, interval=0.05, polling=True) as watcher:
+        # the file is not reported while it is written
+        with path.open('wb') as f:
+            for _ in range(5):
+                f.write(b'video')
+                f.flush()
+                assert poll_until(watcher, 0.1) == []
+
+        assert poll_until(watcher, 1) == [os.fspath(path)]
+
+        # the file is reported once
+        assert poll_until(watcher, 0.5) == []
+
+
+def test_video_watcher_settle_after_read(tmp_path: Path) -> None:
+    path = ensure(tmp_path / video_name)
+    path.write_bytes(b'video')
+
+    class SlowBackend:
+        def read(self, timeout: float | None) -> set[str]:
+            # the change is only read after waiting longer than the settle time
+            time.sleep(0.3)
+            return {os.fspath(path)}
+
+        def close(self) -> None:
+            pass
+
+    with VideoWatcher([tmp_path], settle=0.2, polling=True) as watcher:
+        watcher.backend.close()
+        watcher.backend = SlowBackend()  # type: ignore[assignment]
+
+        # the settle time starts when the change is read
+        assert watcher.poll(0) == []
+        time.sleep(0.25)
+        assert watcher._settled() == [os.fspath(path)]